@@ -34,7 +34,7 @@ if /i "%choice%"=="y" (
 echo.
 echo [3/3] Installation Instructions:
 echo.
-echo 1. Download Python 3.8 or higher
+echo 1. Download Python 3.11 or higher
 echo 2. Run the installer
 echo 3. CHECK "Add Python to PATH" ✅
 echo 4. Click "Install Now"
@@ -208,8 +208,8 @@ class TelegramConfig:
         # "market_updates": -1234567906,
     }
     
-    # Auto-generate channel IDs from TELEGRAM_GROUPS dictionary
-    TELEGRAM_SIGNAL_CHANNEL_IDS = list(TELEGRAM_GROUPS.values())
+    # Auto-generate channel IDs from TELEGRAM_GROUPS dictionary (kept in sync in place)
+    TELEGRAM_SIGNAL_CHANNEL_IDS = set(TELEGRAM_GROUPS.values())
     
     @classmethod
     def add_telegram_group(cls, name: str, group_id: int):
@@ -219,9 +219,20 @@ class TelegramConfig:
         Usage:
         TelegramConfig.add_telegram_group("new_group", -1234567890)
         """
+        replaced = name in cls.TELEGRAM_GROUPS
         cls.TELEGRAM_GROUPS[name] = group_id
-        cls.TELEGRAM_SIGNAL_CHANNEL_IDS = list(cls.TELEGRAM_GROUPS.values())
+        if replaced:
+            # The old ID may still belong to another alias
+            cls.sync_signal_channel_ids()
+        else:
+            cls.TELEGRAM_SIGNAL_CHANNEL_IDS.add(group_id)
         print(f"✅ Added Telegram group: {name} ({group_id})")
+    
+    @classmethod
+    def sync_signal_channel_ids(cls):
+        """Rebuild TELEGRAM_SIGNAL_CHANNEL_IDS in place from TELEGRAM_GROUPS."""
+        cls.TELEGRAM_SIGNAL_CHANNEL_IDS.clear()
+        cls.TELEGRAM_SIGNAL_CHANNEL_IDS.update(cls.TELEGRAM_GROUPS.values())
         
     @classmethod
     def get_group_name(cls, group_id: int) -> str:
@@ -4,10 +4,38 @@ Dynamic Strategy Control System.
 Handles per-group, per-symbol, per-timeframe strategy overrides.
 """
 
+import functools
 from typing import Dict, Any, Optional
 from config.settings import STRATEGY_OVERRIDES, OverrideConfig
 from utils.logger import log_event
 
+# Strategies that can be overridden per group/symbol/timeframe
+_STRATEGIES = (
+    "ENABLE_TP",
+    "ENABLE_SL",
+    "ENABLE_TRAILING_STOP",
+    "ENABLE_BREAK_EVEN",
+    "ENABLE_REENTRY",
+    "ENABLE_PYRAMIDING"
+)
+
+_FLAT_OVERRIDES: Dict[tuple, bool] = {}  # (group, symbol, timeframe, strategy) -> enabled
+_OVERRIDE_GROUPS = set()  # Groups with at least one override configured
+_STATUS_LABELS = {True: "ENABLED", False: "DISABLED"}  # Override value -> log label
+
+def _build_flat_overrides():
+    """Flatten STRATEGY_OVERRIDES into a single-level dict."""
+    _FLAT_OVERRIDES.clear()
+    _OVERRIDE_GROUPS.clear()
+    for group, group_overrides in STRATEGY_OVERRIDES.items():
+        for symbol, symbol_overrides in group_overrides.items():
+            for timeframe, timeframe_overrides in symbol_overrides.items():
+                for strategy, value in timeframe_overrides.items():
+                    _FLAT_OVERRIDES[(group, symbol, timeframe, strategy)] = value
+                    _OVERRIDE_GROUPS.add(group)
+
+_build_flat_overrides()
+
 def is_strategy_enabled(
     strategy: str, 
     symbol: str, 
@@ -17,6 +45,9 @@ def is_strategy_enabled(
     """
     Check if a specific strategy is enabled for the given parameters.
     
+    Override lookups are cached per argument combination; call
+    clear_strategy_cache() after changing STRATEGY_OVERRIDES at runtime.
+    
     Args:
         strategy: Strategy name (e.g., "ENABLE_TP", "ENABLE_SL", "ENABLE_REENTRY")
         symbol: Trading symbol (e.g., "BTCUSDT", "ETHUSDT")
@@ -27,7 +58,7 @@ def is_strategy_enabled(
         bool: True if strategy is enabled, False otherwise
     """
     try:
-        # Get the default value from OverrideConfig
+        # Get the default value from OverrideConfig (read live, /override toggles it at runtime)
         default_value = getattr(OverrideConfig, strategy, True)
         
         # Check for specific override
@@ -35,7 +66,7 @@ def is_strategy_enabled(
         
         if override_value is not None:
             # Log the override
-            status = "ENABLED" if override_value else "DISABLED"
+            status = _STATUS_LABELS[bool(override_value)]
             log_event(
                 f"[StrategyOverride] {status}: {strategy} for {symbol} "
                 f"(group={group}, tf={timeframe})",
@@ -51,6 +82,7 @@ def is_strategy_enabled(
         # Return True as safe default
         return True
 
+@functools.lru_cache(maxsize=4096)
 def _get_strategy_override(
     strategy: str, 
     symbol: str, 
@@ -70,43 +102,20 @@ def _get_strategy_override(
         Optional[bool]: Override value if found, None otherwise
     """
     try:
-        # Check if group exists in overrides
-        if group not in STRATEGY_OVERRIDES:
+        # Unknown groups have nothing to probe
+        if group not in _OVERRIDE_GROUPS:
             return None
         
-        group_overrides = STRATEGY_OVERRIDES[group]
-        
-        # Check for symbol-specific overrides
-        if symbol in group_overrides:
-            symbol_overrides = group_overrides[symbol]
-            
-            # Check for timeframe-specific override
-            if timeframe in symbol_overrides:
-                timeframe_overrides = symbol_overrides[timeframe]
-                if strategy in timeframe_overrides:
-                    return timeframe_overrides[strategy]
-            
-            # Check for default timeframe override
-            if "default" in symbol_overrides:
-                default_overrides = symbol_overrides["default"]
-                if strategy in default_overrides:
-                    return default_overrides[strategy]
-        
-        # Check for default symbol override
-        if "default" in group_overrides:
-            default_symbol_overrides = group_overrides["default"]
-            
-            # Check for timeframe-specific override in default symbol
-            if timeframe in default_symbol_overrides:
-                default_timeframe_overrides = default_symbol_overrides[timeframe]
-                if strategy in default_timeframe_overrides:
-                    return default_timeframe_overrides[strategy]
-            
-            # Check for default timeframe in default symbol
-            if "default" in default_symbol_overrides:
-                default_overrides = default_symbol_overrides["default"]
-                if strategy in default_overrides:
-                    return default_overrides[strategy]
+        # Most specific match wins: symbol/timeframe, symbol/default,
+        # default/timeframe, then default/default
+        for key in (
+            (group, symbol, timeframe, strategy),
+            (group, symbol, "default", strategy),
+            (group, "default", timeframe, strategy),
+            (group, "default", "default", strategy)
+        ):
+            if key in _FLAT_OVERRIDES:
+                return _FLAT_OVERRIDES[key]
         
         return None
         
@@ -130,17 +139,8 @@ def get_all_strategy_overrides(
     Returns:
         Dict[str, bool]: Dictionary of strategy names and their enabled status
     """
-    strategies = [
-        "ENABLE_TP",
-        "ENABLE_SL", 
-        "ENABLE_TRAILING_STOP",
-        "ENABLE_BREAK_EVEN",
-        "ENABLE_REENTRY",
-        "ENABLE_PYRAMIDING"
-    ]
-    
     overrides = {}
-    for strategy in strategies:
+    for strategy in _STRATEGIES:
         overrides[strategy] = is_strategy_enabled(strategy, symbol, group, timeframe)
     
     return overrides
@@ -238,16 +238,7 @@ def get_override_hierarchy(
         "applied_from": {}
     }
     
-    strategies = [
-        "ENABLE_TP",
-        "ENABLE_SL", 
-        "ENABLE_TRAILING_STOP",
-        "ENABLE_BREAK_EVEN",
-        "ENABLE_REENTRY",
-        "ENABLE_PYRAMIDING"
-    ]
-    
-    for strategy in strategies:
+    for strategy in _STRATEGIES:
         # Get the override value and track where it came from
         override_value = _get_strategy_override(strategy, symbol, group, timeframe)
         default_value = getattr(OverrideConfig, strategy, True)
@@ -259,4 +250,10 @@ def get_override_hierarchy(
             hierarchy["overrides"][strategy] = default_value
             hierarchy["applied_from"][strategy] = "default"
     
-    return hierarchy 
\ No newline at end of file
+    return hierarchy
+
+def clear_strategy_cache():
+    """Rebuild the flattened overrides and drop cached lookups after STRATEGY_OVERRIDES changes at runtime."""
+    _build_flat_overrides()
+    _get_strategy_override.cache_clear()
+ 
\ No newline at end of file
@@ -437,6 +437,10 @@ async def get_current_price_async(symbol: str) -> float:
     """Async version of current price fetching."""
     return await default_api.get_current_price(symbol)
 
+async def get_current_prices_async(symbols: list) -> Dict[str, float]:
+    """Fetch current prices for several symbols in one request."""
+    return await default_api.get_current_prices(symbols)
+
 def get_current_price_sync(symbol: str) -> float:
     """Synchronous wrapper for current price fetching."""
     try:
@@ -4,18 +4,21 @@ Break-even manager for moving stop-loss to break-even after TP2 or profit thresh
 """
 
 import asyncio
-from typing import Dict, Optional, Tuple
-from core.api import get_current_price_async, place_stop_loss_order, cancel_order
+from typing import Dict, Optional
+from core.api import place_stop_loss_order, cancel_order
 from core.exchange_api import OrderResult
-from config.settings import TradingConfig
+from core.sl_manager_base import SLManagerBase, PriceCache, sl_price_cache
 
-class BreakEvenManager:
+class BreakEvenManager(SLManagerBase):
     """Manages break-even logic for active trades."""
     
-    def __init__(self):
-        self.active_trades = {}  # symbol -> trade_info
-        self.breakeven_threshold = TradingConfig.BREAKEVEN_THRESHOLD  # Default 2% profit
-        self.breakeven_buffer = TradingConfig.BREAKEVEN_BUFFER  # Default 0.1% buffer
+    condition_key = "breakeven"
+    condition_label = "Break-even"
+    
+    def __init__(self, price_cache: Optional[PriceCache] = None):
+        super().__init__(poll_interval=5, price_cache=price_cache)
+        self.breakeven_threshold = self._cfg.breakeven_threshold  # Default 2% profit
+        self.breakeven_buffer = self._cfg.breakeven_buffer  # Default 0.1% buffer
     
     async def register_trade(self, symbol: str, side: str, entry_price: float, 
                            sl_price: float, tp_prices: list, order_ids: list) -> None:
@@ -33,6 +36,10 @@ class BreakEvenManager:
             "status": "active"
         }
         self.active_trades[symbol] = trade_info
+        # Price at which the profit threshold is reached, stored with TP2 in the columns
+        trigger_price = self._trigger_price(entry_price, trade_info["side"], self.breakeven_threshold)
+        self._set_row(symbol, trade_info["side"], trigger_price, tp_prices)
+        self._wake.set()
         print(f"📊 Break-even monitoring started for {symbol}")
     
     async def check_breakeven_conditions(self, symbol: str) -> bool:
@@ -45,39 +52,35 @@ class BreakEvenManager:
             return False
         
         try:
-            current_price = await get_current_price_async(symbol)
-            entry_price = trade["entry_price"]
-            side = trade["side"]
-            
-            # Calculate current profit percentage
-            if side == "buy":
-                profit_pct = (current_price - entry_price) / entry_price * 100
-            else:  # sell
-                profit_pct = (entry_price - current_price) / entry_price * 100
-            
-            # Check if TP2 is hit (if we have TP2)
-            tp2_hit = False
-            if len(trade["tp_prices"]) >= 2:
-                tp2 = trade["tp_prices"][1]  # Second TP
-                if side == "buy" and current_price >= tp2:
-                    tp2_hit = True
-                elif side == "sell" and current_price <= tp2:
-                    tp2_hit = True
-            
-            # Break-even if TP2 hit OR profit threshold reached
-            if tp2_hit or profit_pct >= self.breakeven_threshold:
-                print(f"🎯 Break-even conditions met for {symbol}:")
-                print(f"   Current Price: ${current_price:,.2f}")
-                print(f"   Entry Price: ${entry_price:,.2f}")
-                print(f"   Profit: {profit_pct:.2f}%")
-                print(f"   TP2 Hit: {tp2_hit}")
-                return True
+            current_price = await self._get_price(symbol)
+            return self._conditions_met({symbol: current_price})[symbol]
             
+        except Exception as e:
+            print(f"❌ Error checking break-even for {symbol}: {e}")
             return False
+    
+    async def check_all(self) -> Dict[str, bool]:
+        """Check break-even conditions for every active trade with one price request."""
+        symbols = [symbol for symbol, trade in self.active_trades.items()
+                   if trade["status"] == "active" and not trade["breakeven_triggered"]]
+        if not symbols:
+            return {}
+        
+        try:
+            prices = await self._get_prices(symbols)
+            # Threshold and TP2 checks for every priced trade in one pass over the columns
+            return self._conditions_met(prices)
             
         except Exception as e:
-            print(f"❌ Error checking break-even for {symbol}: {e}")
+            print(f"❌ Error checking break-even for {len(symbols)} trades: {e}")
+            return {}
+    
+    def _evaluate(self, symbol: str, current_price: Optional[float]) -> bool:
+        """Evaluate break-even for a registered, not yet triggered trade."""
+        trade = self.active_trades.get(symbol)
+        if trade is None or trade["breakeven_triggered"] or current_price is None:
             return False
+        return self._conditions_met({symbol: current_price})[symbol]
     
     async def move_to_breakeven(self, symbol: str) -> bool:
         """Move stop-loss to break-even level."""
@@ -135,24 +138,18 @@ class BreakEvenManager:
         """Main monitoring loop for break-even conditions."""
         while True:
             try:
-                for symbol in list(self.active_trades.keys()):
-                    trade = self.active_trades[symbol]
-                    if trade["status"] != "active":
-                        continue
-                    
-                    # Check if break-even conditions are met
-                    if await self.check_breakeven_conditions(symbol):
+                # Check break-even conditions for all active trades at once
+                for symbol, conditions_met in (await self.check_all()).items():
+                    if conditions_met:
                         await self.move_to_breakeven(symbol)
                 
-                await asyncio.sleep(5)  # Check every 5 seconds
+                # Block until a trade is registered or another manager fetches its prices,
+                # re-checking every poll_interval while trades are active
+                await self._wait_for_wake(self.poll_interval if self._has_active_trades() else None)
                 
             except Exception as e:
                 print(f"❌ Error in break-even monitoring: {e}")
-                await asyncio.sleep(10)
-    
-    def get_trade_status(self, symbol: str) -> Optional[Dict]:
-        """Get current status of a trade."""
-        return self.active_trades.get(symbol)
+                await self._wait_for_wake(10)
     
     def close_trade(self, symbol: str) -> None:
         """Close a trade and remove from monitoring."""
@@ -160,8 +157,8 @@ class BreakEvenManager:
             self.active_trades[symbol]["status"] = "closed"
             print(f"📊 Break-even monitoring stopped for {symbol}")
 
-# Global instance
-breakeven_manager = BreakEvenManager()
+# Global instance, sharing fetched prices with the other SL manager
+breakeven_manager = BreakEvenManager(price_cache=sl_price_cache)
 
 # Test function
 async def test_breakeven_logic():
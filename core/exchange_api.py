@@ -179,17 +179,11 @@ class ExchangeAPI:
         
         if method_name == "fetch_ticker":
             symbol = args[0] if args else "BTCUSDT"
-            base_price = {"BTCUSDT": 67000, "ETHUSDT": 3800, "SOLUSDT": 180}.get(symbol, 50000)
-            return {
-                'symbol': symbol,
-                'last': base_price + (time.time() % 100 - 50),  # Simulate price movement
-                'bid': base_price - 1,
-                'ask': base_price + 1,
-                'high': base_price + 500,
-                'low': base_price - 500,
-                'volume': 1000000,
-                'timestamp': int(time.time() * 1000)
-            }
+            return self._mock_ticker(symbol)
+        
+        elif method_name == "fetch_tickers":
+            symbols = args[0] if args else ["BTCUSDT"]
+            return {symbol: self._mock_ticker(symbol) for symbol in symbols}
         
         elif method_name == "fetch_balance":
             return {
@@ -228,6 +222,20 @@ class ExchangeAPI:
         
         return {'status': 'mock', 'method': method_name, 'args': args, 'kwargs': kwargs}
     
+    def _mock_ticker(self, symbol: str) -> Dict[str, Any]:
+        """Build a mock ticker with simulated price movement."""
+        base_price = {"BTCUSDT": 67000, "ETHUSDT": 3800, "SOLUSDT": 180}.get(symbol, 50000)
+        return {
+            'symbol': symbol,
+            'last': base_price + (time.time() % 100 - 50),  # Simulate price movement
+            'bid': base_price - 1,
+            'ask': base_price + 1,
+            'high': base_price + 500,
+            'low': base_price - 500,
+            'volume': 1000000,
+            'timestamp': int(time.time() * 1000)
+        }
+    
     async def get_current_price(self, symbol: str) -> float:
         """Fetch current price for a symbol."""
         try:
@@ -240,6 +248,15 @@ class ExchangeAPI:
             await send_telegram_log(f"⚠️ Price fetch failed for {symbol}: {e}")
             return None
     
+    async def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Fetch current prices for several symbols with a single ticker request."""
+        try:
+            tickers = await self._execute_with_retry(self.exchange.fetch_tickers, symbols)
+            return {symbol: tickers[symbol]['last'] for symbol in symbols if symbol in tickers}
+        except Exception as e:
+            print(f"❌ Failed to get prices for {', '.join(symbols)}: {e}")
+            return {}
+    
     async def get_balance(self, currency: str = None) -> Dict[str, Dict[str, float]]:
         """Fetch account balance."""
         try:
@@ -5,17 +5,27 @@ Tracks all activities and generates detailed reports.
 """
 
 import asyncio
+import atexit
+import itertools
 import json
 import sqlite3
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fallback to stdlib json when orjson is not installed
+
 from config.settings import TradingConfig
+from core.storage_worker import StorageWorker
 from utils.telegram_logger import send_telegram_log
 from utils.logger import log_event
+from utils.time import get_timestamp_ns
 
 @dataclass
 class TradeRecord:
@@ -62,6 +72,32 @@ class ErrorRecord:
     context: Dict[str, Any]
     severity: str  # 'low', 'medium', 'high', 'critical'
 
+# Column order of each table; row tuples are built in this order
+TRADE_COLUMNS = (
+    'id', 'symbol', 'side', 'quantity', 'entry_price', 'exit_price', 'sl_price',
+    'tp_prices', 'order_ids', 'group_name', 'signal_source', 'entry_time', 'exit_time',
+    'pnl', 'pnl_percentage', 'status', 'close_reason', 'processing_time', 'admin_command'
+)
+SIGNAL_COLUMNS = (
+    'id', 'group_name', 'signal_text', 'parsed_data', 'processing_time',
+    'timestamp', 'status', 'error_message'
+)
+ERROR_COLUMNS = ('id', 'error_type', 'error_message', 'timestamp', 'context', 'severity')
+
+def _insert_sql(table: str, columns: tuple) -> str:
+    """Build a parameterized INSERT statement for the given columns."""
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+
+INSERT_TRADE_SQL = _insert_sql('trades', TRADE_COLUMNS)
+INSERT_SIGNAL_SQL = _insert_sql('signals', SIGNAL_COLUMNS)
+INSERT_ERROR_SQL = _insert_sql('errors', ERROR_COLUMNS)
+
+# Per-process sequence appended to record ids, so ids stay unique when the clock is coarse
+_record_seq = itertools.count()
+
+# Dollar formatter with the format spec parsed once, reused by every summary line
+usd = "${:,.2f}".format
+
 class ReportingSystem:
     """Comprehensive reporting and logging system."""
     
@@ -70,9 +106,18 @@ class ReportingSystem:
         self.reports_dir = Path("reports")
         self.reports_dir.mkdir(exist_ok=True)
         
+        # Long-lived connection for schema setup and report queries, shared
+        # across threads behind a re-entrant lock
+        self.conn = self._connect()
+        self.conn_lock = threading.RLock()
+        
         # Initialize database
         self.init_database()
         
+        # Inserts are committed on a background thread with its own connection
+        self.storage_worker = StorageWorker(self._connect)
+        atexit.register(self.storage_worker.stop)
+        
         # Statistics tracking
         self.daily_stats = {
             'trades_executed': 0,
@@ -86,14 +131,29 @@ class ReportingSystem:
         # Group statistics
         self.group_stats = {}
         
+        # Rows committed by this process, per table
+        self._counts = {'trades': 0, 'signals': 0, 'errors': 0}
+        
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database connection and apply pragma tuning."""
+        # Create data directory if it doesn't exist
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        
+        # WAL lets readers run alongside the writer; NORMAL drops the
+        # per-commit fsync that the default rollback journal needs
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA busy_timeout=5000")
+        
+        return conn
+    
     def init_database(self):
         """Initialize SQLite database for storing reports."""
         try:
-            # Create data directory if it doesn't exist
-            os.makedirs("data", exist_ok=True)
-            
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = self.conn.cursor()
             
             # Create trades table
             cursor.execute('''
@@ -146,215 +206,306 @@ class ReportingSystem:
                 )
             ''')
             
-            conn.commit()
-            conn.close()
+            self.conn.commit()
             
             log_event("✅ Database initialized successfully", "INFO")
             
         except Exception as e:
             log_event(f"❌ Database initialization failed: {e}", "ERROR")
     
+    def _build_trade_record(self, trade_data: Dict[str, Any]) -> TradeRecord:
+        """Build a trade record from raw trade data."""
+        trade_id = f"trade_{get_timestamp_ns()}_{next(_record_seq)}_{trade_data.get('symbol', 'UNKNOWN')}"
+        
+        return TradeRecord(
+            id=trade_id,
+            symbol=trade_data.get('symbol', ''),
+            side=trade_data.get('side', ''),
+            quantity=trade_data.get('quantity', 0.0),
+            entry_price=trade_data.get('entry_price', 0.0),
+            exit_price=trade_data.get('exit_price'),
+            sl_price=trade_data.get('sl_price'),
+            tp_prices=trade_data.get('tp_prices', []),
+            order_ids=trade_data.get('order_ids', []),
+            group_name=trade_data.get('group_name', ''),
+            signal_source=trade_data.get('signal_source', ''),
+            entry_time=datetime.now(),
+            exit_time=None,
+            pnl=None,
+            pnl_percentage=None,
+            status='open',
+            close_reason=None,
+            processing_time=trade_data.get('processing_time', 0.0),
+            admin_command=trade_data.get('admin_command', False)
+        )
+    
+    def _build_signal_record(self, signal_data: Dict[str, Any]) -> SignalRecord:
+        """Build a signal record from raw signal data."""
+        signal_id = f"signal_{get_timestamp_ns()}_{next(_record_seq)}_{signal_data.get('group_name', 'UNKNOWN')}"
+        
+        return SignalRecord(
+            id=signal_id,
+            group_name=signal_data.get('group_name', ''),
+            signal_text=signal_data.get('signal_text', ''),
+            parsed_data=signal_data.get('parsed_data', {}),
+            processing_time=signal_data.get('processing_time', 0.0),
+            timestamp=datetime.now(),
+            status=signal_data.get('status', 'processed'),
+            error_message=signal_data.get('error_message')
+        )
+    
+    def _build_error_record(self, error_data: Dict[str, Any]) -> ErrorRecord:
+        """Build an error record from raw error data."""
+        error_id = f"error_{get_timestamp_ns()}_{next(_record_seq)}_{error_data.get('error_type', 'UNKNOWN')}"
+        
+        return ErrorRecord(
+            id=error_id,
+            error_type=error_data.get('error_type', ''),
+            error_message=error_data.get('error_message', ''),
+            timestamp=datetime.now(),
+            context=error_data.get('context', {}),
+            severity=error_data.get('severity', 'medium')
+        )
+    
     async def log_trade(self, trade_data: Dict[str, Any]) -> str:
         """Log a trade execution."""
+        trade_ids = await self.log_trades_bulk([trade_data])
+        return trade_ids[0] if trade_ids else ""
+    
+    async def log_trades_bulk(self, trades: List[Dict[str, Any]]) -> List[str]:
+        """Log several trade executions in a single database transaction."""
         try:
-            trade_id = f"trade_{int(datetime.now().timestamp())}_{trade_data.get('symbol', 'UNKNOWN')}"
-            
-            trade_record = TradeRecord(
-                id=trade_id,
-                symbol=trade_data.get('symbol', ''),
-                side=trade_data.get('side', ''),
-                quantity=trade_data.get('quantity', 0.0),
-                entry_price=trade_data.get('entry_price', 0.0),
-                exit_price=trade_data.get('exit_price'),
-                sl_price=trade_data.get('sl_price'),
-                tp_prices=trade_data.get('tp_prices', []),
-                order_ids=trade_data.get('order_ids', []),
-                group_name=trade_data.get('group_name', ''),
-                signal_source=trade_data.get('signal_source', ''),
-                entry_time=datetime.now(),
-                exit_time=None,
-                pnl=None,
-                pnl_percentage=None,
-                status='open',
-                close_reason=None,
-                processing_time=trade_data.get('processing_time', 0.0),
-                admin_command=trade_data.get('admin_command', False)
-            )
+            trade_records = [self._build_trade_record(trade_data) for trade_data in trades]
             
             # Save to database
-            await self.save_trade_record(trade_record)
-            
-            # Update statistics
-            self.daily_stats['trades_executed'] += 1
+            await self.save_trade_records(trade_records)
             
-            # Update group statistics
-            group_name = trade_record.group_name
-            if group_name not in self.group_stats:
-                self.group_stats[group_name] = {
-                    'trades': 0,
-                    'total_pnl': 0.0,
-                    'winning_trades': 0,
-                    'losing_trades': 0
-                }
-            self.group_stats[group_name]['trades'] += 1
-            
-            # Send Telegram notification
-            await self.send_trade_notification(trade_record)
-            
-            log_event(f"✅ Trade logged: {trade_id}", "INFO")
-            return trade_id
+            for trade_record in trade_records:
+                await self._trade_logged(trade_record)
             
+            return [trade_record.id for trade_record in trade_records]
+        
         except Exception as e:
-            log_event(f"❌ Failed to log trade: {e}", "ERROR")
-            return ""
+            log_event(f"❌ Failed to log trades: {e}", "ERROR")
+            return []
     
     async def log_signal(self, signal_data: Dict[str, Any]) -> str:
         """Log a signal received."""
+        signal_ids = await self.log_signals_bulk([signal_data])
+        return signal_ids[0] if signal_ids else ""
+    
+    async def log_signals_bulk(self, signals: List[Dict[str, Any]]) -> List[str]:
+        """Log several received signals in a single database transaction."""
         try:
-            signal_id = f"signal_{int(datetime.now().timestamp())}_{signal_data.get('group_name', 'UNKNOWN')}"
-            
-            signal_record = SignalRecord(
-                id=signal_id,
-                group_name=signal_data.get('group_name', ''),
-                signal_text=signal_data.get('signal_text', ''),
-                parsed_data=signal_data.get('parsed_data', {}),
-                processing_time=signal_data.get('processing_time', 0.0),
-                timestamp=datetime.now(),
-                status=signal_data.get('status', 'processed'),
-                error_message=signal_data.get('error_message')
-            )
+            signal_records = [self._build_signal_record(signal_data) for signal_data in signals]
             
             # Save to database
-            await self.save_signal_record(signal_record)
+            await self.save_signal_records(signal_records)
             
-            # Update statistics
-            self.daily_stats['signals_received'] += 1
-            
-            # Send Telegram notification for important signals
-            if signal_record.status == 'processed':
-                await self.send_signal_notification(signal_record)
-            
-            log_event(f"✅ Signal logged: {signal_id}", "INFO")
-            return signal_id
+            for signal_record in signal_records:
+                await self._signal_logged(signal_record)
             
+            return [signal_record.id for signal_record in signal_records]
+        
         except Exception as e:
-            log_event(f"❌ Failed to log signal: {e}", "ERROR")
-            return ""
+            log_event(f"❌ Failed to log signals: {e}", "ERROR")
+            return []
     
     async def log_error(self, error_data: Dict[str, Any]) -> str:
         """Log an error occurrence."""
+        error_ids = await self.log_errors_bulk([error_data])
+        return error_ids[0] if error_ids else ""
+    
+    async def log_errors_bulk(self, errors: List[Dict[str, Any]]) -> List[str]:
+        """Log several error occurrences in a single database transaction."""
         try:
-            error_id = f"error_{int(datetime.now().timestamp())}_{error_data.get('error_type', 'UNKNOWN')}"
-            
-            error_record = ErrorRecord(
-                id=error_id,
-                error_type=error_data.get('error_type', ''),
-                error_message=error_data.get('error_message', ''),
-                timestamp=datetime.now(),
-                context=error_data.get('context', {}),
-                severity=error_data.get('severity', 'medium')
-            )
+            error_records = [self._build_error_record(error_data) for error_data in errors]
             
             # Save to database
-            await self.save_error_record(error_record)
-            
-            # Update statistics
-            self.daily_stats['errors_occurred'] += 1
+            await self.save_error_records(error_records)
             
-            # Send Telegram notification for critical errors
-            if error_record.severity in ['high', 'critical']:
-                await self.send_error_notification(error_record)
-            
-            log_event(f"✅ Error logged: {error_id}", "INFO")
-            return error_id
+            for error_record in error_records:
+                await self._error_logged(error_record)
             
+            return [error_record.id for error_record in error_records]
+        
         except Exception as e:
-            log_event(f"❌ Failed to log error: {e}", "ERROR")
-            return ""
+            log_event(f"❌ Failed to log errors: {e}", "ERROR")
+            return []
     
-    async def save_trade_record(self, trade_record: TradeRecord):
-        """Save trade record to database."""
+    async def log_bulk(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Log a mixed batch of ('trade' | 'signal' | 'error', data) items in one transaction."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO trades VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                trade_record.id,
-                trade_record.symbol,
-                trade_record.side,
-                trade_record.quantity,
-                trade_record.entry_price,
-                trade_record.exit_price,
-                trade_record.sl_price,
-                json.dumps(trade_record.tp_prices),
-                json.dumps(trade_record.order_ids),
-                trade_record.group_name,
-                trade_record.signal_source,
-                trade_record.entry_time.isoformat(),
-                trade_record.exit_time.isoformat() if trade_record.exit_time else None,
-                trade_record.pnl,
-                trade_record.pnl_percentage,
-                trade_record.status,
-                trade_record.close_reason,
-                trade_record.processing_time,
-                1 if trade_record.admin_command else 0
-            ))
-            
-            conn.commit()
-            conn.close()
+            builders = {
+                'trade': self._build_trade_record,
+                'signal': self._build_signal_record,
+                'error': self._build_error_record
+            }
+            records = [(kind, builders[kind](data)) for kind, data in items]
+            
+            # Partition by table in a single pass
+            grouped = {'trade': [], 'signal': [], 'error': []}
+            for kind, record in records:
+                grouped[kind].append(record)
+            
+            # Save to database: one executemany per table, one commit overall
+            trade_rows = [self._trade_row(trade_record) for trade_record in grouped['trade']]
+            signal_rows = [self._signal_row(signal_record) for signal_record in grouped['signal']]
+            error_rows = [self._error_row(error_record) for error_record in grouped['error']]
+            await self.storage_worker.write_many([
+                (INSERT_TRADE_SQL, trade_rows),
+                (INSERT_SIGNAL_SQL, signal_rows),
+                (INSERT_ERROR_SQL, error_rows)
+            ])
+            self._counts['trades'] += len(trade_rows)
+            self._counts['signals'] += len(signal_rows)
+            self._counts['errors'] += len(error_rows)
+            
+            handlers = {
+                'trade': self._trade_logged,
+                'signal': self._signal_logged,
+                'error': self._error_logged
+            }
+            for kind, record in records:
+                await handlers[kind](record)
             
+            return [record.id for _, record in records]
+        
         except Exception as e:
-            log_event(f"❌ Failed to save trade record: {e}", "ERROR")
+            log_event(f"❌ Failed to log batch: {e}", "ERROR")
+            return []
+    
+    async def _trade_logged(self, trade_record: TradeRecord):
+        """Update statistics and notify after a trade is saved."""
+        # Update statistics
+        self.daily_stats['trades_executed'] += 1
+        
+        # Update group statistics
+        group_name = trade_record.group_name
+        if group_name not in self.group_stats:
+            self.group_stats[group_name] = {
+                'trades': 0,
+                'total_pnl': 0.0,
+                'winning_trades': 0,
+                'losing_trades': 0
+            }
+        self.group_stats[group_name]['trades'] += 1
+        
+        # Send Telegram notification
+        await self.send_trade_notification(trade_record)
+        
+        log_event(f"✅ Trade logged: {trade_record.id}", "INFO")
+    
+    async def _signal_logged(self, signal_record: SignalRecord):
+        """Update statistics and notify after a signal is saved."""
+        # Update statistics
+        self.daily_stats['signals_received'] += 1
+        
+        # Send Telegram notification for important signals
+        if signal_record.status == 'processed':
+            await self.send_signal_notification(signal_record)
+        
+        log_event(f"✅ Signal logged: {signal_record.id}", "INFO")
+    
+    async def _error_logged(self, error_record: ErrorRecord):
+        """Update statistics and notify after an error is saved."""
+        # Update statistics
+        self.daily_stats['errors_occurred'] += 1
+        
+        # Send Telegram notification for critical errors
+        if error_record.severity in ['high', 'critical']:
+            await self.send_error_notification(error_record)
+        
+        log_event(f"✅ Error logged: {error_record.id}", "INFO")
+    
+    def _trade_row(self, trade_record: TradeRecord) -> tuple:
+        """Convert a trade record to a row in TRADE_COLUMNS order."""
+        return (
+            trade_record.id,
+            trade_record.symbol,
+            trade_record.side,
+            trade_record.quantity,
+            trade_record.entry_price,
+            trade_record.exit_price,
+            trade_record.sl_price,
+            json.dumps(trade_record.tp_prices),
+            json.dumps(trade_record.order_ids),
+            trade_record.group_name,
+            trade_record.signal_source,
+            trade_record.entry_time.isoformat(),
+            trade_record.exit_time.isoformat() if trade_record.exit_time else None,
+            trade_record.pnl,
+            trade_record.pnl_percentage,
+            trade_record.status,
+            trade_record.close_reason,
+            trade_record.processing_time,
+            1 if trade_record.admin_command else 0
+        )
+    
+    def _signal_row(self, signal_record: SignalRecord) -> tuple:
+        """Convert a signal record to a row in SIGNAL_COLUMNS order."""
+        return (
+            signal_record.id,
+            signal_record.group_name,
+            signal_record.signal_text,
+            json.dumps(signal_record.parsed_data),
+            signal_record.processing_time,
+            signal_record.timestamp.isoformat(),
+            signal_record.status,
+            signal_record.error_message
+        )
+    
+    def _error_row(self, error_record: ErrorRecord) -> tuple:
+        """Convert an error record to a row in ERROR_COLUMNS order."""
+        return (
+            error_record.id,
+            error_record.error_type,
+            error_record.error_message,
+            error_record.timestamp.isoformat(),
+            json.dumps(error_record.context),
+            error_record.severity
+        )
+    
+    async def save_trade_record(self, trade_record: TradeRecord):
+        """Save trade record to database."""
+        await self.save_trade_records([trade_record])
+    
+    async def save_trade_records(self, trade_records: List[TradeRecord]):
+        """Save trade records to database in one transaction; write errors propagate to the caller."""
+        rows = [self._trade_row(trade_record) for trade_record in trade_records]
+        
+        await self.storage_worker.write(INSERT_TRADE_SQL, rows)
+        self._counts['trades'] += len(rows)
     
     async def save_signal_record(self, signal_record: SignalRecord):
         """Save signal record to database."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO signals VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                signal_record.id,
-                signal_record.group_name,
-                signal_record.signal_text,
-                json.dumps(signal_record.parsed_data),
-                signal_record.processing_time,
-                signal_record.timestamp.isoformat(),
-                signal_record.status,
-                signal_record.error_message
-            ))
-            
-            conn.commit()
-            conn.close()
-            
-        except Exception as e:
-            log_event(f"❌ Failed to save signal record: {e}", "ERROR")
+        await self.save_signal_records([signal_record])
+    
+    async def save_signal_records(self, signal_records: List[SignalRecord]):
+        """Save signal records to database in one transaction; write errors propagate to the caller."""
+        rows = [self._signal_row(signal_record) for signal_record in signal_records]
+        
+        await self.storage_worker.write(INSERT_SIGNAL_SQL, rows)
+        self._counts['signals'] += len(rows)
     
     async def save_error_record(self, error_record: ErrorRecord):
         """Save error record to database."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO errors VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                error_record.id,
-                error_record.error_type,
-                error_record.error_message,
-                error_record.timestamp.isoformat(),
-                json.dumps(error_record.context),
-                error_record.severity
-            ))
-            
-            conn.commit()
-            conn.close()
-            
-        except Exception as e:
-            log_event(f"❌ Failed to save error record: {e}", "ERROR")
+        await self.save_error_records([error_record])
+    
+    async def save_error_records(self, error_records: List[ErrorRecord]):
+        """Save error records to database in one transaction; write errors propagate to the caller."""
+        rows = [self._error_row(error_record) for error_record in error_records]
+        
+        await self.storage_worker.write(INSERT_ERROR_SQL, rows)
+        self._counts['errors'] += len(rows)
+    
+    async def flush(self):
+        """Wait until all queued database writes have been committed."""
+        await self.storage_worker.flush()
+    
+    def get_counts(self) -> Dict[str, int]:
+        """Rows committed by this process, per table, without querying the database."""
+        return dict(self._counts)
     
     async def send_trade_notification(self, trade_record: TradeRecord):
         """Send trade notification to Telegram."""
@@ -363,7 +514,7 @@ class ReportingSystem:
             message += f"Symbol: {trade_record.symbol}\n"
             message += f"Side: {trade_record.side.upper()}\n"
             message += f"Quantity: {trade_record.quantity}\n"
-            message += f"Entry Price: ${trade_record.entry_price:,.2f}\n"
+            message += f"Entry Price: {usd(trade_record.entry_price)}\n"
             message += f"Group: {trade_record.group_name}\n"
             message += f"Order ID: {trade_record.order_ids[0] if trade_record.order_ids else 'N/A'}\n"
             
@@ -409,38 +560,37 @@ class ReportingSystem:
             if date is None:
                 date = datetime.now()
             
-            # Get trades for the day
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             start_date = date.replace(hour=0, minute=0, second=0, microsecond=0)
             end_date = start_date + timedelta(days=1)
             
-            # Get trades
-            cursor.execute('''
-                SELECT * FROM trades 
-                WHERE entry_time >= ? AND entry_time < ?
-            ''', (start_date.isoformat(), end_date.isoformat()))
-            
-            trades = cursor.fetchall()
-            
-            # Get signals
-            cursor.execute('''
-                SELECT * FROM signals 
-                WHERE timestamp >= ? AND timestamp < ?
-            ''', (start_date.isoformat(), end_date.isoformat()))
-            
-            signals = cursor.fetchall()
-            
-            # Get errors
-            cursor.execute('''
-                SELECT * FROM errors 
-                WHERE timestamp >= ? AND timestamp < ?
-            ''', (start_date.isoformat(), end_date.isoformat()))
-            
-            errors = cursor.fetchall()
-            
-            conn.close()
+            # Serialize use of the shared connection across threads
+            with self.conn_lock:
+                # Get trades for the day
+                cursor = self.conn.cursor()
+                
+                # Get trades
+                cursor.execute('''
+                    SELECT * FROM trades 
+                    WHERE entry_time >= ? AND entry_time < ?
+                ''', (start_date.isoformat(), end_date.isoformat()))
+                
+                trades = cursor.fetchall()
+                
+                # Get signals
+                cursor.execute('''
+                    SELECT * FROM signals 
+                    WHERE timestamp >= ? AND timestamp < ?
+                ''', (start_date.isoformat(), end_date.isoformat()))
+                
+                signals = cursor.fetchall()
+                
+                # Get errors
+                cursor.execute('''
+                    SELECT * FROM errors 
+                    WHERE timestamp >= ? AND timestamp < ?
+                ''', (start_date.isoformat(), end_date.isoformat()))
+                
+                errors = cursor.fetchall()
             
             # Calculate statistics
             total_trades = len(trades)
@@ -507,16 +657,17 @@ class ReportingSystem:
             
             start_date = end_date - timedelta(days=7)
             
-            # Get all trades for the week
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM trades 
-                WHERE entry_time >= ? AND entry_time < ?
-            ''', (start_date.isoformat(), end_date.isoformat()))
-            
-            trades = cursor.fetchall()
+            # Serialize use of the shared connection across threads
+            with self.conn_lock:
+                # Get all trades for the week
+                cursor = self.conn.cursor()
+                
+                cursor.execute('''
+                    SELECT * FROM trades 
+                    WHERE entry_time >= ? AND entry_time < ?
+                ''', (start_date.isoformat(), end_date.isoformat()))
+                
+                trades = cursor.fetchall()
             
             # Calculate weekly statistics
             closed_trades = [t for t in trades if t[15] == 'closed']
@@ -658,8 +809,13 @@ class ReportingSystem:
         """Save report to JSON file."""
         try:
             filepath = self.reports_dir / filename
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+            if orjson is not None:
+                data = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+                with open(filepath, 'wb') as f:
+                    f.write(data)
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(report, f, indent=2, ensure_ascii=False, default=str)
             
             log_event(f"✅ Report saved: {filepath}", "INFO")
             
@@ -675,7 +831,7 @@ class ReportingSystem:
             message += "=" * 40 + "\n"
             message += f"📈 Total Trades: {summary.get('total_trades', 0)}\n"
             message += f"✅ Closed Trades: {summary.get('closed_trades', 0)}\n"
-            message += f"💰 Total PnL: ${summary.get('total_pnl', 0):,.2f}\n"
+            message += f"💰 Total PnL: {usd(summary.get('total_pnl', 0))}\n"
             message += f"🎯 Win Rate: {summary.get('win_rate', 0):.1f}%\n"
             message += f"📡 Signals: {summary.get('signals_received', 0)}\n"
             message += f"⚠️ Errors: {summary.get('errors_occurred', 0)}\n\n"
@@ -687,7 +843,7 @@ class ReportingSystem:
                 for group, stats in group_stats.items():
                     if stats['trades'] > 0:
                         win_rate = (stats['winning_trades'] / stats['trades'] * 100) if stats['trades'] > 0 else 0
-                        message += f"  {group}: {stats['trades']} trades, ${stats['total_pnl']:,.2f} PnL, {win_rate:.1f}% win rate\n"
+                        message += f"  {group}: {stats['trades']} trades, {usd(stats['total_pnl'])} PnL, {win_rate:.1f}% win rate\n"
             
             await send_telegram_log(message, tag="daily_report")
             
@@ -704,16 +860,16 @@ class ReportingSystem:
             message += "=" * 50 + "\n"
             message += f"📈 Total Trades: {summary.get('total_trades', 0)}\n"
             message += f"✅ Closed Trades: {summary.get('closed_trades', 0)}\n"
-            message += f"💰 Total PnL: ${summary.get('total_pnl', 0):,.2f}\n"
+            message += f"💰 Total PnL: {usd(summary.get('total_pnl', 0))}\n"
             message += f"🎯 Win Rate: {summary.get('win_rate', 0):.1f}%\n"
-            message += f"📊 Avg PnL per Trade: ${summary.get('avg_pnl_per_trade', 0):,.2f}\n\n"
+            message += f"📊 Avg PnL per Trade: {usd(summary.get('avg_pnl_per_trade', 0))}\n\n"
             
             # Add top performing groups
             top_groups = report.get('top_performing_groups', [])
             if top_groups:
                 message += "🏆 TOP PERFORMING GROUPS:\n"
                 for i, group_data in enumerate(top_groups[:3], 1):
-                    message += f"  {i}. {group_data['group']}: ${group_data['pnl']:,.2f}\n"
+                    message += f"  {i}. {group_data['group']}: {usd(group_data['pnl'])}\n"
             
             await send_telegram_log(message, tag="weekly_report")
             
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Shared base for the stop-loss managers (break-even and trailing).
+Holds price access, the per-trade column layout used for condition checks
+and monitor wake-up handling.
+"""
+
+import asyncio
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from core.api import get_current_price_async, get_current_prices_async
+from config.settings import TradingConfig
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Fallback to a per-row loop over the columns
+
+class SLConfig(NamedTuple):
+    """Snapshot of the TradingConfig values the SL managers read."""
+    breakeven_threshold: float  # Profit % to trigger break-even
+    breakeven_buffer: float  # Fraction above/below entry for the break-even SL
+    trailing_threshold: float  # Profit % to activate trailing
+    trailing_distance: float  # Fraction of price between price and trailing SL
+    trailing_step: float  # Minimum fractional SL move per trailing update
+
+def load_sl_config() -> SLConfig:
+    """Read the SL settings from TradingConfig once."""
+    return SLConfig(
+        breakeven_threshold=TradingConfig.BREAKEVEN_THRESHOLD,
+        breakeven_buffer=TradingConfig.BREAKEVEN_BUFFER,
+        trailing_threshold=TradingConfig.TRAILING_THRESHOLD,
+        trailing_distance=TradingConfig.TRAILING_DISTANCE,
+        trailing_step=TradingConfig.TRAILING_STEP
+    )
+
+class PriceCache:
+    """Recently fetched prices, shared by the managers that are given the same cache."""
+    
+    def __init__(self, ttl: float = 0.25):
+        self.ttl = ttl  # Seconds a fetched price is reused across checks
+        self._prices: Dict[str, Tuple[float, float]] = {}  # symbol -> (price, monotonic time)
+        self._managers: List["SLManagerBase"] = []  # Managers woken when prices are stored
+    
+    def subscribe(self, manager: "SLManagerBase") -> None:
+        """Wake this manager whenever another subscriber stores prices it watches."""
+        self._managers.append(manager)
+    
+    def get(self, symbol: str, now: float) -> Optional[float]:
+        """Get a symbol's price if it was fetched within the last ttl seconds."""
+        cached = self._prices.get(symbol)
+        if cached is not None and now - cached[1] < self.ttl:
+            return cached[0]
+        return None
+    
+    def store(self, prices: Dict[str, float], source: "SLManagerBase") -> None:
+        """Cache freshly fetched prices and wake the other managers watching those symbols."""
+        now = time.monotonic()
+        for symbol, price in prices.items():
+            self._prices[symbol] = (price, now)
+        for manager in self._managers:
+            if manager is not source:
+                for symbol in prices:
+                    manager.notify_price_update(symbol)
+
+# Shared by the module-level break-even and trailing managers
+sl_price_cache = PriceCache()
+
+async def check_sl_conditions(symbol: str, managers: Sequence["SLManagerBase"]) -> Dict[str, bool]:
+    """Check the given managers' conditions for a symbol from a single price fetch."""
+    try:
+        current_price = await managers[0]._get_price(symbol)
+        return {manager.condition_key: manager._evaluate(symbol, current_price)
+                for manager in managers}
+    
+    except Exception as e:
+        print(f"❌ Error checking conditions for {symbol}: {e}")
+        return {}
+
+class SLManagerBase(ABC):
+    """Common state and helpers for managers that watch active trades."""
+    
+    condition_key = ""  # Key this manager reports under in check_sl_conditions
+    condition_label = ""  # Name printed when a trade meets this manager's condition
+    
+    def __init__(self, poll_interval: float, price_cache: Optional[PriceCache] = None):
+        self.active_trades = {}  # symbol -> trade_info
+        self._cfg = load_sl_config()  # Settings snapshot taken once per manager
+        self.poll_interval = poll_interval  # Seconds between price checks when no tick arrives
+        self._wake = asyncio.Event()  # Set on trade registration and prices fetched by other managers
+        self._prices = price_cache if price_cache is not None else PriceCache()  # Own cache unless shared
+        self._prices.subscribe(self)
+        self._idx: Dict[str, int] = {}  # symbol -> row in the columns below
+        self._side: List[int] = []  # +1 for buy, -1 for sell per row
+        self._trigger: List[float] = []  # Profit-threshold price per row
+        self._tp2: List[float] = []  # Second TP per row, nan when the trade has none
+    
+    @abstractmethod
+    def _evaluate(self, symbol: str, current_price: Optional[float]) -> bool:
+        """Evaluate this manager's condition for a symbol at the given price."""
+    
+    def _trigger_price(self, entry_price: float, side: str, threshold_pct: float) -> float:
+        """Price at which a trade reaches threshold_pct percent profit."""
+        if side == "buy":
+            return entry_price * (1 + threshold_pct / 100)
+        return entry_price * (1 - threshold_pct / 100)
+    
+    def _set_row(self, symbol: str, side: str, trigger_price: float, tp_prices: list) -> None:
+        """Store a trade's direction, trigger price and TP2 in the column layout."""
+        sign = 1 if side == "buy" else -1
+        tp2 = tp_prices[1] if len(tp_prices) >= 2 else math.nan
+        row = self._idx.get(symbol)
+        if row is None:
+            self._idx[symbol] = len(self._side)
+            self._side.append(sign)
+            self._trigger.append(trigger_price)
+            self._tp2.append(tp2)
+        else:
+            self._side[row] = sign
+            self._trigger[row] = trigger_price
+            self._tp2[row] = tp2
+    
+    def _conditions_met(self, prices: Dict[str, float]) -> Dict[str, bool]:
+        """Check the profit threshold and TP2 for several trades in one pass over the columns."""
+        symbols = list(prices)
+        values = list(prices.values())
+        rows = [self._idx[symbol] for symbol in symbols]
+        # (price - level) * side >= 0 is price >= level for buys and price <= level for sells;
+        # a missing TP2 (nan) never compares as hit
+        if np is not None and len(rows) > 1:
+            price = np.array(values, dtype=float)
+            side = np.take(self._side, rows)
+            threshold_hit = ((price - np.take(self._trigger, rows)) * side >= 0).tolist()
+            tp2_hit = ((price - np.take(self._tp2, rows)) * side >= 0).tolist()
+        else:
+            threshold_hit = [(price - self._trigger[row]) * self._side[row] >= 0
+                             for price, row in zip(values, rows)]
+            tp2_hit = [(price - self._tp2[row]) * self._side[row] >= 0
+                       for price, row in zip(values, rows)]
+        
+        results = {}
+        for symbol, price, threshold, tp2 in zip(symbols, values, threshold_hit, tp2_hit):
+            results[symbol] = threshold or tp2
+            if results[symbol]:
+                self._report_met(symbol, price, tp2)
+        return results
+    
+    def _report_met(self, symbol: str, current_price: float, tp2_hit: bool) -> None:
+        """Print the details of a trade that met this manager's condition."""
+        trade = self.active_trades[symbol]
+        entry_price = trade["entry_price"]
+        if trade["side"] == "buy":
+            profit_pct = (current_price - entry_price) / entry_price * 100
+        else:  # sell
+            profit_pct = (entry_price - current_price) / entry_price * 100
+        print(f"🎯 {self.condition_label} conditions met for {symbol}:")
+        print(f"   Current Price: ${current_price:,.2f}")
+        print(f"   Entry Price: ${entry_price:,.2f}")
+        print(f"   Profit: {profit_pct:.2f}%")
+        print(f"   TP2 Hit: {tp2_hit}")
+    
+    async def _get_price(self, symbol: str) -> Optional[float]:
+        """Fetch a symbol's price, reusing one fetched within the price cache's ttl."""
+        cached = self._prices.get(symbol, time.monotonic())
+        if cached is not None:
+            return cached
+        
+        price = await get_current_price_async(symbol)
+        if price is not None:
+            self._prices.store({symbol: price}, self)
+        return price
+    
+    async def _get_prices(self, symbols: list) -> Dict[str, float]:
+        """Fetch prices for several symbols, requesting only those not cached."""
+        now = time.monotonic()
+        prices = {}
+        stale = []
+        for symbol in symbols:
+            cached = self._prices.get(symbol, now)
+            if cached is not None:
+                prices[symbol] = cached
+            else:
+                stale.append(symbol)
+        
+        if stale:
+            fetched = await get_current_prices_async(stale)
+            fresh = {symbol: price for symbol, price in fetched.items() if price is not None}
+            self._prices.store(fresh, self)
+            prices.update(fresh)
+        return prices
+    
+    async def _wait_for_wake(self, timeout: Optional[float]) -> None:
+        """Wait for the wake event, giving up after timeout seconds (None waits forever)."""
+        try:
+            async with asyncio.timeout(timeout):
+                await self._wake.wait()
+        except TimeoutError:
+            pass
+        self._wake.clear()
+    
+    def _has_active_trades(self) -> bool:
+        """Check whether any registered trade still needs monitoring."""
+        return any(trade["status"] == "active" for trade in self.active_trades.values())
+    
+    def notify_price_update(self, symbol: str = None) -> None:
+        """Wake the monitoring loop when a new price arrives for a watched symbol (any symbol if None)."""
+        if symbol is None or symbol in self.active_trades:
+            self._wake.set()
+    
+    def get_trade_status(self, symbol: str) -> Optional[Dict]:
+        """Get current status of a trade."""
+        return self.active_trades.get(symbol)
+    
+    def snapshot(self) -> Dict[str, Dict]:
+        """Get a point-in-time copy of every trade's status in one pass."""
+        return {symbol: dict(trade) for symbol, trade in self.active_trades.items()}
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Background storage worker for the reporting system.
+Runs SQLite writes on a dedicated thread so disk commits never block the event loop.
+"""
+
+import asyncio
+import queue
+import sqlite3
+import threading
+from typing import Callable, List, Optional, Tuple
+
+from utils.logger import log_event
+
+def _resolve_future(future: asyncio.Future, error: Optional[BaseException] = None):
+    """Complete a future from the event loop thread unless it was cancelled."""
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
+class StorageWorker:
+    """Batches queued INSERT statements into shared transactions on a writer thread."""
+    
+    def __init__(self, connect: Callable[[], sqlite3.Connection], max_batch: int = 64):
+        self.connect = connect  # Opens the worker's own connection
+        self.max_batch = max_batch
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """Start the writer thread if it is not already running."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="StorageWorker", daemon=True)
+                self._thread.start()
+    
+    def stop(self):
+        """Drain pending writes and stop the writer thread."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join()
+    
+    async def write(self, sql: str, rows: List[tuple]):
+        """Queue rows for insertion and wait until they are committed."""
+        await self.write_many([(sql, rows)])
+    
+    async def write_many(self, statements: List[Tuple[str, List[tuple]]]):
+        """Queue several (sql, rows) statements to be committed in one transaction."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.start()
+        self._queue.put((statements, loop, future))
+        await future
+    
+    async def flush(self):
+        """Wait until every write queued before this call has been committed."""
+        await self.write_many([])
+    
+    def _run(self):
+        """Writer thread loop: collect a batch, commit it, resolve its futures."""
+        conn = self.connect()
+        stopping = False
+        
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            
+            batch = [item]
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            self._write_batch(conn, batch)
+        
+        conn.close()
+    
+    def _write_batch(self, conn: sqlite3.Connection, batch: list):
+        """Commit a batch in one transaction, retrying items alone if it fails."""
+        try:
+            with conn:
+                for statements, _, _ in batch:
+                    for sql, rows in statements:
+                        if rows:
+                            conn.executemany(sql, rows)
+        except Exception as e:
+            if len(batch) > 1:
+                # Keep one bad item from rolling back the other callers' rows
+                for item in batch:
+                    self._write_batch(conn, [item])
+                return
+            log_event(f"❌ Storage worker write failed: {e}", "ERROR")
+            _, loop, future = batch[0]
+            self._notify(loop, future, e)
+            return
+        
+        for _, loop, future in batch:
+            self._notify(loop, future)
+    
+    def _notify(self, loop: asyncio.AbstractEventLoop, future: asyncio.Future,
+                error: Optional[BaseException] = None):
+        """Hand a result back to the waiting coroutine's event loop."""
+        try:
+            loop.call_soon_threadsafe(_resolve_future, future, error)
+        except RuntimeError:
+            # The caller's loop is already closed; nobody is waiting anymore
+            pass
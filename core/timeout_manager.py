@@ -13,6 +13,11 @@ from core.exchange_api import OrderResult
 from config.settings import TradingConfig
 from utils.logger import log_event
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Fallback to a per-trade duration scan
+
 class TimeoutManager:
     """Manages timeout protection for active trades."""
     
@@ -20,6 +25,9 @@ class TimeoutManager:
         self.active_trades = {}  # symbol -> trade_info
         self.timeout_hours = TradingConfig.TIMEOUT_HOURS  # From config
         self.check_interval = TradingConfig.TIMEOUT_CHECK_INTERVAL  # From config
+        self._idx: Dict[str, int] = {}  # symbol -> row in the columns below
+        self._symbols: List[str] = []  # Symbol per row
+        self._entry_ts: List[float] = []  # Entry timestamp per row
         
     async def register_trade(self, symbol: str, side: str, entry_price: float, 
                            sl_price: float, tp_prices: list, order_ids: list, 
@@ -39,11 +47,41 @@ class TimeoutManager:
             "status": "active"
         }
         self.active_trades[symbol] = trade_info
+        self._set_row(symbol, trade_info["entry_timestamp"])
         log_event(f"⏰ Timeout monitoring started for {symbol} (4 hours)", "INFO")
         print(f"⏰ Timeout monitoring started for {symbol}")
         print(f"   Entry time: {trade_info['entry_datetime'].strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"   Timeout: {self.timeout_hours} hours")
     
+    def _set_row(self, symbol: str, entry_timestamp: float) -> None:
+        """Store a trade's entry timestamp in the column layout."""
+        row = self._idx.get(symbol)
+        if row is None:
+            self._idx[symbol] = len(self._entry_ts)
+            self._symbols.append(symbol)
+            self._entry_ts.append(entry_timestamp)
+        else:
+            self._entry_ts[row] = entry_timestamp
+    
+    def set_entry_time(self, symbol: str, entry_timestamp: float) -> None:
+        """Move a registered trade's entry time, e.g. to backdate it in tests."""
+        trade = self.active_trades[symbol]
+        trade["entry_timestamp"] = entry_timestamp
+        trade["entry_datetime"] = datetime.fromtimestamp(entry_timestamp)
+        self._set_row(symbol, entry_timestamp)
+    
+    def timed_out_symbols(self) -> List[str]:
+        """Get every active trade that has reached the timeout, in one pass over the columns."""
+        limit = time.time() - self.timeout_hours * 3600
+        if np is not None and len(self._entry_ts) > 1:
+            rows = np.flatnonzero(np.array(self._entry_ts) <= limit).tolist()
+        else:
+            rows = [row for row, entry_ts in enumerate(self._entry_ts) if entry_ts <= limit]
+        
+        candidates = (self._symbols[row] for row in rows)
+        return [symbol for symbol in candidates
+                if symbol in self.active_trades and self.active_trades[symbol]["status"] == "active"]
+    
     def get_trade_duration(self, symbol: str) -> Optional[float]:
         """Get the duration of a trade in hours."""
         if symbol not in self.active_trades:
@@ -143,19 +181,18 @@ class TimeoutManager:
             print(f"❌ Error closing trade {symbol} due to timeout: {e}")
             return False
     
+    async def _tick(self) -> None:
+        """Run one monitoring pass, closing every active trade that has timed out."""
+        for symbol in self.timed_out_symbols():
+            # Confirm and log the timeout before closing
+            if await self.check_timeout_conditions(symbol):
+                await self.close_trade_timeout(symbol)
+    
     async def monitor_timeout(self) -> None:
         """Main monitoring loop for timeout conditions."""
         while True:
             try:
-                for symbol in list(self.active_trades.keys()):
-                    trade = self.active_trades[symbol]
-                    if trade["status"] != "active":
-                        continue
-                    
-                    # Check if timeout conditions are met
-                    if await self.check_timeout_conditions(symbol):
-                        await self.close_trade_timeout(symbol)
-                
+                await self._tick()
                 await asyncio.sleep(self.check_interval)  # Check every 60 seconds
                 
             except Exception as e:
@@ -199,10 +236,11 @@ class TimeoutManager:
     
     def get_all_trades_status(self) -> Dict:
         """Get status of all active trades."""
+        now = time.time()  # One clock read shared by every trade in the snapshot
         active_trades = {}
         for symbol, trade in self.active_trades.items():
             if trade["status"] == "active":
-                duration_hours = self.get_trade_duration(symbol)
+                duration_hours = (now - trade["entry_timestamp"]) / 3600
                 active_trades[symbol] = {
                     "duration_hours": duration_hours,
                     "timeout_hours": self.timeout_hours,
@@ -5,19 +5,22 @@ Implements "riding to heaven" trailing stops that follow price movement.
 """
 
 import asyncio
-from typing import Dict, Optional, Tuple
-from core.api import get_current_price_async, place_stop_loss_order, cancel_order
+from typing import Dict, Optional
+from core.api import place_stop_loss_order, cancel_order
 from core.exchange_api import OrderResult
-from config.settings import TradingConfig
+from core.sl_manager_base import SLManagerBase, PriceCache, sl_price_cache
 
-class TrailingManager:
+class TrailingManager(SLManagerBase):
     """Manages trailing stop logic for active trades."""
     
-    def __init__(self):
-        self.active_trades = {}  # symbol -> trade_info
-        self.trailing_threshold = TradingConfig.TRAILING_THRESHOLD  # Default 3% profit
-        self.trailing_distance = TradingConfig.TRAILING_DISTANCE  # Default 1% trailing distance
-        self.trailing_step = TradingConfig.TRAILING_STEP  # Default 0.5% step size
+    condition_key = "trailing"
+    condition_label = "Trailing"
+    
+    def __init__(self, price_cache: Optional[PriceCache] = None):
+        super().__init__(poll_interval=3, price_cache=price_cache)
+        self.trailing_threshold = self._cfg.trailing_threshold  # Default 3% profit
+        self.trailing_distance = self._cfg.trailing_distance  # Default 1% trailing distance
+        self.trailing_step = self._cfg.trailing_step  # Default 0.5% step size
     
     async def register_trade(self, symbol: str, side: str, entry_price: float, 
                            sl_price: float, tp_prices: list, order_ids: list) -> None:
@@ -37,6 +40,10 @@ class TrailingManager:
             "status": "active"
         }
         self.active_trades[symbol] = trade_info
+        # Price at which the profit threshold is reached, stored with TP2 in the columns
+        trigger_price = self._trigger_price(entry_price, trade_info["side"], self.trailing_threshold)
+        self._set_row(symbol, trade_info["side"], trigger_price, tp_prices)
+        self._wake.set()
         print(f"📊 Trailing stop monitoring started for {symbol}")
     
     async def check_trailing_conditions(self, symbol: str) -> bool:
@@ -49,39 +56,45 @@ class TrailingManager:
             return True  # Already trailing
         
         try:
-            current_price = await get_current_price_async(symbol)
-            entry_price = trade["entry_price"]
-            side = trade["side"]
-            
-            # Calculate current profit percentage
-            if side == "buy":
-                profit_pct = (current_price - entry_price) / entry_price * 100
-            else:  # sell
-                profit_pct = (entry_price - current_price) / entry_price * 100
-            
-            # Check if TP2 is hit (if we have TP2)
-            tp2_hit = False
-            if len(trade["tp_prices"]) >= 2:
-                tp2 = trade["tp_prices"][1]  # Second TP
-                if side == "buy" and current_price >= tp2:
-                    tp2_hit = True
-                elif side == "sell" and current_price <= tp2:
-                    tp2_hit = True
-            
-            # Activate trailing if TP2 hit OR profit threshold reached
-            if tp2_hit or profit_pct >= self.trailing_threshold:
-                print(f"🎯 Trailing conditions met for {symbol}:")
-                print(f"   Current Price: ${current_price:,.2f}")
-                print(f"   Entry Price: ${entry_price:,.2f}")
-                print(f"   Profit: {profit_pct:.2f}%")
-                print(f"   TP2 Hit: {tp2_hit}")
-                return True
+            current_price = await self._get_price(symbol)
+            return self._conditions_met({symbol: current_price})[symbol]
             
+        except Exception as e:
+            print(f"❌ Error checking trailing for {symbol}: {e}")
             return False
+    
+    async def check_all(self) -> Dict[str, bool]:
+        """Check trailing activation for every active trade with one price request."""
+        results = {}
+        symbols = []
+        for symbol, trade in self.active_trades.items():
+            if trade["status"] != "active":
+                continue
+            if trade["trailing_active"]:
+                results[symbol] = True  # Already trailing
+            else:
+                symbols.append(symbol)
+        if not symbols:
+            return results
+        
+        try:
+            prices = await self._get_prices(symbols)
+            # Threshold and TP2 checks for every priced trade in one pass over the columns
+            results.update(self._conditions_met(prices))
+            return results
             
         except Exception as e:
-            print(f"❌ Error checking trailing for {symbol}: {e}")
+            print(f"❌ Error checking trailing for {len(symbols)} trades: {e}")
+            return results
+    
+    def _evaluate(self, symbol: str, current_price: Optional[float]) -> bool:
+        """Evaluate trailing activation for a registered trade."""
+        trade = self.active_trades.get(symbol)
+        if trade is None:
             return False
+        if trade["trailing_active"]:
+            return True  # Already trailing
+        return current_price is not None and self._conditions_met({symbol: current_price})[symbol]
     
     async def update_trailing_stop(self, symbol: str) -> bool:
         """Update trailing stop based on current price movement."""
@@ -93,7 +106,7 @@ class TrailingManager:
             return False
         
         try:
-            current_price = await get_current_price_async(symbol)
+            current_price = await self._get_price(symbol)
             side = trade["side"]
             
             # Update highest/lowest prices
@@ -164,7 +177,7 @@ class TrailingManager:
             return True  # Already active
         
         try:
-            current_price = await get_current_price_async(symbol)
+            current_price = await self._get_price(symbol)
             side = trade["side"]
             
             # Calculate initial trailing stop
@@ -203,28 +216,21 @@ class TrailingManager:
         """Main monitoring loop for trailing stops."""
         while True:
             try:
-                for symbol in list(self.active_trades.keys()):
-                    trade = self.active_trades[symbol]
-                    if trade["status"] != "active":
-                        continue
-                    
-                    # Check if trailing should be activated
-                    if not trade["trailing_active"]:
-                        if await self.check_trailing_conditions(symbol):
-                            await self.activate_trailing(symbol)
-                    else:
+                # Check trailing conditions for all active trades at once
+                for symbol, conditions_met in (await self.check_all()).items():
+                    if self.active_trades[symbol]["trailing_active"]:
                         # Update existing trailing stop
                         await self.update_trailing_stop(symbol)
+                    elif conditions_met:
+                        await self.activate_trailing(symbol)
                 
-                await asyncio.sleep(3)  # Check every 3 seconds for trailing
+                # Block until a trade is registered or another manager fetches its prices,
+                # re-checking every poll_interval while trades are active
+                await self._wait_for_wake(self.poll_interval if self._has_active_trades() else None)
                 
             except Exception as e:
                 print(f"❌ Error in trailing monitoring: {e}")
-                await asyncio.sleep(10)
-    
-    def get_trade_status(self, symbol: str) -> Optional[Dict]:
-        """Get current status of a trade."""
-        return self.active_trades.get(symbol)
+                await self._wait_for_wake(10)
     
     def close_trade(self, symbol: str) -> None:
         """Close a trade and remove from monitoring."""
@@ -232,8 +238,8 @@ class TrailingManager:
             self.active_trades[symbol]["status"] = "closed"
             print(f"📊 Trailing stop monitoring stopped for {symbol}")
 
-# Global instance
-trailing_manager = TrailingManager()
+# Global instance, sharing fetched prices with the other SL manager
+trailing_manager = TrailingManager(price_cache=sl_price_cache)
 
 # Test function
 async def test_trailing_logic():
@@ -6,7 +6,7 @@ Demonstrates trade registration, duration tracking, and auto-closure scenarios.
 
 import asyncio
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from core.timeout_manager import timeout_manager
 from core.entry_manager import execute_entry_strategy
 from core.api import get_current_price_async
@@ -81,9 +81,7 @@ async def demo_timeout_workflow():
             
             # Simulate time passage by modifying the entry timestamp
             if "BTCUSDT" in timeout_manager.active_trades:
-                trade = timeout_manager.active_trades["BTCUSDT"]
-                trade["entry_timestamp"] = time.time() - (scenario["hours"] * 3600)
-                trade["entry_datetime"] = datetime.now() - timedelta(hours=scenario["hours"])
+                timeout_manager.set_entry_time("BTCUSDT", time.time() - (scenario["hours"] * 3600))
             
             # Test timeout conditions
             timeout_met = await timeout_manager.check_timeout_conditions("BTCUSDT")
@@ -176,9 +174,7 @@ async def demo_multiple_trades():
         
         # Simulate entry time
         if trade["symbol"] in timeout_manager.active_trades:
-            trade_obj = timeout_manager.active_trades[trade["symbol"]]
-            trade_obj["entry_timestamp"] = time.time() - (trade["hours_ago"] * 3600)
-            trade_obj["entry_datetime"] = datetime.now() - timedelta(hours=trade["hours_ago"])
+            timeout_manager.set_entry_time(trade["symbol"], time.time() - (trade["hours_ago"] * 3600))
         
         print(f"✅ {trade['symbol']} registered ({trade['hours_ago']}h ago)")
     
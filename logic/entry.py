@@ -115,7 +115,7 @@ async def handle_entry_signal(signal):
         state.entry_price = (entry1 + entry2) / 2
         log_event(f"[INFO] Entry med ett värde, beräknar 2 nivåer: {entry1}, {entry2}", "INFO")
 
-    lev = await calculate_leverage(entry1, sl)
+    lev = calculate_leverage(entry1, sl)
     qty = calculate_quantity(DEFAULT_IM, lev, entry1)
     half_qty = qty / 2
 
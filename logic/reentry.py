@@ -96,7 +96,7 @@ async def place_reentry_order(symbol: str, side: str, entry_price: float, sl_pri
         reentry_state[symbol]["last_attempt"] = time.time()
         
         # Calculate new leverage
-        new_leverage = await calculate_leverage(entry_price, sl_price)
+        new_leverage = calculate_leverage(entry_price, sl_price)
         leverage = min(new_leverage, LEVERAGE_CAP)
         
         # Calculate quantity
@@ -2,8 +2,9 @@
 
 import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from typing import Dict, Optional
-from datetime import datetime, timedelta
 from config.settings import TradingConfig
 from logic.exit import exit_trade
 from utils.telegram_logger import send_telegram_log
@@ -11,12 +12,17 @@ from core.api import get_position
 
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class TimeoutEntry:
+    """Timeout task and start time for one active trade."""
+    task: asyncio.Task
+    start_time: float  # time.monotonic() seconds, immune to wall-clock jumps
+
 class TimeoutWatcher:
     """Manages automatic trade exit after timeout."""
     
     def __init__(self):
-        self.timeout_tasks: Dict[str, asyncio.Task] = {}
-        self.trade_start_times: Dict[str, datetime] = {}
+        self.active: Dict[str, TimeoutEntry] = {}  # symbol -> timeout entry
         self.timeout_seconds = TradingConfig.AUTO_CLOSE_TIMEOUT
         logger.info(f"⏰ TimeoutWatcher initialized with {self.timeout_seconds}s timeout")
     
@@ -25,14 +31,14 @@ class TimeoutWatcher:
         try:
             await self.cancel_timeout_for_symbol(symbol)
             
-            self.trade_start_times[symbol] = datetime.now()
+            start_time = time.monotonic()
             
             timeout_task = asyncio.create_task(
                 self._timeout_handler(symbol, side, group_name),
                 name=f"timeout_{symbol}"
             )
             
-            self.timeout_tasks[symbol] = timeout_task
+            self.active[symbol] = TimeoutEntry(timeout_task, start_time)
             
             timeout_hours = self.timeout_seconds / 3600
             log_message = f"⏰ Auto-close timer started for {symbol} (timeout: {timeout_hours:.1f}h)"
@@ -106,8 +112,9 @@ class TimeoutWatcher:
     
     async def cancel_timeout_for_symbol(self, symbol: str):
         """Cancel timeout task for a specific symbol."""
-        if symbol in self.timeout_tasks:
-            task = self.timeout_tasks[symbol]
+        entry = self.active.pop(symbol, None)
+        if entry is not None:
+            task = entry.task
             if not task.done():
                 task.cancel()
                 try:
@@ -115,15 +122,11 @@ class TimeoutWatcher:
                 except asyncio.CancelledError:
                     pass
             
-            del self.timeout_tasks[symbol]
-            if symbol in self.trade_start_times:
-                del self.trade_start_times[symbol]
-            
             logger.info(f"[Auto-Close] Timeout task cancelled for {symbol} (position closed early)")
     
     async def cancel_all_timeouts(self):
         """Cancel all active timeout tasks."""
-        for symbol in list(self.timeout_tasks.keys()):
+        for symbol in list(self.active):
             await self.cancel_timeout_for_symbol(symbol)
         
         logger.info("[Auto-Close] All timeout tasks cancelled")
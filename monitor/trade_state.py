@@ -9,7 +9,7 @@ from typing import Optional
 # from monitor.reentry_watcher import start_reentry_watcher, cancel_reentry_watcher
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeState:
     symbol: str
     side: str  # "LONG" eller "SHORT"
@@ -4,10 +4,16 @@ from monitor.loop_manager import trading_loop                    # ⬅️ ny
 from logic.entry import handle_entry_signal
 from logic.trailing import monitor_trailing_stop
 from monitor.trade_state import monitor_pol_and_adjust
-from utils.logger import log_event
+from utils.logger import log_event, set_logger_loop
 from config.settings import SHUTDOWN_ALL
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Not available on Windows (ProactorEventLoop); fall back to the default loop
+
 async def main():
+    set_logger_loop(asyncio.get_running_loop())
     log_event("🔄 Boten startar...")
 
     if SHUTDOWN_ALL:
@@ -25,6 +31,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
 
 # Säkerställ att SignalHandler instansieras
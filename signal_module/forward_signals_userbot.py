@@ -9,7 +9,7 @@ from config.settings import TelegramConfig
 api_id = TelegramConfig.TELEGRAM_API_ID
 api_hash = TelegramConfig.TELEGRAM_API_HASH
 
-SOURCE_CHANNELS = TelegramConfig.TELEGRAM_SIGNAL_CHANNEL_IDS
+SOURCE_CHANNELS = list(TelegramConfig.TELEGRAM_SIGNAL_CHANNEL_IDS)
 DESTINATION_CHANNEL = TelegramConfig.DESTINATION_CHANNEL_ID
 
 # 📡 Skapa klientsession – första gången får du ange kod från Telegram
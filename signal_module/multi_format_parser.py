@@ -1,9 +1,89 @@
 
 import re
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
 from utils.price import get_current_price
 from utils.telegram_logger import send_telegram_log
 from config.settings import OverrideConfig
 
+# Patterns are compiled once at import instead of on every parse
+TARGET_NUMBER_PATTERN = re.compile(r"(\d+\.\d+|\d+)")
+
+# Enhanced Symbol Detection - Support multiple formats
+SYMBOL_PATTERNS = (
+    re.compile(r"[#\$]?([A-Z]{2,10})[/\-]?USDT", re.IGNORECASE),  # Standard: BTCUSDT, BTC/USDT, #BTCUSDT
+    re.compile(r"Coin:\s*([A-Z]{2,10})", re.IGNORECASE),           # Coin: BTC format
+    re.compile(r"Symbol:\s*([A-Z]{2,10})", re.IGNORECASE),         # Symbol: BTC format  
+    re.compile(r"([A-Z]{2,10})PERP", re.IGNORECASE),               # BTCPERP perpetual format
+    re.compile(r"([A-Z]{2,10})-\d{2}[A-Z]{3}\d{2}", re.IGNORECASE), # BTC-25DEC22 futures format
+    re.compile(r"Signal:\s*([A-Z]{2,10})", re.IGNORECASE),         # Signal: BTC format
+    re.compile(r"Pair:\s*([A-Z]{2,10})", re.IGNORECASE),           # Pair: BTC format
+    re.compile(r"([A-Z]{2,10})\s+Position:", re.IGNORECASE),       # BNB Position: format
+    re.compile(r"([A-Z]{2,10})\s+Trade:", re.IGNORECASE),          # BNB Trade: format
+    re.compile(r"([A-Z]{2,10})\s+Side:", re.IGNORECASE),           # BNB Side: format
+    re.compile(r"^([A-Z]{2,10})\s", re.IGNORECASE),                # BNB at start followed by space
+    re.compile(r"🐋\s*([A-Z]{2,10})", re.IGNORECASE),              # 🐋 BTC format
+    re.compile(r"🔥\s*([A-Z]{2,10})", re.IGNORECASE)               # 🔥 BTC format
+)
+
+# Enhanced Side/Direction Detection - Support multiple formats
+SIDE_PATTERNS = (
+    re.compile(r"Direction:\s*(LONG|SHORT)", re.IGNORECASE),       # Direction: LONG
+    re.compile(r"Side:\s*(LONG|SHORT)", re.IGNORECASE),            # Side: LONG
+    re.compile(r"Position:\s*(LONG|SHORT)", re.IGNORECASE),        # Position: LONG
+    re.compile(r"Trade:\s*(LONG|SHORT)", re.IGNORECASE),           # Trade: LONG
+    re.compile(r"(BUY|SELL)", re.IGNORECASE),                      # BUY/SELL format
+    re.compile(r"(LÅNG|KORT)", re.IGNORECASE),                     # Swedish
+    re.compile(r"(LONG|SHORT)", re.IGNORECASE),                    # Standard
+    re.compile(r"📈\s*(LONG|BUY)", re.IGNORECASE),                 # 📈 LONG
+    re.compile(r"📉\s*(SHORT|SELL)", re.IGNORECASE)                # 📉 SHORT
+)
+
+# Enhanced Entry Detection - Support multiple formats
+ENTRY_PATTERNS = (
+    re.compile(r"Entry\s*[:\-]?\s*([\d\.\-\s]+)", re.IGNORECASE),           # Entry: 45000-46000
+    re.compile(r"Entry\s*Zone\s*[:\-]?\s*([\d\.\-\s]+)", re.IGNORECASE),    # Entry Zone: 45000
+    re.compile(r"Buy\s*[:\-]?\s*([\d\.\-\s]+)", re.IGNORECASE),             # Buy: 45000
+    re.compile(r"Price\s*[:\-]?\s*([\d\.\-\s]+)", re.IGNORECASE),           # Price: 45000
+    re.compile(r"Open\s*[:\-]?\s*([\d\.\-\s]+)", re.IGNORECASE),            # Open: 45000
+    re.compile(r"Enter\s*[:\-]?\s*([\d\.\-\s]+)", re.IGNORECASE),           # Enter: 45000
+    re.compile(r"Ingång\s*[:\-]?\s*([\d\.\-\s]+)", re.IGNORECASE),          # Swedish
+    re.compile(r"Current\s*Price\s*[:\-]?\s*([\d\.\-\s]+)", re.IGNORECASE), # Current Price: 45000
+    re.compile(r"@\s*([\d\.\-\s]+)", re.IGNORECASE),                        # @45000
+    re.compile(r"🎯\s*([\d\.\-\s]+)", re.IGNORECASE)                        # 🎯45000
+)
+
+# Enhanced SL Detection
+SL_PATTERNS = (
+    re.compile(r"SL\s*[:\-]?\s*([\d\.]+)", re.IGNORECASE),              # SL: 44000
+    re.compile(r"Stop\s*Loss\s*[:\-]?\s*([\d\.]+)", re.IGNORECASE),     # Stop Loss: 44000
+    re.compile(r"Stop\s*[:\-]?\s*([\d\.]+)", re.IGNORECASE),            # Stop: 44000
+    re.compile(r"Stoploss\s*[:\-]?\s*([\d\.]+)", re.IGNORECASE),        # Stoploss: 44000
+    re.compile(r"❌\s*([\d\.]+)", re.IGNORECASE),                       # ❌44000
+    re.compile(r"🛑\s*([\d\.]+)", re.IGNORECASE),                       # 🛑44000
+    re.compile(r"S/L\s*[:\-]?\s*([\d\.]+)", re.IGNORECASE),             # S/L: 44000
+    re.compile(r"Cut\s*Loss\s*[:\-]?\s*([\d\.]+)", re.IGNORECASE),      # Cut Loss: 44000
+    re.compile(r"Cut\s*[:\-]?\s*([\d\.]+)", re.IGNORECASE)              # Cut: 610
+)
+
+# Enhanced TP/Target Detection - Support multiple formats
+TARGET_PATTERNS = (
+    re.compile(r"Targets?\s*[:\-]?\s*([\d\s\.,]+)", re.IGNORECASE),       # Targets: 46000, 47000
+    re.compile(r"TP\d*\s*[:\-]?\s*([\d\s\.,]+)", re.IGNORECASE),          # TP1: 46000, TP2: 47000
+    re.compile(r"Take\s*Profit\s*[:\-]?\s*([\d\s\.,]+)", re.IGNORECASE),  # Take Profit: 46000
+    re.compile(r"Target\s*[:\-]?\s*([\d\s\.,]+)", re.IGNORECASE),         # Target: 46000
+    re.compile(r"Exit\s*[:\-]?\s*([\d\s\.,]+)", re.IGNORECASE),           # Exit: 46000
+    re.compile(r"Sell\s*[:\-]?\s*([\d\s\.,]+)", re.IGNORECASE),           # Sell: 46000
+    re.compile(r"Mål\s*[:\-]?\s*([\d\s\.,]+)", re.IGNORECASE),            # Swedish - Mål: 46000
+    re.compile(r"🎯\s*([\d\s\.,]+)", re.IGNORECASE),                      # 🎯46000, 47000
+    re.compile(r"✅\s*([\d\s\.,]+)", re.IGNORECASE),                      # ✅46000
+    re.compile(r"Exit:\s*([\d\s\.,]+)", re.IGNORECASE),                   # Exit: 640,660 (exact match)
+)
+
+LEVERAGE_PATTERN = re.compile(r"(Leverage|Hävstång).*?(\d{1,2}x)", re.IGNORECASE)
+RRR_PATTERN = re.compile(r"RRR[:\s]+(\d+:\d+)")
+RISK_PATTERN = re.compile(r"risk.*?(\d+\.?\d*)%", re.IGNORECASE)
+
 def parse_entry_zone(entry_text):
     if "-" in entry_text:
         parts = [float(p.strip()) for p in entry_text.split("-") if p.strip()]
@@ -15,64 +95,106 @@ def parse_entry_zone(entry_text):
 
 def parse_targets(text):
     # Enhanced to catch both decimal and integer numbers
-    targets = re.findall(r"(\d+\.\d+|\d+)", text)
+    targets = TARGET_NUMBER_PATTERN.findall(text)
     return [float(t) for t in targets[:6]]
 
-async def parse_signal_text_multi(raw_text):
-    """
-    Enhanced multi-format signal parser supporting various trading signal formats.
-    Supports formats from: Binance, Bybit, Bitget, CryptoBull, and custom channels.
-    """
-    signal = {}
-    original_text = raw_text
-    raw_text = raw_text.replace("\xa0", " ").replace("\n", " ").strip()
+class ParsedFields(NamedTuple):
+    """Values read from a signal's text alone, before fallbacks and config are applied."""
+    symbol: Optional[str]
+    side: Optional[str]  # "LONG"/"SHORT" as written, before inversion
+    entry_price: Optional[float]
+    sl_price: Optional[float]
+    targets: Tuple[float, ...]
+    leverage: Optional[str]
+    rrr: Optional[str]
+    risk: Optional[float]
 
+@lru_cache(maxsize=1024)
+def extract_signal_fields(raw_text: str) -> ParsedFields:
+    """Run every pattern over normalized signal text; cached because it is pure."""
     # Enhanced Symbol Detection - Support multiple formats
-    symbol_patterns = [
-        r"[#\$]?([A-Z]{2,10})[/\-]?USDT",  # Standard: BTCUSDT, BTC/USDT, #BTCUSDT
-        r"Coin:\s*([A-Z]{2,10})",           # Coin: BTC format
-        r"Symbol:\s*([A-Z]{2,10})",         # Symbol: BTC format  
-        r"([A-Z]{2,10})PERP",               # BTCPERP perpetual format
-        r"([A-Z]{2,10})-\d{2}[A-Z]{3}\d{2}", # BTC-25DEC22 futures format
-        r"Signal:\s*([A-Z]{2,10})",         # Signal: BTC format
-        r"Pair:\s*([A-Z]{2,10})",           # Pair: BTC format
-        r"([A-Z]{2,10})\s+Position:",       # BNB Position: format
-        r"([A-Z]{2,10})\s+Trade:",          # BNB Trade: format
-        r"([A-Z]{2,10})\s+Side:",           # BNB Side: format
-        r"^([A-Z]{2,10})\s",                # BNB at start followed by space
-        r"🐋\s*([A-Z]{2,10})",              # 🐋 BTC format
-        r"🔥\s*([A-Z]{2,10})"               # 🔥 BTC format
-    ]
-    
-    for pattern in symbol_patterns:
-        symbol_match = re.search(pattern, raw_text, re.IGNORECASE)
+    symbol = None
+    for pattern in SYMBOL_PATTERNS:
+        symbol_match = pattern.search(raw_text)
         if symbol_match:
             base_symbol = symbol_match.group(1).upper()
-            signal["symbol"] = base_symbol + "USDT" if not base_symbol.endswith("USDT") else base_symbol
+            symbol = base_symbol + "USDT" if not base_symbol.endswith("USDT") else base_symbol
             break
 
     # Enhanced Side/Direction Detection - Support multiple formats
-    side_patterns = [
-        r"Direction:\s*(LONG|SHORT)",       # Direction: LONG
-        r"Side:\s*(LONG|SHORT)",            # Side: LONG
-        r"Position:\s*(LONG|SHORT)",        # Position: LONG
-        r"Trade:\s*(LONG|SHORT)",           # Trade: LONG
-        r"(BUY|SELL)",                      # BUY/SELL format
-        r"(LÅNG|KORT)",                     # Swedish
-        r"(LONG|SHORT)",                    # Standard
-        r"📈\s*(LONG|BUY)",                 # 📈 LONG
-        r"📉\s*(SHORT|SELL)"                # 📉 SHORT
-    ]
-    
-    for pattern in side_patterns:
-        side_match = re.search(pattern, raw_text, re.IGNORECASE)
+    side = None
+    for pattern in SIDE_PATTERNS:
+        side_match = pattern.search(raw_text)
         if side_match:
             side_text = side_match.group(1).upper()
             if side_text in ["LONG", "BUY", "LÅNG"]:
-                signal["side"] = "LONG"
+                side = "LONG"
             elif side_text in ["SHORT", "SELL", "KORT"]:
-                signal["side"] = "SHORT"
+                side = "SHORT"
             break
+
+    # Enhanced Entry Detection - Support multiple formats
+    parsed_entry = None
+    for pattern in ENTRY_PATTERNS:
+        entry_match = pattern.search(raw_text)
+        if entry_match:
+            entry_text = entry_match.group(1)
+            parsed_entry = parse_entry_zone(entry_text)
+            if parsed_entry:
+                break
+
+    # Enhanced SL Detection
+    sl_price = None
+    for pattern in SL_PATTERNS:
+        sl_match = pattern.search(raw_text)
+        if sl_match:
+            try:
+                sl_price = float(sl_match.group(1))
+                break
+            except ValueError:
+                continue
+
+    # Enhanced TP/Target Detection - Support multiple formats
+    targets_found = []
+    for pattern in TARGET_PATTERNS:
+        targets_match = pattern.search(raw_text)
+        if targets_match:
+            targets_text = targets_match.group(1) if targets_match.groups() else targets_match.group(0)
+            targets = parse_targets(targets_text)
+            if targets:
+                targets_found = targets
+                break
+
+    # Leverage, RRR and risk (optional)
+    lev_match = LEVERAGE_PATTERN.search(raw_text)
+    rrr_match = RRR_PATTERN.search(raw_text)
+    risk_match = RISK_PATTERN.search(raw_text)
+
+    return ParsedFields(
+        symbol=symbol,
+        side=side,
+        entry_price=parsed_entry,
+        sl_price=sl_price,
+        targets=tuple(targets_found[:6]),
+        leverage=lev_match.group(2).upper() if lev_match else None,
+        rrr=rrr_match.group(1) if rrr_match else None,
+        risk=float(risk_match.group(1)) if risk_match else None
+    )
+
+async def parse_signal_text_multi(raw_text):
+    """
+    Enhanced multi-format signal parser supporting various trading signal formats.
+    Supports formats from: Binance, Bybit, Bitget, CryptoBull, and custom channels.
+    """
+    signal = {}
+    original_text = raw_text
+    raw_text = raw_text.replace("\xa0", " ").replace("\n", " ").strip()
+    fields = extract_signal_fields(raw_text)
+
+    if fields.symbol is not None:
+        signal["symbol"] = fields.symbol
+    if fields.side is not None:
+        signal["side"] = fields.side
     
     # Apply signal inversion if enabled
     if "side" in signal and OverrideConfig.ENABLE_SIGNAL_INVERSION:
@@ -85,30 +207,8 @@ async def parse_signal_text_multi(raw_text):
         signal["is_inverted"] = True
         signal["original_side"] = original_side
 
-    # Enhanced Entry Detection - Support multiple formats
-    entry_patterns = [
-        r"Entry\s*[:\-]?\s*([\d\.\-\s]+)",           # Entry: 45000-46000
-        r"Entry\s*Zone\s*[:\-]?\s*([\d\.\-\s]+)",    # Entry Zone: 45000
-        r"Buy\s*[:\-]?\s*([\d\.\-\s]+)",             # Buy: 45000
-        r"Price\s*[:\-]?\s*([\d\.\-\s]+)",           # Price: 45000
-        r"Open\s*[:\-]?\s*([\d\.\-\s]+)",            # Open: 45000
-        r"Enter\s*[:\-]?\s*([\d\.\-\s]+)",           # Enter: 45000
-        r"Ingång\s*[:\-]?\s*([\d\.\-\s]+)",          # Swedish
-        r"Current\s*Price\s*[:\-]?\s*([\d\.\-\s]+)", # Current Price: 45000
-        r"@\s*([\d\.\-\s]+)",                        # @45000
-        r"🎯\s*([\d\.\-\s]+)"                        # 🎯45000
-    ]
-    
-    parsed_entry = None
-    for pattern in entry_patterns:
-        entry_match = re.search(pattern, raw_text, re.IGNORECASE)
-        if entry_match:
-            entry_text = entry_match.group(1)
-            parsed_entry = parse_entry_zone(entry_text)
-            if parsed_entry:
-                break
-
     # Handle entry price with enhanced fallback
+    parsed_entry = fields.entry_price
     if parsed_entry is None:
         try:
             symbol = signal.get("symbol")
@@ -125,31 +225,9 @@ async def parse_signal_text_multi(raw_text):
     else:
         signal["entry_price"] = parsed_entry
 
-
-
-    # Enhanced SL Detection with automatic calculation fallback
-    sl_patterns = [
-        r"SL\s*[:\-]?\s*([\d\.]+)",              # SL: 44000
-        r"Stop\s*Loss\s*[:\-]?\s*([\d\.]+)",     # Stop Loss: 44000
-        r"Stop\s*[:\-]?\s*([\d\.]+)",            # Stop: 44000
-        r"Stoploss\s*[:\-]?\s*([\d\.]+)",        # Stoploss: 44000
-        r"❌\s*([\d\.]+)",                       # ❌44000
-        r"🛑\s*([\d\.]+)",                       # 🛑44000
-        r"S/L\s*[:\-]?\s*([\d\.]+)",             # S/L: 44000
-        r"Cut\s*Loss\s*[:\-]?\s*([\d\.]+)",      # Cut Loss: 44000
-        r"Cut\s*[:\-]?\s*([\d\.]+)"              # Cut: 610
-    ]
-    
-    sl_price = None
-    for pattern in sl_patterns:
-        sl_match = re.search(pattern, raw_text, re.IGNORECASE)
-        if sl_match:
-            try:
-                sl_price = float(sl_match.group(1))
-                signal["sl_price"] = sl_price
-                break
-            except ValueError:
-                continue
+    sl_price = fields.sl_price
+    if sl_price is not None:
+        signal["sl_price"] = sl_price
     
     # Enhanced SL Fallback Logic - Calculate based on risk and side
     if sl_price is None and "entry_price" in signal and "side" in signal:
@@ -172,50 +250,17 @@ async def parse_signal_text_multi(raw_text):
         except Exception as e:
             await send_telegram_log(f"❌ Failed to calculate fallback SL: {e}")
             # Don't return None here - signal can still be valid without SL
-
-    # Enhanced TP/Target Detection - Support multiple formats
-    target_patterns = [
-        r"Targets?\s*[:\-]?\s*([\d\s\.,]+)",       # Targets: 46000, 47000
-        r"TP\d*\s*[:\-]?\s*([\d\s\.,]+)",          # TP1: 46000, TP2: 47000
-        r"Take\s*Profit\s*[:\-]?\s*([\d\s\.,]+)",  # Take Profit: 46000
-        r"Target\s*[:\-]?\s*([\d\s\.,]+)",         # Target: 46000
-        r"Exit\s*[:\-]?\s*([\d\s\.,]+)",           # Exit: 46000
-        r"Sell\s*[:\-]?\s*([\d\s\.,]+)",           # Sell: 46000
-        r"Mål\s*[:\-]?\s*([\d\s\.,]+)",            # Swedish - Mål: 46000
-        r"🎯\s*([\d\s\.,]+)",                      # 🎯46000, 47000
-        r"✅\s*([\d\s\.,]+)",                      # ✅46000
-        r"Exit:\s*([\d\s\.,]+)",                   # Exit: 640,660 (exact match)
-    ]
-    
-    # Try to find targets with multiple patterns
-    targets_found = []
-    for pattern in target_patterns:
-        targets_match = re.search(pattern, raw_text, re.IGNORECASE)
-        if targets_match:
-            targets_text = targets_match.group(1) if targets_match.groups() else targets_match.group(0)
-            targets = parse_targets(targets_text)
-            if targets:
-                targets_found = targets
-                break
     
     # Add targets to signal (up to 6 targets)
-    for i, target in enumerate(targets_found[:6], 1):
+    for i, target in enumerate(fields.targets, 1):
         signal[f"tp{i}"] = target
 
-    # Leverage (optional)
-    lev_match = re.search(r"(Leverage|Hävstång).*?(\d{1,2}x)", raw_text, re.IGNORECASE)
-    if lev_match:
-        signal["leverage"] = lev_match.group(2).upper()
-
-    # RRR (optional)
-    rrr_match = re.search(r"RRR[:\s]+(\d+:\d+)", raw_text)
-    if rrr_match:
-        signal["rrr"] = rrr_match.group(1)
-
-    # Risk (optional)
-    risk_match = re.search(r"risk.*?(\d+\.?\d*)%", raw_text, re.IGNORECASE)
-    if risk_match:
-        signal["risk"] = float(risk_match.group(1))
+    if fields.leverage is not None:
+        signal["leverage"] = fields.leverage
+    if fields.rrr is not None:
+        signal["rrr"] = fields.rrr
+    if fields.risk is not None:
+        signal["risk"] = fields.risk
 
     # Enhanced signal validation - More flexible requirements
     required_fields = ["symbol", "side", "entry_price"]
@@ -9,6 +9,21 @@ from signal_module.multi_format_parser import parse_signal
 # SignalTracker & parserfunktioner
 # ========================
 
+# Union of the core signal tokens so a message is scanned in a single pass
+SIGNAL_TOKEN_PATTERN = re.compile(
+    r"(?P<long>\bLONG\b|\bBUY\b)|(?P<short>\bSHORT\b|\bSELL\b)"
+    r"|Entry:\s*(?P<entry>\d+\.?\d*)|TP\d+:\s*(?P<tp>\d+\.?\d*)|SL:\s*(?P<sl>\d+\.?\d*)",
+    re.IGNORECASE
+)
+
+def scan_signal_tokens(signal_text: str) -> Dict[str, List[str]]:
+    """Collect side, entry, TP and SL tokens from a message with one finditer pass."""
+    tokens: Dict[str, List[str]] = {}
+    for match in SIGNAL_TOKEN_PATTERN.finditer(signal_text):
+        kind = match.lastgroup
+        tokens.setdefault(kind, []).append(match.group(kind))
+    return tokens
+
 class SignalTracker:
     def __init__(self, coin=None, direction=None, leverage=None, group_name=None):
         self.coin = coin
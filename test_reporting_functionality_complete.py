@@ -30,6 +30,22 @@ sys.modules['utils.logger'] = type('MockModule', (), {
     'log_event': MockLogger.log_event
 })
 
+# Import the reporting module once; if it is missing or broken every test below
+# would fail the same way, so skip (or exit) here instead of repeating it 14 times.
+import importlib
+try:
+    reporting = importlib.import_module("monitor.reporting")
+except Exception as e:
+    if __name__ == "__main__":
+        print(f"❌ monitor.reporting unavailable: {e}")
+        sys.exit(1)
+    import pytest
+    pytest.skip("monitor.reporting unavailable", allow_module_level=True)
+
+TradeReport = reporting.TradeReport
+TradeReporter = reporting.TradeReporter
+generate_trade_report = reporting.generate_trade_report
+
 def test_reporting_configuration():
     """Test reporting configuration."""
     print("🧪 Testing Reporting Configuration")
@@ -52,462 +68,388 @@ def test_reporting_module_import():
     """Test that reporting module can be imported."""
     print("\n📦 Testing Reporting Module Import")
     
-    try:
-        from monitor.reporting import TradeReport, TradeReporter, generate_trade_report
-        print("   ✅ Reporting module imported successfully")
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to import reporting module: {e}")
-        return False
+    print(f"   • TradeReport: {TradeReport.__name__}")
+    print(f"   • TradeReporter: {TradeReporter.__name__}")
+    print(f"   • generate_trade_report: {generate_trade_report.__name__}")
+    print("   ✅ Reporting module imported successfully")
+    return True
 
 def test_trade_report_dataclass():
     """Test TradeReport dataclass creation."""
     print("\n📊 Testing TradeReport Dataclass")
     
-    try:
-        from monitor.reporting import TradeReport
-        
-        # Create a sample trade report
-        report = TradeReport(
-            symbol="BTCUSDT",
-            side="LONG",
-            entry_price=64000.0,
-            exit_price=66000.0,
-            quantity=0.1,
-            leverage=10.0,
-            entry_time=datetime.now() - timedelta(hours=2),
-            exit_time=datetime.now(),
-            exit_reason="TP",
-            pnl_percentage=3.125,
-            pnl_usdt=200.0,
-            tp_hits=[1.5, 3.0],
-            group_name="test_group",
-            pyramiding_steps=[{"trigger_pol": 1.5, "step": 1}],
-            reentry_attempts=0,
-            break_even_triggered=True,
-            trailing_activated=False,
-            final_sl_price=63000.0
-        )
-        
-        print(f"   • Symbol: {report.symbol}")
-        print(f"   • Side: {report.side}")
-        print(f"   • Entry Price: ${report.entry_price:,.2f}")
-        print(f"   • Exit Price: ${report.exit_price:,.2f}")
-        print(f"   • P&L: {report.pnl_percentage:.2f}%")
-        print(f"   • Exit Reason: {report.exit_reason}")
-        print(f"   • TP Hits: {len(report.tp_hits)}")
-        print(f"   • Group: {report.group_name}")
-        
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to test TradeReport dataclass: {e}")
-        return False
+    # Create a sample trade report
+    report = TradeReport(
+        symbol="BTCUSDT",
+        side="LONG",
+        entry_price=64000.0,
+        exit_price=66000.0,
+        quantity=0.1,
+        leverage=10.0,
+        entry_time=datetime.now() - timedelta(hours=2),
+        exit_time=datetime.now(),
+        exit_reason="TP",
+        pnl_percentage=3.125,
+        pnl_usdt=200.0,
+        tp_hits=[1.5, 3.0],
+        group_name="test_group",
+        pyramiding_steps=[{"trigger_pol": 1.5, "step": 1}],
+        reentry_attempts=0,
+        break_even_triggered=True,
+        trailing_activated=False,
+        final_sl_price=63000.0
+    )
+    
+    print(f"   • Symbol: {report.symbol}")
+    print(f"   • Side: {report.side}")
+    print(f"   • Entry Price: ${report.entry_price:,.2f}")
+    print(f"   • Exit Price: ${report.exit_price:,.2f}")
+    print(f"   • P&L: {report.pnl_percentage:.2f}%")
+    print(f"   • Exit Reason: {report.exit_reason}")
+    print(f"   • TP Hits: {len(report.tp_hits)}")
+    print(f"   • Group: {report.group_name}")
+    
+    return True
 
 def test_trade_reporter_creation():
     """Test TradeReporter class creation."""
     print("\n📈 Testing TradeReporter Creation")
     
-    try:
-        from monitor.reporting import TradeReporter
-        
-        reporter = TradeReporter()
-        
-        print(f"   • Trade history length: {len(reporter.trade_history)}")
-        print(f"   • Daily stats keys: {list(reporter.daily_stats.keys())}")
-        print(f"   • Reporter instance created successfully")
-        
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to test TradeReporter creation: {e}")
-        return False
+    reporter = TradeReporter()
+    
+    print(f"   • Trade history length: {len(reporter.trade_history)}")
+    print(f"   • Daily stats keys: {list(reporter.daily_stats.keys())}")
+    print(f"   • Reporter instance created successfully")
+    
+    return True
 
 def test_summary_formatting():
     """Test trade summary formatting."""
     print("\n📝 Testing Summary Formatting")
     
-    try:
-        from monitor.reporting import TradeReport, TradeReporter
-        
-        # Create a sample trade report
-        report = TradeReport(
-            symbol="ETHUSDT",
-            side="SHORT",
-            entry_price=3200.0,
-            exit_price=3100.0,
-            quantity=1.0,
-            leverage=20.0,
-            entry_time=datetime.now() - timedelta(hours=1),
-            exit_time=datetime.now(),
-            exit_reason="SL",
-            pnl_percentage=-3.125,
-            pnl_usdt=-100.0,
-            tp_hits=[],
-            group_name="cryptoraketen",
-            pyramiding_steps=[],
-            reentry_attempts=1,
-            break_even_triggered=False,
-            trailing_activated=False,
-            final_sl_price=3300.0
-        )
-        
-        reporter = TradeReporter()
-        summary = reporter.format_trade_summary(report)
-        
-        print(f"   • Summary length: {len(summary)} characters")
-        print(f"   • Contains symbol: {'ETHUSDT' in summary}")
-        print(f"   • Contains P&L: {'-3.12' in summary}")
-        print(f"   • Contains exit reason: {'SL' in summary}")
-        print(f"   • Contains group name: {'cryptoraketen' in summary}")
-        
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to test summary formatting: {e}")
-        return False
+    # Create a sample trade report
+    report = TradeReport(
+        symbol="ETHUSDT",
+        side="SHORT",
+        entry_price=3200.0,
+        exit_price=3100.0,
+        quantity=1.0,
+        leverage=20.0,
+        entry_time=datetime.now() - timedelta(hours=1),
+        exit_time=datetime.now(),
+        exit_reason="SL",
+        pnl_percentage=-3.125,
+        pnl_usdt=-100.0,
+        tp_hits=[],
+        group_name="cryptoraketen",
+        pyramiding_steps=[],
+        reentry_attempts=1,
+        break_even_triggered=False,
+        trailing_activated=False,
+        final_sl_price=3300.0
+    )
+    
+    reporter = TradeReporter()
+    summary = reporter.format_trade_summary(report)
+    
+    print(f"   • Summary length: {len(summary)} characters")
+    print(f"   • Contains symbol: {'ETHUSDT' in summary}")
+    print(f"   • Contains P&L: {'-3.12' in summary}")
+    print(f"   • Contains exit reason: {'SL' in summary}")
+    print(f"   • Contains group name: {'cryptoraketen' in summary}")
+    
+    return True
 
 def test_detailed_analysis():
     """Test detailed analysis generation."""
     print("\n📊 Testing Detailed Analysis")
     
-    try:
-        from monitor.reporting import TradeReport, TradeReporter
-        
-        # Create a sample trade report with advanced features
-        report = TradeReport(
-            symbol="SOLUSDT",
-            side="LONG",
-            entry_price=100.0,
-            exit_price=110.0,
-            quantity=10.0,
-            leverage=15.0,
-            entry_time=datetime.now() - timedelta(hours=3),
-            exit_time=datetime.now(),
-            exit_reason="TP",
-            pnl_percentage=10.0,
-            pnl_usdt=1000.0,
-            tp_hits=[1.5, 3.0, 6.0, 10.0],
-            group_name="smart_crypto_signals",
-            pyramiding_steps=[
-                {"trigger_pol": 1.5, "step": 1, "quantity": 2.5},
-                {"trigger_pol": 3.0, "step": 2, "quantity": 2.5}
-            ],
-            reentry_attempts=2,
-            break_even_triggered=True,
-            trailing_activated=True,
-            final_sl_price=105.0
-        )
-        
-        reporter = TradeReporter()
-        analysis = reporter.format_detailed_analysis(report)
-        
-        print(f"   • Analysis length: {len(analysis)} characters")
-        print(f"   • Contains risk metrics: {'Risk Metrics' in analysis}")
-        print(f"   • Contains performance metrics: {'Performance Metrics' in analysis}")
-        print(f"   • Contains trade management: {'Trade Management' in analysis}")
-        print(f"   • Contains pyramiding analysis: {'Pyramiding Analysis' in analysis}")
-        print(f"   • Contains re-entry analysis: {'Re-entry Analysis' in analysis}")
-        
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to test detailed analysis: {e}")
-        return False
+    # Create a sample trade report with advanced features
+    report = TradeReport(
+        symbol="SOLUSDT",
+        side="LONG",
+        entry_price=100.0,
+        exit_price=110.0,
+        quantity=10.0,
+        leverage=15.0,
+        entry_time=datetime.now() - timedelta(hours=3),
+        exit_time=datetime.now(),
+        exit_reason="TP",
+        pnl_percentage=10.0,
+        pnl_usdt=1000.0,
+        tp_hits=[1.5, 3.0, 6.0, 10.0],
+        group_name="smart_crypto_signals",
+        pyramiding_steps=[
+            {"trigger_pol": 1.5, "step": 1, "quantity": 2.5},
+            {"trigger_pol": 3.0, "step": 2, "quantity": 2.5}
+        ],
+        reentry_attempts=2,
+        break_even_triggered=True,
+        trailing_activated=True,
+        final_sl_price=105.0
+    )
+    
+    reporter = TradeReporter()
+    analysis = reporter.format_detailed_analysis(report)
+    
+    print(f"   • Analysis length: {len(analysis)} characters")
+    print(f"   • Contains risk metrics: {'Risk Metrics' in analysis}")
+    print(f"   • Contains performance metrics: {'Performance Metrics' in analysis}")
+    print(f"   • Contains trade management: {'Trade Management' in analysis}")
+    print(f"   • Contains pyramiding analysis: {'Pyramiding Analysis' in analysis}")
+    print(f"   • Contains re-entry analysis: {'Re-entry Analysis' in analysis}")
+    
+    return True
 
 def test_daily_summary():
     """Test daily summary generation."""
     print("\n📅 Testing Daily Summary")
     
-    try:
-        from monitor.reporting import TradeReporter
-        
-        reporter = TradeReporter()
-        
-        # Test empty daily summary
-        empty_summary = reporter.get_daily_summary()
-        print(f"   • Empty summary: {len(empty_summary)} characters")
-        print(f"   • Contains 'No trading activity': {'No trading activity' in empty_summary}")
-        
-        # Test with specific date
-        specific_summary = reporter.get_daily_summary("2024-01-01")
-        print(f"   • Specific date summary: {len(specific_summary)} characters")
-        
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to test daily summary: {e}")
-        return False
+    reporter = TradeReporter()
+    
+    # Test empty daily summary
+    empty_summary = reporter.get_daily_summary()
+    print(f"   • Empty summary: {len(empty_summary)} characters")
+    print(f"   • Contains 'No trading activity': {'No trading activity' in empty_summary}")
+    
+    # Test with specific date
+    specific_summary = reporter.get_daily_summary("2024-01-01")
+    print(f"   • Specific date summary: {len(specific_summary)} characters")
+    
+    return True
 
 def test_reporting_integration():
     """Test reporting integration with trade state."""
     print("\n🔗 Testing Reporting Integration")
     
-    try:
-        from monitor.reporting import generate_trade_report
-        
-        # Test that the function exists and can be called
-        print(f"   • generate_trade_report function available: {generate_trade_report is not None}")
-        print(f"   • Function signature: {generate_trade_report.__name__}")
-        
-        # Note: We can't test the actual function call without a real trade state
-        # but we can verify the function exists and is properly defined
-        print(f"   • Integration function ready for use")
-        
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to test reporting integration: {e}")
-        return False
+    # Test that the function exists and can be called
+    print(f"   • generate_trade_report function available: {generate_trade_report is not None}")
+    print(f"   • Function signature: {generate_trade_report.__name__}")
+    
+    # Note: We can't test the actual function call without a real trade state
+    # but we can verify the function exists and is properly defined
+    print(f"   • Integration function ready for use")
+    
+    return True
 
 def test_exit_logic_integration():
     """Test exit logic integration."""
     print("\n🚪 Testing Exit Logic Integration")
     
-    try:
-        # Mock the exit functions to avoid import errors
-        class MockExitFunctions:
-            @staticmethod
-            def exit_trade(symbol, side, group_name=None):
-                return True
-            
-            @staticmethod
-            def close_trade_state(symbol, group_name=None, exit_reason="UNKNOWN", exit_price=None):
-                return True
-        
-        print(f"   • exit_trade function structure verified")
-        print(f"   • close_trade_state function structure verified")
-        print(f"   • Both functions should now include reporting calls")
+    # Mock the exit functions to avoid import errors
+    class MockExitFunctions:
+        @staticmethod
+        def exit_trade(symbol, side, group_name=None):
+            return True
         
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to test exit logic integration: {e}")
-        return False
+        @staticmethod
+        def close_trade_state(symbol, group_name=None, exit_reason="UNKNOWN", exit_price=None):
+            return True
+    
+    print(f"   • exit_trade function structure verified")
+    print(f"   • close_trade_state function structure verified")
+    print(f"   • Both functions should now include reporting calls")
+    
+    return True
 
 def test_configuration_behavior():
     """Test behavior based on configuration."""
     print("\n⚙️ Testing Configuration Behavior")
     
-    try:
-        # Test when reporting is enabled
-        if OverrideConfig.TELEGRAM_REPORT_ENABLED:
-            print("   • Reports should be sent to Telegram")
-            print("   • Recipients: " + ", ".join(OverrideConfig.REPORT_RECIPIENTS))
-        else:
-            print("   • Reports should be generated but not sent")
-        
-        # Test detailed analysis configuration
-        if OverrideConfig.REPORT_DETAILED_ANALYSIS:
-            print("   • Detailed analysis should be included")
-        else:
-            print("   • Only summary should be included")
-        
-        # Test pyramiding configuration
-        if OverrideConfig.REPORT_INCLUDE_PYRAMIDING:
-            print("   • Pyramiding information should be included")
-        else:
-            print("   • Pyramiding information should be excluded")
-        
-        # Test re-entry configuration
-        if OverrideConfig.REPORT_INCLUDE_REENTRY:
-            print("   • Re-entry information should be included")
-        else:
-            print("   • Re-entry information should be excluded")
-        
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to test configuration behavior: {e}")
-        return False
+    # Test when reporting is enabled
+    if OverrideConfig.TELEGRAM_REPORT_ENABLED:
+        print("   • Reports should be sent to Telegram")
+        print("   • Recipients: " + ", ".join(OverrideConfig.REPORT_RECIPIENTS))
+    else:
+        print("   • Reports should be generated but not sent")
+    
+    # Test detailed analysis configuration
+    if OverrideConfig.REPORT_DETAILED_ANALYSIS:
+        print("   • Detailed analysis should be included")
+    else:
+        print("   • Only summary should be included")
+    
+    # Test pyramiding configuration
+    if OverrideConfig.REPORT_INCLUDE_PYRAMIDING:
+        print("   • Pyramiding information should be included")
+    else:
+        print("   • Pyramiding information should be excluded")
+    
+    # Test re-entry configuration
+    if OverrideConfig.REPORT_INCLUDE_REENTRY:
+        print("   • Re-entry information should be included")
+    else:
+        print("   • Re-entry information should be excluded")
+    
+    return True
 
 def test_trade_report_generation():
     """Test complete trade report generation process."""
     print("\n🔄 Testing Trade Report Generation")
     
-    try:
-        from monitor.reporting import TradeReporter, TradeReport
-        
-        # Create a mock trade state
-        class MockTradeState:
-            def __init__(self):
-                self.symbol = "BTCUSDT"
-                self.side = "LONG"
-                self.entry_price = 64000.0
-                self.sl_price = 63000.0
-                self.leverage = 10.0
-                self.quantity = 0.1
-                self.tp_hits = [1.5, 3.0]
-                self.pyramid_steps_completed = [{"trigger_pol": 1.5, "step": 1}]
-                self.reentry_attempts = 0
-                self.breakeven_triggered = True
-                self.trailing_active = False
-        
-        mock_trade_state = MockTradeState()
-        reporter = TradeReporter()
-        
-        # Test report generation
-        report = reporter.generate_trade_report(
-            mock_trade_state, 
-            66000.0,  # exit price
-            "TP",
-            "test_group"
-        )
-        
-        if report:
-            print(f"   • Report generated successfully for {report.symbol}")
-            print(f"   • P&L calculated: {report.pnl_percentage:.2f}%")
-            print(f"   • Exit reason: {report.exit_reason}")
-            print(f"   • Group name: {report.group_name}")
-            return True
-        else:
-            print(f"   • Report generation failed")
-            return False
-            
-    except Exception as e:
-        print(f"   ❌ Failed to test trade report generation: {e}")
+    # Create a mock trade state
+    class MockTradeState:
+        def __init__(self):
+            self.symbol = "BTCUSDT"
+            self.side = "LONG"
+            self.entry_price = 64000.0
+            self.sl_price = 63000.0
+            self.leverage = 10.0
+            self.quantity = 0.1
+            self.tp_hits = [1.5, 3.0]
+            self.pyramid_steps_completed = [{"trigger_pol": 1.5, "step": 1}]
+            self.reentry_attempts = 0
+            self.breakeven_triggered = True
+            self.trailing_active = False
+    
+    mock_trade_state = MockTradeState()
+    reporter = TradeReporter()
+    
+    # Test report generation
+    report = reporter.generate_trade_report(
+        mock_trade_state, 
+        66000.0,  # exit price
+        "TP",
+        "test_group"
+    )
+    
+    if report:
+        print(f"   • Report generated successfully for {report.symbol}")
+        print(f"   • P&L calculated: {report.pnl_percentage:.2f}%")
+        print(f"   • Exit reason: {report.exit_reason}")
+        print(f"   • Group name: {report.group_name}")
+        return True
+    else:
+        print(f"   • Report generation failed")
         return False
 
 def test_daily_stats_update():
     """Test daily statistics update functionality."""
     print("\n📈 Testing Daily Stats Update")
     
-    try:
-        from monitor.reporting import TradeReporter, TradeReport
-        
-        reporter = TradeReporter()
-        
-        # Create a test report
-        test_report = TradeReport(
-            symbol="ETHUSDT",
-            side="LONG",
-            entry_price=3200.0,
-            exit_price=3300.0,
-            quantity=1.0,
-            leverage=20.0,
-            entry_time=datetime.now() - timedelta(hours=1),
-            exit_time=datetime.now(),
-            exit_reason="TP",
-            pnl_percentage=3.125,
-            pnl_usdt=100.0,
-            tp_hits=[1.5, 3.0],
-            group_name="test_group",
-            pyramiding_steps=[],
-            reentry_attempts=0,
-            break_even_triggered=False,
-            trailing_activated=False,
-            final_sl_price=3150.0
-        )
-        
-        # Update daily stats
-        reporter._update_daily_stats(test_report)
-        
-        # Check if stats were updated
-        today = datetime.now().date().isoformat()
-        if today in reporter.daily_stats:
-            stats = reporter.daily_stats[today]
-            print(f"   • Total trades: {stats['total_trades']}")
-            print(f"   • Winning trades: {stats['winning_trades']}")
-            print(f"   • Total P&L: {stats['total_pnl_percentage']:.2f}%")
-            print(f"   • Symbols traded: {list(stats['symbols_traded'])}")
-            return True
-        else:
-            print(f"   • Daily stats not updated")
-            return False
-            
-    except Exception as e:
-        print(f"   ❌ Failed to test daily stats update: {e}")
+    reporter = TradeReporter()
+    
+    # Create a test report
+    test_report = TradeReport(
+        symbol="ETHUSDT",
+        side="LONG",
+        entry_price=3200.0,
+        exit_price=3300.0,
+        quantity=1.0,
+        leverage=20.0,
+        entry_time=datetime.now() - timedelta(hours=1),
+        exit_time=datetime.now(),
+        exit_reason="TP",
+        pnl_percentage=3.125,
+        pnl_usdt=100.0,
+        tp_hits=[1.5, 3.0],
+        group_name="test_group",
+        pyramiding_steps=[],
+        reentry_attempts=0,
+        break_even_triggered=False,
+        trailing_activated=False,
+        final_sl_price=3150.0
+    )
+    
+    # Update daily stats
+    reporter._update_daily_stats(test_report)
+    
+    # Check if stats were updated
+    today = datetime.now().date().isoformat()
+    if today in reporter.daily_stats:
+        stats = reporter.daily_stats[today]
+        print(f"   • Total trades: {stats['total_trades']}")
+        print(f"   • Winning trades: {stats['winning_trades']}")
+        print(f"   • Total P&L: {stats['total_pnl_percentage']:.2f}%")
+        print(f"   • Symbols traded: {list(stats['symbols_traded'])}")
+        return True
+    else:
+        print(f"   • Daily stats not updated")
         return False
 
 def test_telegram_sending_logic():
     """Test Telegram sending logic (mocked)."""
     print("\n📱 Testing Telegram Sending Logic")
     
+    reporter = TradeReporter()
+    
+    # Create a test report
+    test_report = TradeReport(
+        symbol="SOLUSDT",
+        side="SHORT",
+        entry_price=100.0,
+        exit_price=95.0,
+        quantity=5.0,
+        leverage=15.0,
+        entry_time=datetime.now() - timedelta(hours=2),
+        exit_time=datetime.now(),
+        exit_reason="SL",
+        pnl_percentage=-5.0,
+        pnl_usdt=-250.0,
+        tp_hits=[],
+        group_name="test_group",
+        pyramiding_steps=[],
+        reentry_attempts=1,
+        break_even_triggered=False,
+        trailing_activated=False,
+        final_sl_price=105.0
+    )
+    
+    # Test sending logic (mocked)
+    print(f"   • Report formatting completed")
+    print(f"   • Summary length: {len(reporter.format_trade_summary(test_report))}")
+    print(f"   • Analysis length: {len(reporter.format_detailed_analysis(test_report))}")
+    print(f"   • Telegram sending logic ready (mocked)")
+    
+    return True
+
+def test_error_handling():
+    """Test error handling in reporting system."""
+    print("\n🛠️ Testing Error Handling")
+    
+    reporter = TradeReporter()
+    
+    # Test with invalid data
     try:
-        from monitor.reporting import TradeReporter, TradeReport
-        
-        reporter = TradeReporter()
-        
-        # Create a test report
-        test_report = TradeReport(
-            symbol="SOLUSDT",
-            side="SHORT",
-            entry_price=100.0,
-            exit_price=95.0,
-            quantity=5.0,
-            leverage=15.0,
-            entry_time=datetime.now() - timedelta(hours=2),
+        # This should handle gracefully
+        invalid_report = TradeReport(
+            symbol="",
+            side="INVALID",
+            entry_price=0.0,
+            exit_price=0.0,
+            quantity=0.0,
+            leverage=0.0,
+            entry_time=datetime.now(),
             exit_time=datetime.now(),
-            exit_reason="SL",
-            pnl_percentage=-5.0,
-            pnl_usdt=-250.0,
+            exit_reason="",
+            pnl_percentage=0.0,
+            pnl_usdt=0.0,
             tp_hits=[],
-            group_name="test_group",
+            group_name=None,
             pyramiding_steps=[],
-            reentry_attempts=1,
+            reentry_attempts=0,
             break_even_triggered=False,
             trailing_activated=False,
-            final_sl_price=105.0
+            final_sl_price=None
         )
         
-        # Test sending logic (mocked)
-        print(f"   • Report formatting completed")
-        print(f"   • Summary length: {len(reporter.format_trade_summary(test_report))}")
-        print(f"   • Analysis length: {len(reporter.format_detailed_analysis(test_report))}")
-        print(f"   • Telegram sending logic ready (mocked)")
-        
-        return True
+        summary = reporter.format_trade_summary(invalid_report)
+        print(f"   • Invalid data handled gracefully")
         
     except Exception as e:
-        print(f"   ❌ Failed to test Telegram sending logic: {e}")
-        return False
-
-def test_error_handling():
-    """Test error handling in reporting system."""
-    print("\n🛠️ Testing Error Handling")
+        print(f"   • Error handling working: {type(e).__name__}")
     
+    # Test with missing data
     try:
-        from monitor.reporting import TradeReporter, TradeReport
-        
-        reporter = TradeReporter()
-        
-        # Test with invalid data
-        try:
-            # This should handle gracefully
-            invalid_report = TradeReport(
-                symbol="",
-                side="INVALID",
-                entry_price=0.0,
-                exit_price=0.0,
-                quantity=0.0,
-                leverage=0.0,
-                entry_time=datetime.now(),
-                exit_time=datetime.now(),
-                exit_reason="",
-                pnl_percentage=0.0,
-                pnl_usdt=0.0,
-                tp_hits=[],
-                group_name=None,
-                pyramiding_steps=[],
-                reentry_attempts=0,
-                break_even_triggered=False,
-                trailing_activated=False,
-                final_sl_price=None
-            )
-            
-            summary = reporter.format_trade_summary(invalid_report)
-            print(f"   • Invalid data handled gracefully")
-            
-        except Exception as e:
-            print(f"   • Error handling working: {type(e).__name__}")
-        
-        # Test with missing data
-        try:
-            # This should also handle gracefully
-            empty_summary = reporter.get_daily_summary("invalid-date")
-            print(f"   • Missing data handled gracefully")
-            
-        except Exception as e:
-            print(f"   • Error handling working: {type(e).__name__}")
-        
-        print(f"   • Error handling robust")
-        return True
+        # This should also handle gracefully
+        empty_summary = reporter.get_daily_summary("invalid-date")
+        print(f"   • Missing data handled gracefully")
         
     except Exception as e:
-        print(f"   ❌ Failed to test error handling: {e}")
-        return False
+        print(f"   • Error handling working: {type(e).__name__}")
+    
+    print(f"   • Error handling robust")
+    return True
 
 def main():
     """Run all reporting functionality tests."""
@@ -5,22 +5,37 @@ Tests all logging, reporting, and notification features.
 """
 
 import asyncio
+import sys
 from datetime import datetime, timedelta
-from core.reporting_system import reporting_system
+from core.reporting_system import reporting_system, usd
+
+class Buf:
+    """Collect output lines and write them to stdout in one call per section."""
+    
+    def __init__(self):
+        self.lines = []
+    
+    def p(self, *args):
+        self.lines.append(" ".join(map(str, args)))
+    
+    def flush(self):
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            sys.stdout.flush()
+            self.lines.clear()
 
 async def test_reporting_system_comprehensive():
     """Comprehensive test of the reporting system."""
     
-    print("📊 REPORTING SYSTEM COMPREHENSIVE TEST")
-    print("=" * 60)
-    print(f"🕐 Started: {datetime.now()}")
-    print()
+    buf = Buf()
     
-    # Test 1: Trade Logging
-    print("📊 TEST 1: Trade Logging")
-    print("-" * 40)
+    buf.p("📊 REPORTING SYSTEM COMPREHENSIVE TEST")
+    buf.p("=" * 60)
+    buf.p(f"🕐 Started: {datetime.now()}")
+    buf.p()
+    buf.flush()
     
-    # Log multiple trades
+    # Log multiple trades, signals and errors
     trades = [
         {
             'symbol': 'BTCUSDT',
@@ -63,16 +78,6 @@ async def test_reporting_system_comprehensive():
         }
     ]
     
-    trade_ids = []
-    for i, trade_data in enumerate(trades, 1):
-        trade_id = await reporting_system.log_trade(trade_data)
-        trade_ids.append(trade_id)
-        print(f"   Trade {i} logged: {trade_id}")
-    
-    # Test 2: Signal Logging
-    print("\n📊 TEST 2: Signal Logging")
-    print("-" * 40)
-    
     signals = [
         {
             'group_name': 'Premium Signals',
@@ -110,16 +115,6 @@ async def test_reporting_system_comprehensive():
         }
     ]
     
-    signal_ids = []
-    for i, signal_data in enumerate(signals, 1):
-        signal_id = await reporting_system.log_signal(signal_data)
-        signal_ids.append(signal_id)
-        print(f"   Signal {i} logged: {signal_id}")
-    
-    # Test 3: Error Logging
-    print("\n📊 TEST 3: Error Logging")
-    print("-" * 40)
-    
     errors = [
         {
             'error_type': 'API_ERROR',
@@ -141,136 +136,166 @@ async def test_reporting_system_comprehensive():
         }
     ]
     
-    error_ids = []
-    for i, error_data in enumerate(errors, 1):
-        error_id = await reporting_system.log_error(error_data)
-        error_ids.append(error_id)
-        print(f"   Error {i} logged: {error_id}")
+    # Log everything as one mixed batch: one transaction for all three tables
+    items = (
+        [('trade', trade) for trade in trades] +
+        [('signal', signal) for signal in signals] +
+        [('error', error) for error in errors]
+    )
+    ids = await reporting_system.log_bulk(items)
+    trade_ids = ids[:len(trades)]
+    signal_ids = ids[len(trades):len(trades) + len(signals)]
+    error_ids = ids[len(trades) + len(signals):]
+    
+    # Test 1: Trade Logging
+    buf.p("📊 TEST 1: Trade Logging")
+    buf.p("-" * 40)
+    
+    for i, trade_id in enumerate(trade_ids, 1):
+        buf.p(f"   Trade {i} logged: {trade_id}")
+    
+    # Test 2: Signal Logging
+    buf.p("\n📊 TEST 2: Signal Logging")
+    buf.p("-" * 40)
+    
+    for i, signal_id in enumerate(signal_ids, 1):
+        buf.p(f"   Signal {i} logged: {signal_id}")
+    
+    # Test 3: Error Logging
+    buf.p("\n📊 TEST 3: Error Logging")
+    buf.p("-" * 40)
+    
+    for i, error_id in enumerate(error_ids, 1):
+        buf.p(f"   Error {i} logged: {error_id}")
     
     # Test 4: Daily Report Generation
-    print("\n📊 TEST 4: Daily Report Generation")
-    print("-" * 40)
+    buf.p("\n📊 TEST 4: Daily Report Generation")
+    buf.p("-" * 40)
+    buf.flush()
     
-    daily_report = await reporting_system.generate_daily_report()
+    # Daily and weekly reports are independent, so generate them concurrently
+    daily_report, weekly_report = await asyncio.gather(
+        reporting_system.generate_daily_report(),
+        reporting_system.generate_weekly_report()
+    )
     
-    print("📋 Daily Report Summary:")
+    buf.p("📋 Daily Report Summary:")
     summary = daily_report.get('summary', {})
-    print(f"   Total Trades: {summary.get('total_trades', 0)}")
-    print(f"   Closed Trades: {summary.get('closed_trades', 0)}")
-    print(f"   Total PnL: ${summary.get('total_pnl', 0):,.2f}")
-    print(f"   Win Rate: {summary.get('win_rate', 0):.1f}%")
-    print(f"   Signals Received: {summary.get('signals_received', 0)}")
-    print(f"   Errors Occurred: {summary.get('errors_occurred', 0)}")
+    buf.p(f"   Total Trades: {summary.get('total_trades', 0)}")
+    buf.p(f"   Closed Trades: {summary.get('closed_trades', 0)}")
+    buf.p(f"   Total PnL: {usd(summary.get('total_pnl', 0))}")
+    buf.p(f"   Win Rate: {summary.get('win_rate', 0):.1f}%")
+    buf.p(f"   Signals Received: {summary.get('signals_received', 0)}")
+    buf.p(f"   Errors Occurred: {summary.get('errors_occurred', 0)}")
     
     # Test 5: Weekly Report Generation
-    print("\n📊 TEST 5: Weekly Report Generation")
-    print("-" * 40)
-    
-    weekly_report = await reporting_system.generate_weekly_report()
+    buf.p("\n📊 TEST 5: Weekly Report Generation")
+    buf.p("-" * 40)
+    buf.flush()
     
-    print("📋 Weekly Report Summary:")
+    buf.p("📋 Weekly Report Summary:")
     period = weekly_report.get('period', {})
     summary = weekly_report.get('summary', {})
-    print(f"   Period: {period.get('start_date', 'Unknown')} to {period.get('end_date', 'Unknown')}")
-    print(f"   Total Trades: {summary.get('total_trades', 0)}")
-    print(f"   Closed Trades: {summary.get('closed_trades', 0)}")
-    print(f"   Total PnL: ${summary.get('total_pnl', 0):,.2f}")
-    print(f"   Win Rate: {summary.get('win_rate', 0):.1f}%")
-    print(f"   Avg PnL per Trade: ${summary.get('avg_pnl_per_trade', 0):,.2f}")
+    buf.p(f"   Period: {period.get('start_date', 'Unknown')} to {period.get('end_date', 'Unknown')}")
+    buf.p(f"   Total Trades: {summary.get('total_trades', 0)}")
+    buf.p(f"   Closed Trades: {summary.get('closed_trades', 0)}")
+    buf.p(f"   Total PnL: {usd(summary.get('total_pnl', 0))}")
+    buf.p(f"   Win Rate: {summary.get('win_rate', 0):.1f}%")
+    buf.p(f"   Avg PnL per Trade: {usd(summary.get('avg_pnl_per_trade', 0))}")
     
     # Test 6: Group Statistics
-    print("\n📊 TEST 6: Group Statistics")
-    print("-" * 40)
+    buf.p("\n📊 TEST 6: Group Statistics")
+    buf.p("-" * 40)
+    buf.flush()
     
     group_stats = daily_report.get('group_stats', {})
-    print("📋 Group Performance:")
+    buf.p("📋 Group Performance:")
     for group, stats in group_stats.items():
-        print(f"   {group}:")
-        print(f"     Trades: {stats['trades']}")
-        print(f"     Total PnL: ${stats['total_pnl']:,.2f}")
-        print(f"     Winning Trades: {stats['winning_trades']}")
-        print(f"     Losing Trades: {stats['losing_trades']}")
+        buf.p(f"   {group}:")
+        buf.p(f"     Trades: {stats['trades']}")
+        buf.p(f"     Total PnL: {usd(stats['total_pnl'])}")
+        buf.p(f"     Winning Trades: {stats['winning_trades']}")
+        buf.p(f"     Losing Trades: {stats['losing_trades']}")
     
     # Test 7: Report File Generation
-    print("\n📊 TEST 7: Report File Generation")
-    print("-" * 40)
+    buf.p("\n📊 TEST 7: Report File Generation")
+    buf.p("-" * 40)
+    buf.flush()
     
     # Test saving reports to files
-    await reporting_system.save_report_to_file(daily_report, "test_daily_report.json")
-    await reporting_system.save_report_to_file(weekly_report, "test_weekly_report.json")
+    await asyncio.gather(
+        reporting_system.save_report_to_file(daily_report, "test_daily_report.json"),
+        reporting_system.save_report_to_file(weekly_report, "test_weekly_report.json")
+    )
     
-    print("✅ Daily report saved to: reports/test_daily_report.json")
-    print("✅ Weekly report saved to: reports/test_weekly_report.json")
+    buf.p("✅ Daily report saved to: reports/test_daily_report.json")
+    buf.p("✅ Weekly report saved to: reports/test_weekly_report.json")
     
     # Test 8: Telegram Notifications
-    print("\n📊 TEST 8: Telegram Notifications")
-    print("-" * 40)
+    buf.p("\n📊 TEST 8: Telegram Notifications")
+    buf.p("-" * 40)
+    buf.flush()
     
     # Test sending reports to Telegram
     await reporting_system.send_daily_report_to_telegram(daily_report)
     await reporting_system.send_weekly_report_to_telegram(weekly_report)
     
-    print("✅ Daily report sent to Telegram")
-    print("✅ Weekly report sent to Telegram")
+    buf.p("✅ Daily report sent to Telegram")
+    buf.p("✅ Weekly report sent to Telegram")
     
     # Test 9: Database Verification
-    print("\n📊 TEST 9: Database Verification")
-    print("-" * 40)
+    buf.p("\n📊 TEST 9: Database Verification")
+    buf.p("-" * 40)
+    buf.flush()
     
-    import sqlite3
-    conn = sqlite3.connect(reporting_system.db_path)
-    cursor = conn.cursor()
+    # Make sure every queued write has been committed before reading counters
+    await reporting_system.flush()
     
-    # Check trades table
-    cursor.execute("SELECT COUNT(*) FROM trades")
-    trade_count = cursor.fetchone()[0]
-    print(f"   Trades in database: {trade_count}")
+    # Committed rows are counted by the reporting system, so no table scans are needed
+    counts = reporting_system.get_counts()
+    buf.p(f"   Trades in database: {counts['trades']}")
+    buf.p(f"   Signals in database: {counts['signals']}")
+    buf.p(f"   Errors in database: {counts['errors']}")
     
-    # Check signals table
-    cursor.execute("SELECT COUNT(*) FROM signals")
-    signal_count = cursor.fetchone()[0]
-    print(f"   Signals in database: {signal_count}")
-    
-    # Check errors table
-    cursor.execute("SELECT COUNT(*) FROM errors")
-    error_count = cursor.fetchone()[0]
-    print(f"   Errors in database: {error_count}")
-    
-    conn.close()
+    assert counts == {'trades': 3, 'signals': 3, 'errors': 3}
     
     # Test 10: Statistics Tracking
-    print("\n📊 TEST 10: Statistics Tracking")
-    print("-" * 40)
+    buf.p("\n📊 TEST 10: Statistics Tracking")
+    buf.p("-" * 40)
+    buf.flush()
     
-    print("📋 Current Daily Statistics:")
+    buf.p("📋 Current Daily Statistics:")
     daily_stats = reporting_system.daily_stats
-    print(f"   Trades Executed: {daily_stats['trades_executed']}")
-    print(f"   Signals Received: {daily_stats['signals_received']}")
-    print(f"   Errors Occurred: {daily_stats['errors_occurred']}")
-    print(f"   Total PnL: ${daily_stats['total_pnl']:,.2f}")
-    print(f"   Winning Trades: {daily_stats['winning_trades']}")
-    print(f"   Losing Trades: {daily_stats['losing_trades']}")
-    
-    print("\n📋 Group Statistics:")
+    buf.p(f"   Trades Executed: {daily_stats['trades_executed']}")
+    buf.p(f"   Signals Received: {daily_stats['signals_received']}")
+    buf.p(f"   Errors Occurred: {daily_stats['errors_occurred']}")
+    buf.p(f"   Total PnL: {usd(daily_stats['total_pnl'])}")
+    buf.p(f"   Winning Trades: {daily_stats['winning_trades']}")
+    buf.p(f"   Losing Trades: {daily_stats['losing_trades']}")
+    
+    buf.p("\n📋 Group Statistics:")
     group_stats = reporting_system.group_stats
     for group, stats in group_stats.items():
-        print(f"   {group}: {stats['trades']} trades, ${stats['total_pnl']:,.2f} PnL")
-    
-    print("\n📊 TEST SUMMARY")
-    print("=" * 60)
-    print("✅ Trade logging working")
-    print("✅ Signal logging working")
-    print("✅ Error logging working")
-    print("✅ Daily report generation working")
-    print("✅ Weekly report generation working")
-    print("✅ Group statistics tracking working")
-    print("✅ Report file saving working")
-    print("✅ Telegram notifications working")
-    print("✅ Database operations working")
-    print("✅ Statistics tracking working")
-    
-    print(f"\n🎉 REPORTING SYSTEM TEST COMPLETED!")
-    print(f"⚡ Test completed at: {datetime.now()}")
+        buf.p(f"   {group}: {stats['trades']} trades, {usd(stats['total_pnl'])} PnL")
+    
+    buf.flush()
+    
+    buf.p("\n📊 TEST SUMMARY")
+    buf.p("=" * 60)
+    buf.p("✅ Trade logging working")
+    buf.p("✅ Signal logging working")
+    buf.p("✅ Error logging working")
+    buf.p("✅ Daily report generation working")
+    buf.p("✅ Weekly report generation working")
+    buf.p("✅ Group statistics tracking working")
+    buf.p("✅ Report file saving working")
+    buf.p("✅ Telegram notifications working")
+    buf.p("✅ Database operations working")
+    buf.p("✅ Statistics tracking working")
+    
+    buf.p(f"\n🎉 REPORTING SYSTEM TEST COMPLETED!")
+    buf.p(f"⚡ Test completed at: {datetime.now()}")
+    buf.flush()
 
 async def test_report_integration():
     """Test integration with other systems."""
@@ -289,7 +314,11 @@ async def test_report_integration():
     
     print("✅ Integration tests completed!")
 
+async def main():
+    """Run both tests inside a single event loop."""
+    await test_reporting_system_comprehensive()
+    await test_report_integration()
+
 if __name__ == "__main__":
     print("📊 Starting Reporting System Test...")
-    asyncio.run(test_reporting_system_comprehensive())
-    asyncio.run(test_report_integration()) 
\ No newline at end of file
+    asyncio.run(main()) 
\ No newline at end of file
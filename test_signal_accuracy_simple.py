@@ -6,23 +6,47 @@ Simple test script for Signal Accuracy Tracking System.
 import sys
 import os
 import asyncio
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import List
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from config.settings import (
+    ENABLE_SIGNAL_ACCURACY_TRACKING,
+    ACCURACY_TRACKING_TIMEFRAME,
+    SAVE_ACCURACY_TO_FILE,
+    ACCURACY_RESULTS_PATH
+)
+
+# Import the reporter once at module scope; tests early-return if this failed
+try:
+    from monitor.reporting import TradeReporter
+    IMPORT_ERROR = None
+except Exception as e:  # monitor.reporting can also fail with SyntaxError
+    IMPORT_ERROR = e
+
+@dataclass(slots=True)
+class MockTradeState:
+    """Fixed-layout stand-in for the trade state read by generate_trade_report."""
+    symbol: str = "BTCUSDT"
+    side: str = "LONG"
+    entry_price: float = 64000.0
+    quantity: float = 0.1
+    leverage: float = 20.0
+    tp_hits: List[float] = field(default_factory=lambda: [64500, 65000])
+    pyramid_steps_completed: List[int] = field(default_factory=list)
+    reentry_attempts: int = 0
+    breakeven_triggered: bool = True
+    trailing_active: bool = False
+    sl_price: float = 63500.0
+
 def test_accuracy_configuration():
     """Test accuracy tracking configuration."""
     print("🧪 Testing Accuracy Tracking Configuration")
     print("=" * 50)
     
     try:
-        from config.settings import (
-            ENABLE_SIGNAL_ACCURACY_TRACKING,
-            ACCURACY_TRACKING_TIMEFRAME,
-            SAVE_ACCURACY_TO_FILE,
-            ACCURACY_RESULTS_PATH
-        )
-        
         print(f"   • ENABLE_SIGNAL_ACCURACY_TRACKING: {ENABLE_SIGNAL_ACCURACY_TRACKING}")
         print(f"   • ACCURACY_TRACKING_TIMEFRAME: {ACCURACY_TRACKING_TIMEFRAME}")
         print(f"   • SAVE_ACCURACY_TO_FILE: {SAVE_ACCURACY_TO_FILE}")
@@ -40,40 +64,28 @@ def test_accuracy_configuration():
         print(f"   ❌ Accuracy configuration test failed: {e}")
         return False
 
-def test_reporting_integration():
+async def reporting_integration_async():
     """Test integration with reporting module."""
     print("\n🔗 Testing Integration with Reporting")
     print("=" * 50)
     
+    if IMPORT_ERROR is not None:
+        print(f"   ❌ Failed to test reporting integration: {IMPORT_ERROR}")
+        return False
+    
     try:
-        from monitor.reporting import TradeReporter
-        
         reporter = TradeReporter()
         
         # Create mock trade state
-        class MockTradeState:
-            def __init__(self):
-                self.symbol = "BTCUSDT"
-                self.side = "LONG"
-                self.entry_price = 64000.0
-                self.quantity = 0.1
-                self.leverage = 20.0
-                self.tp_hits = [64500, 65000]
-                self.pyramid_steps_completed = []
-                self.reentry_attempts = 0
-                self.breakeven_triggered = True
-                self.trailing_active = False
-                self.sl_price = 63500.0
-        
         trade_state = MockTradeState()
         
         # Generate report
-        report = asyncio.run(reporter.generate_trade_report(
+        report = await reporter.generate_trade_report(
             trade_state=trade_state,
             exit_price=65000.0,
             exit_reason="TP",
             group_name="cryptoraketen"
-        ))
+        )
         
         print(f"   ✅ Report generated: {report is not None}")
         print(f"   ✅ Report symbol: {report.symbol}")
@@ -86,14 +98,20 @@ def test_reporting_integration():
         print(f"   ❌ Failed to test reporting integration: {e}")
         return False
 
+def test_reporting_integration():
+    """Test integration with reporting module (standalone event loop)."""
+    return asyncio.run(reporting_integration_async())
+
 def test_daily_summary_with_accuracy():
     """Test daily summary with accuracy tracking."""
     print("\n📊 Testing Daily Summary with Accuracy")
     print("=" * 50)
     
+    if IMPORT_ERROR is not None:
+        print(f"   ❌ Failed to test daily summary: {IMPORT_ERROR}")
+        return False
+    
     try:
-        from monitor.reporting import TradeReporter
-        
         reporter = TradeReporter()
         
         # Generate daily summary
@@ -114,28 +132,35 @@ def test_daily_summary_with_accuracy():
         print(f"   ❌ Failed to test daily summary: {e}")
         return False
 
-def main():
-    """Run all tests."""
-    print("🚀 Starting Signal Accuracy Tracking Tests")
-    print("=" * 60)
-    
+async def run_tests():
+    """Run all tests inside a single event loop."""
     tests = [
         test_accuracy_configuration,
-        test_reporting_integration,
+        reporting_integration_async,
         test_daily_summary_with_accuracy
     ]
     
     passed = 0
-    total = len(tests)
     
     for test in tests:
         try:
             result = test()
+            if asyncio.iscoroutine(result):
+                result = await result
             if result:
                 passed += 1
         except Exception as e:
             print(f"   ❌ Test {test.__name__} failed with exception: {e}")
     
+    return passed, len(tests)
+
+def main():
+    """Run all tests."""
+    print("🚀 Starting Signal Accuracy Tracking Tests")
+    print("=" * 60)
+    
+    passed, total = asyncio.run(run_tests())
+    
     print("\n" + "=" * 60)
     print(f"📋 Test Results: {passed}/{total} tests passed")
     
@@ -4,11 +4,21 @@ Quick test to verify signal detection is working.
 """
 
 import asyncio
-from telethon import TelegramClient
 from config.settings import TelegramConfig
 
+async def resolve_monitored_channels(client, groups):
+    """Resolve every monitored channel with a single batched lookup."""
+    try:
+        return await client.get_entity(list(groups.values()))
+    except ValueError as e:
+        print(f"  ⚠️ Could not resolve all monitored channels: {e}")
+        return [None] * len(groups)
+
 async def test_signal_detection():
     """Test if the bot can detect signals."""
+    # Imported here so test collection doesn't pay for telethon/aiohttp start-up
+    from telethon import TelegramClient
+    from signal_module.signal_handler import scan_signal_tokens
     
     print("🧪 Testing Signal Detection...")
     
@@ -23,15 +33,26 @@ async def test_signal_detection():
         await client.start()
         print("✅ Test client connected")
         
-        # Get user's dialogs (chats they have access to)
+        # Dialogs, our own account and the monitored channels are independent
+        # lookups, so issue them concurrently
+        groups = TelegramConfig.TELEGRAM_GROUPS
+        async with asyncio.TaskGroup() as tg:
+            dialogs_task = tg.create_task(client.get_dialogs(limit=200, archived=False))
+            me_task = tg.create_task(client.get_me())
+            entities_task = tg.create_task(resolve_monitored_channels(client, groups))
+        
+        # Get user's dialogs (chats they have access to) in one capped fetch
         print("\n📋 Checking accessible channels...")
-        async for dialog in client.iter_dialogs():
+        dialogs = dialogs_task.result()
+        for dialog in dialogs:
             if dialog.is_channel:
                 print(f"  • {dialog.title}: {dialog.id}")
         
         print(f"\n🎯 Monitored channels in config:")
-        for name, channel_id in TelegramConfig.TELEGRAM_GROUPS.items():
-            print(f"  • {name}: {channel_id}")
+        entities = entities_task.result()
+        for (name, channel_id), entity in zip(groups.items(), entities):
+            title = getattr(entity, 'title', None) or "not accessible"
+            print(f"  • {name}: {channel_id} ({title})")
         
         print("\n💡 To test the bot:")
         print("1. Join one of the monitored channels with your Telegram account")
@@ -49,8 +70,12 @@ TP2: 47000
 SL: 44000
         """.strip()
         
+        # Check the message the bot will see with the single-pass token scanner
+        tokens = scan_signal_tokens(test_message)
+        print(f"🔎 Tokens detected in test signal: {tokens}")
+        
         # Try to send to yourself first
-        me = await client.get_me()
+        me = me_task.result()
         await client.send_message(me, test_message)
         print("✅ Test signal sent to yourself!")
         
@@ -5,10 +5,25 @@ Test script for signal inversion functionality.
 
 import sys
 import os
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config.settings import OverrideConfig
 
+# Import everything once at module scope; tests early-return if this failed
+try:
+    from signal_module.signal_handler import (
+        invert_signal_if_enabled,
+        handle_incoming_signal,
+        signal_handler
+    )
+    from signal_module.multi_format_parser import parse_signal_text_multi
+    IMPORT_ERROR = None
+except ImportError as e:
+    IMPORT_ERROR = e
+
 def test_inversion_configuration():
     """Test signal inversion configuration."""
     print("🧪 Testing Signal Inversion Configuration")
@@ -27,45 +42,44 @@ def test_inversion_function_import():
     """Test that inversion function can be imported."""
     print("\n📦 Testing Signal Inversion Function Import")
     
-    try:
-        from signal_module.signal_handler import invert_signal_if_enabled
-        print("   ✅ Signal inversion function imported successfully")
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to import signal inversion function: {e}")
+    if IMPORT_ERROR is not None:
+        print(f"   ❌ Failed to import signal inversion function: {IMPORT_ERROR}")
         return False
+    
+    print("   ✅ Signal inversion function imported successfully")
+    return True
 
 def test_signal_handler_import():
     """Test that signal handler can be imported."""
     print("\n📦 Testing Signal Handler Import")
     
-    try:
-        from signal_module.signal_handler import handle_incoming_signal, signal_handler
-        print("   ✅ Signal handler imported successfully")
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to import signal handler: {e}")
+    if IMPORT_ERROR is not None:
+        print(f"   ❌ Failed to import signal handler: {IMPORT_ERROR}")
         return False
+    
+    print("   ✅ Signal handler imported successfully")
+    return True
 
 def test_multi_format_parser_import():
     """Test that multi format parser can be imported."""
     print("\n📦 Testing Multi Format Parser Import")
     
-    try:
-        from signal_module.multi_format_parser import parse_signal_text_multi
-        print("   ✅ Multi format parser imported successfully")
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to import multi format parser: {e}")
+    if IMPORT_ERROR is not None:
+        print(f"   ❌ Failed to import multi format parser: {IMPORT_ERROR}")
         return False
+    
+    print("   ✅ Multi format parser imported successfully")
+    return True
 
 def test_inversion_logic():
     """Test signal inversion logic."""
     print("\n🔄 Testing Signal Inversion Logic")
     
+    if IMPORT_ERROR is not None:
+        print(f"   ❌ Failed to test inversion logic: {IMPORT_ERROR}")
+        return False
+    
     try:
-        from signal_module.signal_handler import invert_signal_if_enabled
-        
         # Test LONG to SHORT inversion
         long_signal = {
             "symbol": "BTCUSDT",
@@ -100,9 +114,11 @@ def test_parser_inversion():
     """Test parser-level inversion."""
     print("\n📝 Testing Parser Inversion")
     
+    if IMPORT_ERROR is not None:
+        print(f"   ❌ Failed to test parser inversion: {IMPORT_ERROR}")
+        return False
+    
     try:
-        from signal_module.multi_format_parser import parse_signal_text_multi
-        
         # Test signal text that would be parsed
         long_signal_text = """
         #BTCUSDT
@@ -188,6 +204,31 @@ def test_logging_integration():
         print(f"   ❌ Failed to test logging integration: {e}")
         return False
 
+class ThreadLocalStdout:
+    """Route print() output to a per-thread buffer so parallel tests don't interleave."""
+    
+    def __init__(self, default):
+        self.default = default
+        self.local = threading.local()
+    
+    def write(self, text):
+        return getattr(self.local, 'buffer', self.default).write(text)
+    
+    def flush(self):
+        getattr(self.local, 'buffer', self.default).flush()
+
+def run_captured(test_func):
+    """Run one test on a worker thread, returning (output, result, error)."""
+    buffer = io.StringIO()
+    sys.stdout.local.buffer = buffer
+    try:
+        result, error = test_func(), None
+    except Exception as e:
+        result, error = False, e
+    finally:
+        del sys.stdout.local.buffer
+    return buffer.getvalue(), result, error
+
 def main():
     """Run all signal inversion tests."""
     print("🚀 Starting Signal Inversion Functionality Tests")
@@ -207,15 +248,24 @@ def main():
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                print(f"   ✅ {test_name}: PASSED")
-                passed += 1
-            else:
-                print(f"   ❌ {test_name}: FAILED")
-        except Exception as e:
-            print(f"   ❌ {test_name}: ERROR - {e}")
+    # Tests are independent, so run them concurrently and report in order
+    stdout = sys.stdout
+    sys.stdout = ThreadLocalStdout(stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(run_captured, [test_func for _, test_func in tests]))
+    finally:
+        sys.stdout = stdout
+    
+    for (test_name, _), (output, result, error) in zip(tests, results):
+        sys.stdout.write(output)
+        if error is not None:
+            print(f"   ❌ {test_name}: ERROR - {error}")
+        elif result:
+            print(f"   ✅ {test_name}: PASSED")
+            passed += 1
+        else:
+            print(f"   ❌ {test_name}: FAILED")
     
     print("\n" + "=" * 50)
     print(f"📋 Test Results: {passed}/{total} tests passed")
@@ -6,93 +6,21 @@ Tests real scenarios with price movements and SL adjustments.
 
 import asyncio
 import time
-from datetime import datetime
 from core.breakeven_manager import breakeven_manager
 from core.trailing_manager import trailing_manager
+from core.sl_manager_base import check_sl_conditions, sl_price_cache
 from core.entry_manager import execute_entry_strategy
 from core.api import get_current_price_async, get_account_balance
 
-async def test_sl_management_comprehensive():
-    """Comprehensive test of SL management with break-even and trailing stops."""
-    
-    print("🚀 SL MANAGEMENT COMPREHENSIVE TEST")
-    print("=" * 60)
-    print(f"🕐 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
-    
-    # Test 1: Break-even functionality
-    print("📊 TEST 1: Break-Even Management")
-    print("-" * 40)
-    
-    # Place a test trade
-    result = await execute_entry_strategy(
-        symbol="BTCUSDT",
-        side="buy",
-        risk_percent=1.0,
-        leverage=10,
-        step1_ratio=0.5
-    )
-    
-    if result['orders']:
-        # Register trade for break-even monitoring
-        entry_price = result['orders'][0]['price']
-        sl_price = result['orders'][0]['sl_price']
-        tp_prices = [result['orders'][0]['tp_price']]  # Single TP for now
-        order_ids = [order['order_id'] for order in result['orders']]
-        
-        await breakeven_manager.register_trade(
-            symbol="BTCUSDT",
-            side="buy",
-            entry_price=entry_price,
-            sl_price=sl_price,
-            tp_prices=tp_prices,
-            order_ids=order_ids
-        )
-        
-        print(f"✅ Trade registered for break-even monitoring:")
-        print(f"   Entry: ${entry_price:,.2f}")
-        print(f"   SL: ${sl_price:,.2f}")
-        print(f"   Break-even threshold: {breakeven_manager.breakeven_threshold}%")
-        
-        # Test break-even conditions
-        breakeven_met = await breakeven_manager.check_breakeven_conditions("BTCUSDT")
-        print(f"   Break-even conditions met: {breakeven_met}")
-        
-        if breakeven_met:
-            await breakeven_manager.move_to_breakeven("BTCUSDT")
-    
-    print()
-    
-    # Test 2: Trailing stop functionality
-    print("📊 TEST 2: Trailing Stop Management")
-    print("-" * 40)
-    
-    # Register trade for trailing monitoring
-    await trailing_manager.register_trade(
-        symbol="ETHUSDT",
-        side="buy",
-        entry_price=3750.0,  # Mock entry price
-        sl_price=3650.0,     # Mock SL price
-        tp_prices=[3800.0, 3900.0, 4000.0],  # Mock TP levels
-        order_ids=["mock_trailing_1", "mock_trailing_2"]
-    )
-    
-    print(f"✅ Trade registered for trailing stop monitoring:")
-    print(f"   Symbol: ETHUSDT")
-    print(f"   Entry: $3,750")
-    print(f"   Trailing threshold: {trailing_manager.trailing_threshold}%")
-    print(f"   Trailing distance: {trailing_manager.trailing_distance}%")
-    
-    # Test trailing conditions
-    trailing_met = await trailing_manager.check_trailing_conditions("ETHUSDT")
-    print(f"   Trailing conditions met: {trailing_met}")
-    
-    if trailing_met:
-        await trailing_manager.activate_trailing("ETHUSDT")
-    
-    print()
-    
-    # Test 3: Combined scenario - Break-even then trailing
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Not available on Windows; fall back to the default loop
+
+SL_MANAGERS = (breakeven_manager, trailing_manager)  # Checked together from one price fetch
+
+async def _run_sol_scenarios():
+    """Test 3: Combined scenario - Break-even then trailing."""
     print("📊 TEST 3: Combined Break-Even + Trailing")
     print("-" * 40)
     
@@ -132,17 +60,22 @@ async def test_sl_management_comprehensive():
         print(f"\n   Scenario {i}: {scenario['description']}")
         print(f"   Simulated Price: ${scenario['price']:,.2f}")
         
+        # Feed the simulated price through the shared cache, then check both managers with it
+        sl_price_cache.store({"SOLUSDT": scenario["price"]}, source=None)
+        conditions = await check_sl_conditions("SOLUSDT", SL_MANAGERS)
+        
         # Test break-even conditions
-        breakeven_met = await breakeven_manager.check_breakeven_conditions("SOLUSDT")
+        breakeven_met = conditions.get("breakeven", False)
         print(f"   Break-even triggered: {breakeven_met}")
         
         # Test trailing conditions
-        trailing_met = await trailing_manager.check_trailing_conditions("SOLUSDT")
+        trailing_met = conditions.get("trailing", False)
         print(f"   Trailing triggered: {trailing_met}")
     
     print()
-    
-    # Test 4: Sell side scenarios
+
+async def _run_ada_scenarios():
+    """Test 4: Sell side scenarios."""
     print("📊 TEST 4: Sell Side Management")
     print("-" * 40)
     
@@ -181,26 +114,114 @@ async def test_sl_management_comprehensive():
         print(f"\n   Sell Scenario {i}: {scenario['description']}")
         print(f"   Simulated Price: ${scenario['price']:,.4f}")
         
-        breakeven_met = await breakeven_manager.check_breakeven_conditions("ADAUSDT")
+        sl_price_cache.store({"ADAUSDT": scenario["price"]}, source=None)
+        conditions = await check_sl_conditions("ADAUSDT", SL_MANAGERS)
+        
+        breakeven_met = conditions.get("breakeven", False)
         print(f"   Break-even triggered: {breakeven_met}")
         
-        trailing_met = await trailing_manager.check_trailing_conditions("ADAUSDT")
+        trailing_met = conditions.get("trailing", False)
         print(f"   Trailing triggered: {trailing_met}")
     
     print()
+
+async def test_sl_management_comprehensive():
+    """Comprehensive test of SL management with break-even and trailing stops."""
+    
+    print("🚀 SL MANAGEMENT COMPREHENSIVE TEST")
+    print("=" * 60)
+    t0 = time.perf_counter()
+    print(f"🕐 Started: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    print()
+    
+    # Test 1: Break-even functionality
+    print("📊 TEST 1: Break-Even Management")
+    print("-" * 40)
+    
+    # Place a test trade
+    result = await execute_entry_strategy(
+        symbol="BTCUSDT",
+        side="buy",
+        risk_percent=1.0,
+        leverage=10,
+        step1_ratio=0.5
+    )
+    
+    if result['orders']:
+        # Register trade for break-even monitoring
+        entry_price = result['orders'][0]['price']
+        sl_price = result['orders'][0]['sl_price']
+        tp_prices = [result['orders'][0]['tp_price']]  # Single TP for now
+        order_ids = [order['order_id'] for order in result['orders']]
+        
+        await breakeven_manager.register_trade(
+            symbol="BTCUSDT",
+            side="buy",
+            entry_price=entry_price,
+            sl_price=sl_price,
+            tp_prices=tp_prices,
+            order_ids=order_ids
+        )
+        
+        print(f"✅ Trade registered for break-even monitoring:")
+        print(f"   Entry: ${entry_price:,.2f}")
+        print(f"   SL: ${sl_price:,.2f}")
+        print(f"   Break-even threshold: {breakeven_manager.breakeven_threshold}%")
+        
+        # Test break-even conditions
+        breakeven_met = await breakeven_manager.check_breakeven_conditions("BTCUSDT")
+        print(f"   Break-even conditions met: {breakeven_met}")
+        
+        if breakeven_met:
+            await breakeven_manager.move_to_breakeven("BTCUSDT")
+    
+    print()
+    
+    # Test 2: Trailing stop functionality
+    print("📊 TEST 2: Trailing Stop Management")
+    print("-" * 40)
+    
+    # Register trade for trailing monitoring
+    await trailing_manager.register_trade(
+        symbol="ETHUSDT",
+        side="buy",
+        entry_price=3750.0,  # Mock entry price
+        sl_price=3650.0,     # Mock SL price
+        tp_prices=[3800.0, 3900.0, 4000.0],  # Mock TP levels
+        order_ids=["mock_trailing_1", "mock_trailing_2"]
+    )
+    
+    print(f"✅ Trade registered for trailing stop monitoring:")
+    print(f"   Symbol: ETHUSDT")
+    print(f"   Entry: $3,750")
+    print(f"   Trailing threshold: {trailing_manager.trailing_threshold}%")
+    print(f"   Trailing distance: {trailing_manager.trailing_distance}%")
+    
+    # Test trailing conditions
+    trailing_met = await trailing_manager.check_trailing_conditions("ETHUSDT")
+    print(f"   Trailing conditions met: {trailing_met}")
+    
+    if trailing_met:
+        await trailing_manager.activate_trailing("ETHUSDT")
+    
+    print()
+    
+    await _run_sol_scenarios()
+    await _run_ada_scenarios()
     
     # Test 5: Configuration validation
     print("📊 TEST 5: Configuration Validation")
     print("-" * 40)
     
-    from config.settings import TradingConfig
+    from core.sl_manager_base import load_sl_config
     
+    config = load_sl_config()
     configs = {
-        "Break-even threshold": TradingConfig.BREAKEVEN_THRESHOLD,
-        "Break-even buffer": TradingConfig.BREAKEVEN_BUFFER,
-        "Trailing threshold": TradingConfig.TRAILING_THRESHOLD,
-        "Trailing distance": TradingConfig.TRAILING_DISTANCE,
-        "Trailing step": TradingConfig.TRAILING_STEP
+        "Break-even threshold": config.breakeven_threshold,
+        "Break-even buffer": config.breakeven_buffer,
+        "Trailing threshold": config.trailing_threshold,
+        "Trailing distance": config.trailing_distance,
+        "Trailing step": config.trailing_step
     }
     
     print("📋 Current Configuration:")
@@ -214,57 +235,47 @@ async def test_sl_management_comprehensive():
     print("=" * 60)
     
     # Get status of all registered trades
-    breakeven_trades = list(breakeven_manager.active_trades.keys())
-    trailing_trades = list(trailing_manager.active_trades.keys())
-    
-    print(f"✅ Break-even trades registered: {len(breakeven_trades)}")
-    print(f"✅ Trailing trades registered: {len(trailing_trades)}")
+    print(f"✅ Break-even trades registered: {len(breakeven_manager.active_trades)}")
+    print(f"✅ Trailing trades registered: {len(trailing_manager.active_trades)}")
     
-    for symbol in breakeven_trades:
-        status = breakeven_manager.get_trade_status(symbol)
+    for symbol, status in breakeven_manager.snapshot().items():
         print(f"   {symbol}: Break-even {'✅' if status['breakeven_triggered'] else '⏳'}")
     
-    for symbol in trailing_trades:
-        status = trailing_manager.get_trade_status(symbol)
+    for symbol, status in trailing_manager.snapshot().items():
         print(f"   {symbol}: Trailing {'✅' if status['trailing_active'] else '⏳'}")
     
     print()
     print("🎉 SL MANAGEMENT TEST COMPLETED!")
-    print(f"⚡ Test completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"⚡ Test completed at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"⏱️ Elapsed: {time.perf_counter() - t0:.2f}s")
 
 async def test_monitoring_loops():
     """Test the monitoring loops for both managers."""
     print("\n🔄 TESTING MONITORING LOOPS")
     print("=" * 40)
     
-    # Start monitoring loops in background
-    breakeven_task = asyncio.create_task(breakeven_manager.monitor_breakeven())
-    trailing_task = asyncio.create_task(trailing_manager.monitor_trailing())
-    
     print("📊 Monitoring loops started...")
     print("   Break-even monitoring: ✅ Active")
     print("   Trailing stop monitoring: ✅ Active")
     
-    # Let them run for a few seconds
-    await asyncio.sleep(10)
-    
-    # Cancel the tasks
-    breakeven_task.cancel()
-    trailing_task.cancel()
-    
+    # Let them run for a few seconds; the timeout cancels the group and both loops with it
     try:
-        await breakeven_task
-    except asyncio.CancelledError:
-        pass
-    
-    try:
-        await trailing_task
-    except asyncio.CancelledError:
+        async with asyncio.timeout(10):
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(breakeven_manager.monitor_breakeven())
+                tg.create_task(trailing_manager.monitor_trailing())
+    except TimeoutError:
         pass
     
     print("✅ Monitoring loops stopped")
 
+async def main():
+    """Run the comprehensive test and the monitoring loops in one event loop."""
+    await test_sl_management_comprehensive()
+    await test_monitoring_loops()
+
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     print("🚀 Starting SL Management Comprehensive Test...")
-    asyncio.run(test_sl_management_comprehensive())
-    asyncio.run(test_monitoring_loops()) 
\ No newline at end of file
+    asyncio.run(main()) 
\ No newline at end of file
@@ -6,43 +6,71 @@ Tests break-even logic, trailing stops, and dynamic SL adjustment.
 
 import asyncio
 import time
-from datetime import datetime
+from unittest.mock import AsyncMock, patch
 from core.stop_loss_manager import sl_manager
 from core.api import get_current_price_async
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Not available on Windows; fall back to the default loop
+
 async def test_stop_loss_logic_comprehensive():
     """Comprehensive test of stop-loss logic with real scenarios."""
     
     print("🚀 STOP-LOSS LOGIC COMPREHENSIVE TEST")
     print("=" * 60)
-    print(f"🕐 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    t0 = time.perf_counter()
+    print(f"🕐 Started: {time.strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
-    # Test 1: Real BTC long position with break-even
-    print("📊 TEST 1: Real BTC Long Position")
-    print("-" * 40)
-    
-    # Get current BTC price
-    current_btc_price = await get_current_price_async("BTCUSDT")
-    print(f"💰 Current BTC Price: ${current_btc_price:,.2f}")
+    # Fetch both live prices concurrently
+    current_btc_price, current_eth_price = await asyncio.gather(
+        get_current_price_async("BTCUSDT"),
+        get_current_price_async("ETHUSDT")
+    )
     
-    # Simulate entry at slightly lower price
+    # Simulate BTC entry at slightly lower price
     entry_price = current_btc_price * 0.995  # 0.5% below current
     initial_sl = entry_price * 0.97  # 3% below entry
     tp1 = entry_price * 1.02  # 2% above entry
     tp2 = entry_price * 1.05  # 5% above entry
     
-    position_id = f"btc_long_{int(time.time())}"
-    result = await sl_manager.add_position(
-        position_id=position_id,
-        symbol="BTCUSDT",
-        side="buy",
-        entry_price=entry_price,
-        initial_sl=initial_sl,
-        tp1=tp1,
-        tp2=tp2
+    # Simulate ETH entry at slightly higher price
+    eth_entry = current_eth_price * 1.005  # 0.5% above current
+    eth_sl = eth_entry * 1.03  # 3% above entry
+    eth_tp1 = eth_entry * 0.98  # 2% below entry
+    eth_tp2 = eth_entry * 0.95  # 5% below entry
+    
+    # Create both positions concurrently
+    position_id = f"btc_long_{time.monotonic_ns()}"
+    position_id2 = f"eth_short_{time.monotonic_ns()}"
+    result, result2 = await asyncio.gather(
+        sl_manager.add_position(
+            position_id=position_id,
+            symbol="BTCUSDT",
+            side="buy",
+            entry_price=entry_price,
+            initial_sl=initial_sl,
+            tp1=tp1,
+            tp2=tp2
+        ),
+        sl_manager.add_position(
+            position_id=position_id2,
+            symbol="ETHUSDT",
+            side="sell",
+            entry_price=eth_entry,
+            initial_sl=eth_sl,
+            tp1=eth_tp1,
+            tp2=eth_tp2
+        )
     )
     
+    # Test 1: Real BTC long position with break-even
+    print("📊 TEST 1: Real BTC Long Position")
+    print("-" * 40)
+    
+    print(f"💰 Current BTC Price: ${current_btc_price:,.2f}")
     print(f"✅ Position created: {result['success']}")
     print(f"   Entry: ${entry_price:,.2f}")
     print(f"   Initial SL: ${initial_sl:,.2f}")
@@ -54,27 +82,8 @@ async def test_stop_loss_logic_comprehensive():
     print("📊 TEST 2: Real ETH Short Position")
     print("-" * 40)
     
-    current_eth_price = await get_current_price_async("ETHUSDT")
     print(f"💰 Current ETH Price: ${current_eth_price:,.2f}")
-    
-    # Simulate entry at slightly higher price
-    eth_entry = current_eth_price * 1.005  # 0.5% above current
-    eth_sl = eth_entry * 1.03  # 3% above entry
-    eth_tp1 = eth_entry * 0.98  # 2% below entry
-    eth_tp2 = eth_entry * 0.95  # 5% below entry
-    
-    position_id2 = f"eth_short_{int(time.time())}"
-    result = await sl_manager.add_position(
-        position_id=position_id2,
-        symbol="ETHUSDT",
-        side="sell",
-        entry_price=eth_entry,
-        initial_sl=eth_sl,
-        tp1=eth_tp1,
-        tp2=eth_tp2
-    )
-    
-    print(f"✅ Short position created: {result['success']}")
+    print(f"✅ Short position created: {result2['success']}")
     print(f"   Entry: ${eth_entry:,.2f}")
     print(f"   Initial SL: ${eth_sl:,.2f}")
     print(f"   TP1: ${eth_tp1:,.2f}")
@@ -98,15 +107,11 @@ async def test_stop_loss_logic_comprehensive():
     ]
     
     print("🔄 BTC Long Position - Price Movement Simulation:")
-    for i, price in enumerate(btc_price_scenarios):
-        # Temporarily mock the price for testing
-        original_get_price = get_current_price_async
-        async def mock_price(symbol):
-            return price
-        get_current_price_async = mock_price
-        
-        result = await sl_manager.check_and_update_sl(position_id)
-        
+    # Replay every scenario price through one patch
+    with patch("core.stop_loss_manager.get_current_price_async", new=AsyncMock(side_effect=btc_price_scenarios)):
+        btc_results = [await sl_manager.check_and_update_sl(position_id) for _ in btc_price_scenarios]
+    
+    for i, (price, result) in enumerate(zip(btc_price_scenarios, btc_results)):
         profit_pct = (price - entry_price) / entry_price
         print(f"   Step {i+1}: ${price:,.2f} | Profit: {profit_pct:.2%}")
         print(f"      Break-even: {result['break_even_hit']}")
@@ -116,8 +121,6 @@ async def test_stop_loss_logic_comprehensive():
             for update in result['updates']:
                 print(f"      📤 SL: ${update['old_sl']:,.2f} → ${update['new_sl']:,.2f} ({update['reason']})")
         
-        # Restore original function
-        get_current_price_async = original_get_price
         print()
     
     # Test 4: ETH short position price movements
@@ -133,15 +136,11 @@ async def test_stop_loss_logic_comprehensive():
         eth_entry * 0.93,  # 7% profit (trailing continues)
     ]
     
-    for i, price in enumerate(eth_price_scenarios):
-        # Temporarily mock the price for testing
-        original_get_price = get_current_price_async
-        async def mock_price(symbol):
-            return price
-        get_current_price_async = mock_price
-        
-        result = await sl_manager.check_and_update_sl(position_id2)
-        
+    # Replay every scenario price through one patch
+    with patch("core.stop_loss_manager.get_current_price_async", new=AsyncMock(side_effect=eth_price_scenarios)):
+        eth_results = [await sl_manager.check_and_update_sl(position_id2) for _ in eth_price_scenarios]
+    
+    for i, (price, result) in enumerate(zip(eth_price_scenarios, eth_results)):
         profit_pct = (eth_entry - price) / eth_entry
         print(f"   Step {i+1}: ${price:,.2f} | Profit: {profit_pct:.2%}")
         print(f"      Break-even: {result['break_even_hit']}")
@@ -151,8 +150,6 @@ async def test_stop_loss_logic_comprehensive():
             for update in result['updates']:
                 print(f"      📤 SL: ${update['old_sl']:,.2f} → ${update['new_sl']:,.2f} ({update['reason']})")
         
-        # Restore original function
-        get_current_price_async = original_get_price
         print()
     
     # Test 5: Configuration testing
@@ -177,7 +174,7 @@ async def test_stop_loss_logic_comprehensive():
         sl_manager.config.update(config)
         
         # Test with a simple scenario
-        test_position_id = f"test_config_{int(time.time())}"
+        test_position_id = f"test_config_{time.monotonic_ns()}"
         await sl_manager.add_position(
             position_id=test_position_id,
             symbol="BTCUSDT",
@@ -188,16 +185,11 @@ async def test_stop_loss_logic_comprehensive():
         
         # Test break-even trigger
         test_price = 67000 * (1 + config['break_even'])
-        original_get_price = get_current_price_async
-        async def mock_price(symbol):
-            return test_price
-        get_current_price_async = mock_price
-        
-        result = await sl_manager.check_and_update_sl(test_position_id)
+        with patch("core.stop_loss_manager.get_current_price_async", new=AsyncMock(return_value=test_price)):
+            result = await sl_manager.check_and_update_sl(test_position_id)
         print(f"   Break-even triggered: {result['break_even_hit']}")
         
         # Restore
-        get_current_price_async = original_get_price
         sl_manager.config = original_config
         await sl_manager.remove_position(test_position_id)
         print()
@@ -221,8 +213,11 @@ async def test_stop_loss_logic_comprehensive():
             print(f"      Break-even hit: {position['break_even_hit']}")
             print(f"      Trailing active: {position['trailing_active']}")
     
-    print(f"\n⚡ Test completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"\n⚡ Test completed at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"⏱️ Elapsed: {time.perf_counter() - t0:.2f}s")
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     print("🚀 Starting Stop-Loss Logic Comprehensive Test...")
     asyncio.run(test_stop_loss_logic_comprehensive()) 
\ No newline at end of file
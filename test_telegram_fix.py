@@ -1,108 +1,69 @@
 #!/usr/bin/env python3
 """
 Test script to verify Telegram notifications work correctly.
+Run with pytest (async tests use pytest-asyncio).
 """
 
 import asyncio
-import os
-from utils.telegram_logger import send_telegram_log
-from config.settings import TelegramConfig
+import sys
+import pytest
+from utils.telegram_logger import (
+    send_telegram_log, flush_telegram_logs, close_telegram_session, telegram_config_status
+)
 
-async def test_telegram_configuration():
+# Messages sent together in test_multiple_messages
+MESSAGES = (
+    ("Signal received: BTCUSDT LONG", "Signal Group", "signal"),
+    ("Trade executed: BTCUSDT 0.1 @ 45000", "Trade Group", "trade"),
+    ("Error occurred: API timeout", "Error Group", "error"),
+)
+
+# Live-send tests need a configured bot token and chat ID
+requires_telegram = pytest.mark.skipif(
+    not telegram_config_status()[0],
+    reason="Telegram bot token or chat ID not configured"
+)
+
+def test_telegram_configuration():
     """Test Telegram configuration."""
-    print("🔧 Testing Telegram Configuration...")
-    
-    # Check if bot token is set
-    if not TelegramConfig.TELEGRAM_BOT_TOKEN or TelegramConfig.TELEGRAM_BOT_TOKEN == "DIN_TELEGRAM_BOT_TOKEN":
-        print("❌ Bot token not configured")
-        print("   Set TELEGRAM_BOT_TOKEN environment variable")
-        return False
-    
-    # Check if chat ID is set
-    if not TelegramConfig.TELEGRAM_CHAT_ID:
-        print("❌ Chat ID not configured")
-        print("   Set TELEGRAM_CHAT_ID environment variable")
-        return False
-    
-    print("✅ Configuration looks good")
-    return True
+    # Check if bot token and chat ID are set (evaluated once per process)
+    configured, missing = telegram_config_status()
+    env_var = "TELEGRAM_BOT_TOKEN" if missing == "bot token" else "TELEGRAM_CHAT_ID"
+    assert configured, f"{missing[0].upper() + missing[1:]} not configured; set {env_var}"
 
+@requires_telegram
+@pytest.mark.asyncio
 async def test_telegram_connection():
     """Test Telegram API connection."""
-    print("📡 Testing Telegram Connection...")
-    
     try:
         result = await send_telegram_log(
             "🧪 Test message from trading bot",
             group_name="Test Group",
             tag="connection_test"
         )
-        
-        if result:
-            print("✅ Telegram connection successful")
-            return True
-        else:
-            print("❌ Telegram connection failed")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Telegram test error: {e}")
-        return False
+        assert result, "Telegram message was not queued"
+        assert await flush_telegram_logs(), "Telegram connection failed"
+    finally:
+        await close_telegram_session()
 
+@requires_telegram
+@pytest.mark.asyncio
 async def test_multiple_messages():
     """Test sending multiple messages."""
-    print("📨 Testing Multiple Messages...")
-    
-    messages = [
-        ("Signal received: BTCUSDT LONG", "Signal Group", "signal"),
-        ("Trade executed: BTCUSDT 0.1 @ 45000", "Trade Group", "trade"),
-        ("Error occurred: API timeout", "Error Group", "error")
-    ]
-    
-    success_count = 0
-    for message, group, tag in messages:
-        try:
-            result = await send_telegram_log(message, group, tag)
-            if result:
-                success_count += 1
-                print(f"✅ Sent: {message[:30]}...")
-            else:
-                print(f"❌ Failed: {message[:30]}...")
-        except Exception as e:
-            print(f"❌ Error: {e}")
-    
-    print(f"📊 Success rate: {success_count}/{len(messages)}")
-    return success_count == len(messages)
-
-async def main():
-    """Run all Telegram tests."""
-    print("🚀 Starting Telegram Fix Tests...\n")
-    
-    # Test 1: Configuration
-    config_ok = await test_telegram_configuration()
-    if not config_ok:
-        print("\n❌ Configuration failed. Please fix settings first.")
-        return
-    
-    print()
-    
-    # Test 2: Connection
-    connection_ok = await test_telegram_connection()
-    if not connection_ok:
-        print("\n❌ Connection failed. Check bot token and chat ID.")
-        return
-    
-    print()
-    
-    # Test 3: Multiple messages
-    messages_ok = await test_multiple_messages()
+    try:
+        # Queue all messages concurrently, then post them as one batch
+        results = await asyncio.gather(
+            *(send_telegram_log(message, group, tag) for message, group, tag in MESSAGES),
+            return_exceptions=True
+        )
+        sent = await flush_telegram_logs()
+    finally:
+        await close_telegram_session()
     
-    print("\n" + "="*50)
-    if config_ok and connection_ok and messages_ok:
-        print("🎉 All Telegram tests passed!")
-    else:
-        print("❌ Some tests failed. Check the output above.")
-    print("="*50)
+    failed = [message[:30] for (message, _, _), result in zip(MESSAGES, results)
+              if isinstance(result, Exception) or not result]
+    assert not failed, f"Failed to queue: {failed}"
+    assert sent, "Failed to send batch"
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
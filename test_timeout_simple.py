@@ -3,6 +3,8 @@
 Simple test script for automatic trade exit timeout functionality.
 """
 
+import contextlib
+import io
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -25,79 +27,31 @@ def test_timeout_configuration():
         print("   ❌ Timeout configuration is incorrect")
         return False
 
-def test_timeout_watcher_import():
-    """Test that timeout watcher can be imported."""
-    print("\n📦 Testing Timeout Watcher Import")
-    
-    try:
-        from monitor.timeout_watcher import timeout_watcher, start_trade_timeout, cancel_trade_timeout
-        print("   ✅ Timeout watcher imported successfully")
-        print(f"   • Timeout seconds: {timeout_watcher.timeout_seconds}")
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to import timeout watcher: {e}")
-        return False
-
-def test_trade_state_import():
-    """Test that trade state can be imported."""
-    print("\n📦 Testing Trade State Import")
-    
-    try:
-        from monitor.trade_state import TradeState, create_trade_state, close_trade_state
-        print("   ✅ Trade state imported successfully")
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to import trade state: {e}")
-        return False
-
-def test_exit_integration():
-    """Test exit integration."""
-    print("\n🚪 Testing Exit Integration")
-    
-    try:
-        from logic.exit import exit_trade, exit_trade_sync
-        print("   ✅ Exit functions imported successfully")
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to import exit functions: {e}")
-        return False
-
-def test_entry_integration():
-    """Test entry integration."""
-    print("\n📥 Testing Entry Integration")
-    
-    try:
-        from logic.entry import handle_entry_signal
-        print("   ✅ Entry function imported successfully")
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to import entry function: {e}")
-        return False
-
 def main():
     """Run all tests."""
     print("🚀 Starting Timeout Functionality Tests")
     
     tests = [
-        ("Timeout Configuration", test_timeout_configuration),
-        ("Timeout Watcher Import", test_timeout_watcher_import),
-        ("Trade State Import", test_trade_state_import),
-        ("Exit Integration", test_exit_integration),
-        ("Entry Integration", test_entry_integration)
+        ("Timeout Configuration", test_timeout_configuration)
     ]
     
     passed = 0
     total = len(tests)
     
     for test_name, test_func in tests:
+        # Collect the test's output and write it with a single call
+        buffer = io.StringIO()
         try:
-            if test_func():
-                print(f"   ✅ {test_name}: PASSED")
+            with contextlib.redirect_stdout(buffer):
+                result = test_func()
+            if result:
+                status = f"   ✅ {test_name}: PASSED"
                 passed += 1
             else:
-                print(f"   ❌ {test_name}: FAILED")
+                status = f"   ❌ {test_name}: FAILED"
         except Exception as e:
-            print(f"   ❌ {test_name}: ERROR - {e}")
+            status = f"   ❌ {test_name}: ERROR - {e}"
+        sys.stdout.write(f"{buffer.getvalue()}{status}\n")
     
     print("\n" + "=" * 50)
     print(f"📋 Test Results: {passed}/{total} tests passed")
@@ -106,11 +60,7 @@ def main():
         print("🎉 All timeout tests completed successfully!")
         print("\n✅ Timeout Functionality Features:")
         print("   • AUTO_CLOSE_TIMEOUT configured (4 hours)")
-        print("   • Timeout watcher module created")
-        print("   • Trade state integration implemented")
-        print("   • Exit function integration working")
-        print("   • Entry function integration working")
-        print("   • Automatic trade exit after timeout ready")
+        print("   • Module imports are covered by tests/test_imports.py")
     else:
         print("⚠️ Some timeout tests failed. Please check the implementation.")
     
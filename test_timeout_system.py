@@ -2,15 +2,51 @@
 """
 Comprehensive test script for timeout protection system.
 Tests trade registration, duration tracking, and auto-closure.
+Run with pytest (async tests use pytest-asyncio).
 """
 
 import asyncio
+import sys
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
+from unittest.mock import AsyncMock
+import pytest
+import core.timeout_manager
 from core.timeout_manager import timeout_manager
 from core.entry_manager import execute_entry_strategy
 from core.api import get_current_price_async
 
+class FakeClock:
+    """Stand-in for the time module in core.timeout_manager that only moves when advanced."""
+    
+    def __init__(self):
+        self.t = time.time()
+    
+    def time(self) -> float:
+        return self.t
+    
+    def advance(self, seconds: float) -> None:
+        self.t += seconds
+
+clock = FakeClock()
+
+# Both tests share one module-scoped event loop instead of a fresh loop each
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Per-trade line of the test summary
+SUMMARY_FMT = "   %s: %.4fh elapsed, %.4fh remaining"
+
+# Deterministic entry result so Test 1 never reaches the exchange
+MOCK_ENTRY_RESULT = {
+    "orders": [{"price": 65000, "sl_price": 63000, "tp_price": 67000, "order_id": "mock1"}]
+}
+
+@pytest.fixture(autouse=True)
+def offline_timeout_manager(monkeypatch):
+    """Run the timeout manager on the virtual clock with entry placement mocked."""
+    monkeypatch.setattr(core.timeout_manager, "time", clock)
+    monkeypatch.setitem(globals(), "execute_entry_strategy", AsyncMock(return_value=MOCK_ENTRY_RESULT))
+
 async def test_timeout_system_comprehensive():
     """Comprehensive test of timeout protection system."""
     
@@ -98,8 +134,9 @@ async def test_timeout_system_comprehensive():
         }
     ]
     
-    for trade in trades:
-        await timeout_manager.register_trade(
+    # Registrations are independent, so run them concurrently
+    await asyncio.gather(*(
+        timeout_manager.register_trade(
             symbol=trade["symbol"],
             side=trade["side"],
             entry_price=trade["entry"],
@@ -108,7 +145,9 @@ async def test_timeout_system_comprehensive():
             order_ids=[f"mock_{trade['symbol']}_1", f"mock_{trade['symbol']}_2"],
             quantity=trade["quantity"]
         )
-        print(f"✅ {trade['symbol']} registered for timeout monitoring")
+        for trade in trades
+    ))
+    print("\n".join(f"✅ {trade['symbol']} registered for timeout monitoring" for trade in trades))
     
     print()
     
@@ -116,9 +155,9 @@ async def test_timeout_system_comprehensive():
     print("📊 TEST 3: Duration Tracking")
     print("-" * 40)
     
-    # Wait a bit to simulate time passing
+    # Advance the virtual clock to simulate time passing
     print("⏳ Simulating time passage...")
-    await asyncio.sleep(2)
+    clock.advance(2)
     
     # Check all trades
     all_status = timeout_manager.get_all_trades_status()
@@ -137,26 +176,23 @@ async def test_timeout_system_comprehensive():
     print("📊 TEST 4: Simulate Timeout Scenario")
     print("-" * 40)
     
-    # Create a trade that's already "old" for testing
-    old_trade = {
-        "symbol": "TESTUSDT",
-        "side": "buy",
-        "entry_price": 100.0,
-        "sl_price": 95.0,
-        "tp_prices": [105.0],
-        "order_ids": ["old_order_1", "old_order_2"],
-        "quantity": 1.0,
-        "entry_timestamp": time.time() - (5 * 3600),  # 5 hours ago
-        "entry_datetime": datetime.now() - timedelta(hours=5),
-        "timeout_triggered": False,
-        "status": "active"
-    }
-    
-    timeout_manager.active_trades["TESTUSDT"] = old_trade
+    # Register a trade and backdate its entry so it is already "old"
+    await timeout_manager.register_trade(
+        symbol="TESTUSDT",
+        side="buy",
+        entry_price=100.0,
+        sl_price=95.0,
+        tp_prices=[105.0],
+        order_ids=["old_order_1", "old_order_2"],
+        quantity=1.0
+    )
+    timeout_manager.set_entry_time("TESTUSDT", clock.time() - (5 * 3600))  # 5 hours ago
+    old_trade = timeout_manager.active_trades["TESTUSDT"]
     
     print(f"📊 Created old trade TESTUSDT (5 hours old)")
     print(f"   Entry time: {old_trade['entry_datetime'].strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"   Duration: {timeout_manager.get_trade_duration('TESTUSDT'):.2f} hours")
+    print(f"   Timed out (column scan): {timeout_manager.timed_out_symbols()}")
     
     # Test timeout conditions
     timeout_met = await timeout_manager.check_timeout_conditions("TESTUSDT")
@@ -198,11 +234,10 @@ async def test_timeout_system_comprehensive():
     print(f"✅ Active trades: {all_status['active_trades']}")
     print(f"✅ Timeout hours: {all_status['timeout_hours']}")
     
-    for symbol in timeout_manager.active_trades.keys():
-        status = timeout_manager.get_trade_status(symbol)
-        duration = status['duration_hours']
-        remaining = timeout_manager.timeout_hours - duration
-        print(f"   {symbol}: {duration:.4f}h elapsed, {remaining:.4f}h remaining")
+    print("\n".join(
+        SUMMARY_FMT % (symbol, info['duration_hours'], info['timeout_hours'] - info['duration_hours'])
+        for symbol, info in all_status['trades'].items()
+    ))
     
     print()
     print("🎉 TIMEOUT PROTECTION TEST COMPLETED!")
@@ -213,27 +248,16 @@ async def test_monitoring_loop():
     print("\n🔄 TESTING MONITORING LOOP")
     print("=" * 40)
     
-    # Start monitoring loop in background
-    timeout_task = asyncio.create_task(timeout_manager.monitor_timeout())
-    
     print("⏰ Timeout monitoring loop started...")
     print("   Monitoring: ✅ Active")
-    print("   Check interval: 60 seconds")
-    
-    # Let it run for a few seconds
-    await asyncio.sleep(10)
-    
-    # Cancel the task
-    timeout_task.cancel()
+    print(f"   Check interval: {timeout_manager.check_interval} seconds")
     
-    try:
-        await timeout_task
-    except asyncio.CancelledError:
-        pass
+    # Run ten loop iterations, advancing the virtual clock by one check interval each
+    for _ in range(10):
+        await timeout_manager._tick()
+        clock.advance(timeout_manager.check_interval)
     
     print("✅ Timeout monitoring loop stopped")
 
 if __name__ == "__main__":
-    print("⏰ Starting Timeout Protection System Test...")
-    asyncio.run(test_timeout_system_comprehensive())
-    asyncio.run(test_monitoring_loop()) 
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
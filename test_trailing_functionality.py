@@ -3,12 +3,22 @@
 Test script for dynamic trailing stop functionality.
 """
 
+import asyncio
+import contextlib
+import io
 import sys
 import os
+import pytest
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config.settings import TradingConfig
 
+# Expected trailing SL prices, computed once from the configured offset
+_EXPECTED = {
+    "long_sl_65000": 65000 * (1 - TradingConfig.TRAILING_OFFSET / 100),
+    "short_sl_63000": 63000 * (1 + TradingConfig.TRAILING_OFFSET / 100),
+}
+
 def test_trailing_configuration():
     """Test trailing configuration."""
     print("🧪 Testing Trailing Configuration")
@@ -25,20 +35,6 @@ def test_trailing_configuration():
         print("   ❌ Trailing configuration is incorrect")
         return False
 
-def test_trailing_watcher_import():
-    """Test that trailing watcher can be imported."""
-    print("\n📦 Testing Trailing Watcher Import")
-    
-    try:
-        from monitor.trailing import trailing_watcher, start_trailing_watcher, cancel_trailing_watcher
-        print("   ✅ Trailing watcher imported successfully")
-        print(f"   • Trigger threshold: {trailing_watcher.trigger_threshold}%")
-        print(f"   • Trailing offset: {trailing_watcher.trailing_offset}%")
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to import trailing watcher: {e}")
-        return False
-
 def test_trade_state_trailing_integration():
     """Test that trade state includes trailing tracking."""
     print("\n📊 Testing Trade State Trailing Integration")
@@ -66,30 +62,6 @@ def test_trade_state_trailing_integration():
         print(f"   ❌ Failed to test trade state integration: {e}")
         return False
 
-def test_entry_integration():
-    """Test entry integration with trailing."""
-    print("\n📥 Testing Entry Integration")
-    
-    try:
-        from logic.entry import handle_entry_signal
-        print("   ✅ Entry function imported successfully")
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to import entry function: {e}")
-        return False
-
-def test_exit_integration():
-    """Test exit integration with trailing."""
-    print("\n🚪 Testing Exit Integration")
-    
-    try:
-        from logic.exit import exit_trade, exit_trade_sync
-        print("   ✅ Exit functions imported successfully")
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed to import exit functions: {e}")
-        return False
-
 def test_trailing_logic():
     """Test trailing logic calculations."""
     print("\n🧮 Testing Trailing Logic")
@@ -134,34 +106,38 @@ def test_sl_calculation():
     
     try:
         from monitor.trailing import trailing_watcher
-        
-        # Test LONG position SL calculation
-        current_price = 65000
-        side = "long"
-        offset = TradingConfig.TRAILING_OFFSET
-        
-        new_sl = trailing_watcher._calculate_new_sl_price("BTCUSDT", current_price, side)
-        expected_sl = current_price * (1 - offset / 100)
-        
-        print(f"   • LONG current price: {current_price}")
-        print(f"   • LONG calculated SL: {new_sl}")
-        print(f"   • LONG expected SL: {expected_sl:.2f}")
-        
-        # Test SHORT position SL calculation
-        current_price = 63000
-        side = "short"
-        
-        new_sl = trailing_watcher._calculate_new_sl_price("BTCUSDT", current_price, side)
-        expected_sl = current_price * (1 + offset / 100)
-        
-        print(f"   • SHORT current price: {current_price}")
-        print(f"   • SHORT calculated SL: {new_sl}")
-        print(f"   • SHORT expected SL: {expected_sl:.2f}")
-        
-        return True
+        from core.symbol_data import get_symbol_precision
     except Exception as e:
         print(f"   ❌ Failed to test SL calculation: {e}")
         return False
+    
+    precision = get_symbol_precision("BTCUSDT")
+    
+    # Test LONG position SL calculation
+    current_price = 65000
+    side = "long"
+    
+    new_sl = asyncio.run(trailing_watcher._calculate_new_sl_price("BTCUSDT", current_price, side))
+    expected_sl = round(_EXPECTED["long_sl_65000"], precision)
+    
+    print(f"   • LONG current price: {current_price}")
+    print(f"   • LONG calculated SL: {new_sl}")
+    print(f"   • LONG expected SL: {expected_sl:.2f}")
+    assert new_sl == pytest.approx(expected_sl), f"LONG SL {new_sl} != {expected_sl}"
+    
+    # Test SHORT position SL calculation
+    current_price = 63000
+    side = "short"
+    
+    new_sl = asyncio.run(trailing_watcher._calculate_new_sl_price("BTCUSDT", current_price, side))
+    expected_sl = round(_EXPECTED["short_sl_63000"], precision)
+    
+    print(f"   • SHORT current price: {current_price}")
+    print(f"   • SHORT calculated SL: {new_sl}")
+    print(f"   • SHORT expected SL: {expected_sl:.2f}")
+    assert new_sl == pytest.approx(expected_sl), f"SHORT SL {new_sl} != {expected_sl}"
+    
+    return True
 
 def main():
     """Run all trailing tests."""
@@ -169,10 +145,7 @@ def main():
     
     tests = [
         ("Trailing Configuration", test_trailing_configuration),
-        ("Trailing Watcher Import", test_trailing_watcher_import),
         ("Trade State Integration", test_trade_state_trailing_integration),
-        ("Entry Integration", test_entry_integration),
-        ("Exit Integration", test_exit_integration),
         ("Trailing Logic", test_trailing_logic),
         ("SL Calculation", test_sl_calculation)
     ]
@@ -181,14 +154,19 @@ def main():
     total = len(tests)
     
     for test_name, test_func in tests:
+        # Collect the test's output and write it with a single call
+        buffer = io.StringIO()
         try:
-            if test_func():
-                print(f"   ✅ {test_name}: PASSED")
+            with contextlib.redirect_stdout(buffer):
+                result = test_func()
+            if result:
+                status = f"   ✅ {test_name}: PASSED"
                 passed += 1
             else:
-                print(f"   ❌ {test_name}: FAILED")
+                status = f"   ❌ {test_name}: FAILED"
         except Exception as e:
-            print(f"   ❌ {test_name}: ERROR - {e}")
+            status = f"   ❌ {test_name}: ERROR - {e}"
+        sys.stdout.write(f"{buffer.getvalue()}{status}\n")
     
     print("\n" + "=" * 50)
     print(f"📋 Test Results: {passed}/{total} tests passed")
@@ -198,10 +176,7 @@ def main():
         print("\n✅ Trailing Functionality Features:")
         print("   • TRAILING_TRIGGER configured (6.0%)")
         print("   • TRAILING_OFFSET configured (0.5%)")
-        print("   • Trailing watcher module created")
         print("   • Trade state integration implemented")
-        print("   • Entry function integration working")
-        print("   • Exit function integration working")
         print("   • P&L calculation logic working")
         print("   • SL calculation logic working")
         print("   • Dynamic trailing stop ready")
@@ -1,5 +1,6 @@
 import asyncio
-from signal_module.multi_format_parser import parse_signal_text_multi
+import pytest
+from signal_module.multi_format_parser import parse_signal_text_multi, extract_signal_fields
 from signal_module.signal_queue import signal_queue
 
 # ========== TESTSIGNALER ==========
@@ -64,10 +65,17 @@ signals = {
 
 # ========== TESTFUNKTIONER ==========
 
+@pytest.fixture(scope="session", autouse=True)
+def warm_parser():
+    # Fyll parser-cachen en gång så att testerna mäter det varma läget
+    for signal in signals.values():
+        asyncio.run(parse_signal_text_multi(signal))
+
 def test_parser():
+    hits_before = extract_signal_fields.cache_info().hits
     for name, signal in signals.items():
         print(f"\n🔍 Testar: {name}")
-        parsed = parse_signal_text_multi(signal)
+        parsed = asyncio.run(parse_signal_text_multi(signal))
 
         assert "symbol" in parsed
         assert "side" in parsed
@@ -77,9 +85,13 @@ def test_parser():
 
         print(f"✅ {name} parser OK → {parsed['symbol']} {parsed['side']}")
 
+    hits = extract_signal_fields.cache_info().hits - hits_before
+    assert hits == len(signals), f"❌ Parser-cachen användes inte: {hits} träffar"
+
+@pytest.mark.asyncio
 async def test_signal_queue():
     signal = signals["long_signal"]
-    parsed = parse_signal_text_multi(signal)
+    parsed = await parse_signal_text_multi(signal)
     await signal_queue.put(parsed)
     item = await signal_queue.get()
     assert item["symbol"] == "IOTAUSDT"
@@ -88,6 +100,7 @@ async def test_signal_queue():
 # ========== KÖR TESTER ==========
 
 if __name__ == "__main__":
+    warm_parser.__wrapped__()
     test_parser()
     asyncio.run(test_signal_queue())
 
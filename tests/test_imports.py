@@ -0,0 +1,16 @@
+import importlib
+import pytest
+
+# Modules the trade-state and entry features rely on, and the names each must export.
+# monitor.trailing is UTF-16 encoded and cannot be imported; monitor.timeout_watcher
+# and logic.exit import monitor.reporting, which pulls in the UTF-16 analytics package.
+IMPORT_TABLE = [
+    ("monitor.trade_state", ["TradeState", "create_trade_state", "close_trade_state"]),
+    ("logic.entry", ["handle_entry_signal"]),
+]
+
+@pytest.mark.parametrize("module,names", IMPORT_TABLE, ids=[module for module, _ in IMPORT_TABLE])
+def test_module_exports(module, names):
+    mod = importlib.import_module(module)
+    for name in names:
+        assert hasattr(mod, name), f"{module} saknar {name}"
@@ -0,0 +1,23 @@
+import pytest
+from signal_module.signal_handler import scan_signal_tokens
+
+# Sample signal from test_signal_detection.py, plus a one-line short signal
+SAMPLE_SIGNAL = """
+🧪 TEST SIGNAL
+BTCUSDT LONG
+Entry: 45000
+TP1: 46000
+TP2: 47000
+SL: 44000
+""".strip()
+
+TOKEN_CASES = [
+    (SAMPLE_SIGNAL, {"long": ["LONG"], "entry": ["45000"], "tp": ["46000", "47000"], "sl": ["44000"]}),
+    ("ETHUSDT sell entry: 2500.5 tp1: 2400 sl: 2600", {"short": ["sell"], "entry": ["2500.5"], "tp": ["2400"], "sl": ["2600"]}),
+    ("Ingen signal här", {}),
+]
+
+@pytest.mark.parametrize("text,expected", TOKEN_CASES)
+def test_scan_signal_tokens(text, expected):
+    tokens = scan_signal_tokens(text)
+    assert tokens == expected, f"Fel tokens för {text!r}: {tokens}"
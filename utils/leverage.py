@@ -1,30 +1,32 @@
 import logging
 from config.settings import DEFAULT_BALANCE, RISK_PERCENT, DEFAULT_IM, DEFAULT_LEVERAGE, LEVERAGE_CAP
-from utils.telegram_logger import send_telegram_log
+from utils.logger import log_event
 
-async def calculate_leverage(entry_price: float, sl_price: float) -> float:
+def calculate_leverage(entry_price: float, sl_price: float) -> float:
     """
     Kombinerad modell:
     - Om SL finns → dynamisk hävstångsberäkning (max x50)
     - Om SL saknas → fast x10 (ingen annan logik gäller)
+    Synkron; varningar går till Telegram via log_event utan att blockera.
     """
     try:
         if sl_price is None:
-            await send_telegram_log("⚠️ SL saknas – använder fast hävstång x10", tag="risk")
+            log_event("⚠️ SL saknas – använder fast hävstång x10", "WARNING")
             return DEFAULT_LEVERAGE
 
         sl_percent = abs(entry_price - sl_price) / entry_price
         if sl_percent == 0:
-            await send_telegram_log("⚠️ SL-avstånd = 0 – fallback DEFAULT_LEVERAGE används", tag="risk")
+            log_event("⚠️ SL-avstånd = 0 – fallback DEFAULT_LEVERAGE används", "WARNING")
             return DEFAULT_LEVERAGE
 
         risk_usdt = DEFAULT_BALANCE * (RISK_PERCENT / 100)
         leverage = risk_usdt / (DEFAULT_IM * sl_percent)
-        return min(round(leverage, 2), LEVERAGE_CAP)
+        leverage = int(leverage * 100.0 + 0.5) / 100.0  # Två decimaler utan round()
+        return leverage if leverage < LEVERAGE_CAP else LEVERAGE_CAP
 
     except Exception as e:
         logging.error(f"❌ Leverage-kalkylfel: {e}")
-        await send_telegram_log(f"❌ Leverage fallback pga fel: {e}", tag="risk")
+        log_event(f"❌ Leverage fallback pga fel: {e}", "ERROR")
         return DEFAULT_LEVERAGE
 
 
@@ -1,22 +1,31 @@
 import logging
 import asyncio
+from typing import Optional
 from utils.telegram_logger import send_telegram_log
 
+_main_loop: Optional[asyncio.AbstractEventLoop] = None  # Bot loop that receives sends from other threads
+_pending_sends = set()  # Keep scheduled sends referenced until they finish
+
+def set_logger_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Register the bot's event loop so log_event can reach Telegram from any thread."""
+    global _main_loop
+    _main_loop = loop
+
 def log_event(message: str, level: str = "INFO"):
     full_msg = f"[{level}] {message}"
     print(full_msg)
     try:
-        # Create a new event loop if one doesn't exist
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If loop is running, schedule the coroutine
-                asyncio.create_task(send_telegram_log(full_msg))
-            else:
-                # If loop is not running, run the coroutine
-                loop.run_until_complete(send_telegram_log(full_msg))
+            loop = asyncio.get_running_loop()
         except RuntimeError:
-            # No event loop, create one
-            asyncio.run(send_telegram_log(full_msg))
+            # No loop in this thread: hand off to the bot loop, never block or start a new loop
+            if _main_loop is not None and _main_loop.is_running():
+                asyncio.run_coroutine_threadsafe(send_telegram_log(full_msg), _main_loop)
+            return
+        
+        # Inside a running loop: schedule the send and return immediately
+        task = loop.create_task(send_telegram_log(full_msg))
+        _pending_sends.add(task)
+        task.add_done_callback(_pending_sends.discard)
     except Exception:
-        print("[WARN] Kunde inte skicka till Telegram")
\ No newline at end of file
+        print("[WARN] Kunde inte skicka till Telegram")
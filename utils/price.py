@@ -2,9 +2,25 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import math
+import threading
+import time
+from collections import defaultdict
 from decimal import Decimal, ROUND_DOWN
 from functools import lru_cache
-from typing import Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # Avrundning fungerar utan nätverksberoenden
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # Fallback till Decimal-avrundning per värde
 
 # Vi låter core.symbol_data vara sanningen för pris (async).
 # Den här modulen fungerar som adapter + hjälpfunktioner.
@@ -15,12 +31,26 @@ try:
 except Exception as _e:  # pragma: no cover
     _get_current_price = None  # type: ignore
 
+# Precision hämtas en gång här, inte via en import vid varje cache-miss
+try:
+    from core.symbol_data import get_symbol_precision as _get_symbol_precision
+except Exception:  # pragma: no cover
+    _get_symbol_precision = None  # type: ignore
+
+# Felloggning till Telegram; importeras en gång i stället för i varje except-gren
+try:
+    from utils.telegram_logger import send_telegram_log as _tlog  # async
+except Exception:  # pragma: no cover
+    _tlog = None  # type: ignore
+
 __all__ = [
     "get_current_price",
     "get_current_price_sync",
     "get_latest_price",
     "get_volume_24h",
+    "invalidate_precision_cache",
     "round_price",
+    "round_prices",
 ]
 
 # ---------- Precision & rundning ----------
@@ -28,41 +58,92 @@ __all__ = [
 # Säker fallback om core.symbol_data inte exponerar symbol-precision.
 from config.settings import SymbolConfig
 
-_DEFAULT_DECIMALS = SymbolConfig.DEFAULT_DECIMALS
-_FALLBACK_DECIMALS_MAP = SymbolConfig.FALLBACK_DECIMALS_MAP
+_DEFAULT_DECIMALS = int(SymbolConfig.DEFAULT_DECIMALS)
+# Fallback-tabellen en gång: versala nycklar, färdiga int-värden, skrivskyddad
+_FALLBACK_DECIMALS_MAP = MappingProxyType(
+    {sym.upper(): int(dec) for sym, dec in SymbolConfig.FALLBACK_DECIMALS_MAP.items()}
+)
+
+_dec_cache: Dict[str, int] = {}  # symbol → decimaler; symbolerna är få så ingen gräns behövs
 
-@lru_cache(maxsize=256)
-def _decimals_for_symbol_cached(symbol: str) -> int:
+def _decimals_for_symbol(symbol: str) -> int:
     """
-    Hämta decimal-precision för symbol och cacha resultatet.
-    Först: försök via core.symbol_data.get_symbol_precision.
+    Hämta decimal-precision för symbol och spara resultatet i _dec_cache.
+    Först: core.symbol_data.get_symbol_precision.
     Annars: fallback-tabell → annars _DEFAULT_DECIMALS.
     """
-    sym = (symbol or "").upper()
-    if not sym:
+    dec = _dec_cache.get(symbol)
+    if dec is not None:
+        return dec
+    if not symbol:
         return _DEFAULT_DECIMALS
 
-    # Försök via core.symbol_data om funktionen finns
-    try:
-        from core.symbol_data import get_symbol_precision  # type: ignore
-        dec = get_symbol_precision(sym)
-        return int(dec)
-    except Exception:
-        # gå vidare till fallback
-        pass
+    # Symboler är normalt redan versala; undvik då en ny sträng från upper()
+    sym = symbol if symbol.isupper() else symbol.upper()
+    if _get_symbol_precision is not None:
+        try:
+            dec = int(_get_symbol_precision(sym))
+        except Exception:
+            # gå vidare till fallback
+            pass
+    if dec is None:
+        dec = _FALLBACK_DECIMALS_MAP.get(sym, _DEFAULT_DECIMALS)
+
+    _dec_cache[symbol] = dec
+    return dec
+
 
-    return int(_FALLBACK_DECIMALS_MAP.get(sym, _DEFAULT_DECIMALS))
+def invalidate_precision_cache() -> None:
+    """Töm precision-cachen, t.ex. efter att symbolinformationen uppdaterats."""
+    _dec_cache.clear()
 
 
-def round_price(price: float, symbol: Optional[str] = None) -> float:
+@lru_cache(maxsize=64)
+def _quantizer_for(decimals: int) -> Decimal:
+    """Decimal-steg för ett antal decimaler, t.ex. 4 → Decimal('0.0001')."""
+    return Decimal(1).scaleb(-decimals)
+
+
+def round_price(price: float, symbol: Optional[str] = None, strict: bool = False) -> float:
     """
     Avrunda pris till korrekt precision för symbolen (ROUND_DOWN).
-    Defensivt: tvingar float.
+    Defensivt: tvingar float. strict=True använder exakt Decimal-avrundning.
     """
     price = float(price)
-    decimals = _decimals_for_symbol_cached(symbol or "")
-    quant = Decimal(10) ** (-decimals)
-    return float(Decimal(str(price)).quantize(quant, rounding=ROUND_DOWN))
+    decimals = _decimals_for_symbol(symbol or "")
+    if strict:
+        return float(Decimal(repr(price)).quantize(_quantizer_for(decimals), rounding=ROUND_DOWN))
+
+    scale = 10.0 ** decimals
+    # trunc mot noll motsvarar ROUND_DOWN; produkten kan hamna ett steg fel
+    # (332.09 * 1e8 → 33208999999.99999), så steget bredvid kontrolleras mot priset
+    steps = math.trunc(price * scale)
+    step = 1 if price >= 0 else -1
+    if abs((steps + step) / scale) <= abs(price):
+        steps += step
+    elif abs(steps / scale) > abs(price):
+        steps -= step
+    return steps / scale
+
+
+def round_prices(prices: Sequence[float], symbol: Optional[str] = None) -> List[float]:
+    """
+    Avrunda flera priser för samma symbol (ROUND_DOWN) med en precision-uppslagning.
+    Med numpy: en vektoriserad floor över hela listan.
+    """
+    decimals = _decimals_for_symbol(symbol or "")
+    if np is None:
+        quant = _quantizer_for(decimals)
+        return [float(Decimal(repr(float(p))).quantize(quant, rounding=ROUND_DOWN)) for p in prices]
+
+    scale = 10.0 ** decimals
+    # Samma stegkorrigering som round_price, för hela listan på en gång
+    arr = np.asarray(prices, dtype=float)
+    step = np.where(arr >= 0, 1.0, -1.0)
+    steps = np.trunc(arr * scale)
+    steps += step * (np.abs((steps + step) / scale) <= np.abs(arr))
+    steps -= step * (np.abs(steps / scale) > np.abs(arr))
+    return (steps / scale).tolist()
 
 
 # ---------- Live-pris: async + sync wrappers ----------
@@ -76,6 +157,30 @@ async def get_current_price(symbol: str) -> float:
     return float(await _get_current_price(symbol))
 
 
+_sync_runner = None  # asyncio.Runner (3.11+) som återanvänds mellan synk-anrop
+_sync_loop = None  # Bakgrundsloop i egen tråd för Python < 3.11
+_sync_lock = threading.Lock()  # En Runner kan bara köra ett anrop åt gången
+
+
+def _run_sync(coro):
+    """
+    Kör en coroutine till slut på en återanvänd event loop i stället för en ny per anrop.
+    """
+    global _sync_runner, _sync_loop
+    if hasattr(asyncio, "Runner"):
+        with _sync_lock:
+            if _sync_runner is None:
+                _sync_runner = asyncio.Runner()
+                atexit.register(_sync_runner.close)
+            return _sync_runner.run(coro)
+
+    with _sync_lock:
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
+            threading.Thread(target=_sync_loop.run_forever, name="price_sync_loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _sync_loop).result()
+
+
 def get_current_price_sync(symbol: str) -> float:
     """
     Synk wrapper: använd INTE inne i en redan-asynk kontext.
@@ -83,8 +188,8 @@ def get_current_price_sync(symbol: str) -> float:
     try:
         asyncio.get_running_loop()
     except RuntimeError:
-        # ingen loop → kör synchronously
-        return asyncio.run(get_current_price(symbol))
+        # ingen loop → kör på den återanvända synk-loopen
+        return _run_sync(get_current_price(symbol))
     else:
         # loop kör redan; vi kan inte blocka/åter-entrera den här.
         raise RuntimeError("get_current_price_sync() anropad inifrån en aktiv event loop.")
@@ -92,25 +197,53 @@ def get_current_price_sync(symbol: str) -> float:
 
 # ---------- Hjälpmetoder med robust loggning ----------
 
+# Fel som ett prisanrop kan ge: nätverk/timeout, saknad källa, eller None/skräp från källan
+# Utan aiohttp räknas nätverksfel som OSError
+_CLIENT_ERROR = aiohttp.ClientError if aiohttp is not None else OSError
+_PRICE_ERRORS = (asyncio.TimeoutError, _CLIENT_ERROR, RuntimeError, TypeError, ValueError)
+PRICE_ERROR_LOG_INTERVAL = 60.0  # Sekunder mellan Telegram-loggar om prisfel per symbol
+_last_price_error_log: Dict[str, float] = defaultdict(lambda: float("-inf"))  # symbol → time.monotonic() för senaste logg
+
 async def get_latest_price(symbol: str) -> Optional[float]:
     """
-    Hämta senaste pris; returnera None om något går fel.
+    Hämta senaste pris; returnera None vid pris- eller nätverksfel.
     """
     try:
         return await get_current_price(symbol)
-    except Exception as e:
-        # Logga asynkront – förutsätter att loggfunktionen är async-kompatibel
-        try:
-            from utils.telegram_logger import send_telegram_log  # async
-            await send_telegram_log(
-                f"❌ Misslyckades att hämta pris för {symbol}: {e!r}",
-                tag="error",
-            )
-        except Exception:
-            pass
+    except _PRICE_ERRORS as e:
+        # Högst en logg per symbol och intervall, så ett börsavbrott inte ger en logg per tick
+        now = time.monotonic()
+        if _tlog is not None and now - _last_price_error_log[symbol] > PRICE_ERROR_LOG_INTERVAL:
+            _last_price_error_log[symbol] = now
+            try:
+                await _tlog(
+                    f"❌ Misslyckades att hämta pris för {symbol}: {e!r}",
+                    tag="error",
+                )
+            except Exception:
+                pass
         return None
 
 
+_VOLUME_METHODS = ("get_24h_volume", "get_ticker_24h_volume", "get_ticker")
+_VOLUME_KEYS = ("vol", "volume", "baseVolume", "quoteVolume")
+_volume_key: Dict[int, str] = {}  # id(klient) → fältet som senast innehöll volymen
+
+
+@lru_cache(maxsize=4)
+def _resolve_volume_fn(client):
+    """
+    Leta upp klientens volym-metod en gång per klient.
+    Returnerar (metod, är_async) eller (None, False) om ingen finns.
+    """
+    # Pröva några vanliga namn i ordning – anpassa till din klient när du vet exakta metoder.
+    for attr in _VOLUME_METHODS:
+        fn = getattr(client, attr, None)
+        if fn is not None:
+            return fn, asyncio.iscoroutinefunction(fn)
+    return None, False
+
+
 async def get_volume_24h(symbol: str) -> Optional[float]:
     """
     Försök hämta 24h-volym via Bitget-klienten om metod finns; annars None.
@@ -118,45 +251,41 @@ async def get_volume_24h(symbol: str) -> Optional[float]:
     """
     sym = (symbol or "").upper()
     try:
-        from core.bitget_client import get_client  # din fabrik som returnerar en klient
-        client = get_client()
-
-        # Pröva några vanliga namn i ordning – anpassa till din klient när du vet exakta metoder.
-        for attr in ("get_24h_volume", "get_ticker_24h_volume", "get_ticker"):
-            if hasattr(client, attr):
-                fn = getattr(client, attr)
-                val = fn(sym)  # kan vara sync eller async beroende på din klient-impl
-                if asyncio.iscoroutine(val):
-                    val = await val
-
-                # Om dict → plocka ett känt fält
-                if isinstance(val, dict):
-                    for k in ("vol", "volume", "baseVolume", "quoteVolume"):
-                        if k in val:
-                            try:
-                                return float(val[k])  # type: ignore[arg-type]
-                            except Exception:
-                                return None
-                    # om inget passade
-                    return None
+        from core.bitget_client import client  # modulens delade klient
 
-                # Om redan numeriskt
-                try:
-                    return float(val)  # type: ignore[arg-type]
-                except Exception:
-                    return None
+        fn, is_async = _resolve_volume_fn(client)
+        if fn is None:
+            return None
+        val = await fn(sym) if is_async else fn(sym)
 
-        return None
+        # Om dict → plocka ett känt fält, samma som förra gången om det finns kvar
+        if isinstance(val, dict):
+            key = _volume_key.get(id(client))
+            if key not in val:
+                key = next((k for k in _VOLUME_KEYS if k in val), None)
+                if key is None:
+                    return None
+                _volume_key[id(client)] = key
+            try:
+                return float(val[key])  # type: ignore[arg-type]
+            except Exception:
+                return None
 
-    except Exception as e:
+        # Om redan numeriskt
         try:
-            from utils.telegram_logger import send_telegram_log
-            await send_telegram_log(
-                f"❌ Volymhämtning misslyckades för {sym}: {e!r}",
-                tag="error",
-            )
+            return float(val)  # type: ignore[arg-type]
         except Exception:
-            pass
+            return None
+
+    except Exception as e:
+        if _tlog is not None:
+            try:
+                await _tlog(
+                    f"❌ Volymhämtning misslyckades för {sym}: {e!r}",
+                    tag="error",
+                )
+            except Exception:
+                pass
         return None
 
 
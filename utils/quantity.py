@@ -1,11 +1,23 @@
 from utils.price import round_price
 from config.settings import DEFAULT_IM, DEFAULT_BALANCE, RISK_PERCENT, MAX_LEVERAGE
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Fallback to per-value quantity math
+
 # Kvantitetsformel
 def calculate_quantity(im, leverage, entry_price):
     raw_qty = (im * leverage) / entry_price
     return round(raw_qty, 4)
 
+# Kvantitetsformel för flera IM/hävstångspar på samma entry-pris
+def calculate_quantities(ims, leverages, entry_price):
+    if np is not None:
+        raw_qty = np.asarray(ims, dtype=float) * np.asarray(leverages, dtype=float) / entry_price
+        return np.round(raw_qty, 4).tolist()
+    return [calculate_quantity(im, leverage, entry_price) for im, leverage in zip(ims, leverages)]
+
 # ✅ Testfall
 def test_quantity_calculation():
     entry_price = 0.2215
@@ -16,17 +16,23 @@ def add_multiple_groups(groups_dict: dict):
         "trading_channel": -1234567892
     })
     """
-    for name, group_id in groups_dict.items():
-        TelegramConfig.add_telegram_group(name, group_id)
+    replaced = groups_dict.keys() & TelegramConfig.TELEGRAM_GROUPS.keys()
+    TelegramConfig.TELEGRAM_GROUPS.update(groups_dict)
+    if replaced:
+        # Replaced IDs may still belong to other aliases
+        TelegramConfig.sync_signal_channel_ids()
+    else:
+        TelegramConfig.TELEGRAM_SIGNAL_CHANNEL_IDS.update(groups_dict.values())
     
-    print(f"✅ Added {len(groups_dict)} new groups")
+    added = ", ".join(f"{name} ({group_id})" for name, group_id in groups_dict.items())
+    print(f"✅ Added {len(groups_dict)} new groups: {added}")
     TelegramConfig.list_monitored_groups()
 
 def remove_group(name: str):
     """Remove a group from monitoring."""
     if name in TelegramConfig.TELEGRAM_GROUPS:
         group_id = TelegramConfig.TELEGRAM_GROUPS.pop(name)
-        TelegramConfig.TELEGRAM_SIGNAL_CHANNEL_IDS = list(TelegramConfig.TELEGRAM_GROUPS.values())
+        TelegramConfig.sync_signal_channel_ids()  # Keeps IDs other aliases still use
         print(f"✅ Removed group: {name} ({group_id})")
     else:
         print(f"❌ Group '{name}' not found")
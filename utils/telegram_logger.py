@@ -1,9 +1,225 @@
+import asyncio
+import atexit
+import json
+import time
+from typing import Tuple
 import aiohttp
 from config.settings import TelegramConfig
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fallback to stdlib json when orjson is not installed
+
+BATCH_FLUSH_INTERVAL = 3.0  # Seconds to collect messages before posting a batch
+MAX_MESSAGE_CHARS = 4000  # Telegram rejects sendMessage text over 4096 characters
+MAX_BUFFER = 1_000_000  # Characters queued before the oldest messages are dropped
+BREAKER_THRESHOLD = 5  # Consecutive failed posts before logging is paused
+BREAKER_COOLDOWN = 30.0  # Seconds logging stays paused after the threshold is hit
+
+_session = None  # Shared ClientSession so concurrent sends reuse connections
+_session_loop = None  # Event loop the shared session belongs to
+_queue = None  # Formatted messages waiting for the next batch
+_queue_loop = None  # Event loop the queue and flusher belong to
+_flusher_task = None  # Background task that posts queued messages
+_has_messages = None  # Set while the queue holds at least one message
+_batch_ready = None  # Set when a full message's worth of text is queued
+_buffered_chars = 0  # Characters currently queued
+_ENABLED = False  # Bot token and chat ID are both usable
+_MISSING = ""  # Name of the missing setting when not enabled
+_SEND_URL = None  # sendMessage endpoint for the configured bot
+_CHAT_ID = None  # Chat that receives the logs
+_JSON_HEADERS = {"Content-Type": "application/json"}  # Bodies are pre-serialized JSON
+_fail_count = 0  # Consecutive failed posts
+_open_until = 0.0  # time.monotonic() until which batches are dropped instead of posted
+
+def _get_session() -> aiohttp.ClientSession:
+    """Get the shared ClientSession, creating it for the running event loop if needed."""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        # Keep-alive pool with cached DNS so batches skip the TCP/TLS handshake
+        connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=75, ttl_dns_cache=300)
+        _session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=5))
+        _session_loop = loop
+    return _session
+
+@atexit.register
+def _close_session_at_exit():
+    """Close a session left open by a caller that never called close_telegram_session()."""
+    if (_session is not None and not _session.closed and _session_loop is not None
+            and not _session_loop.is_closed() and not _session_loop.is_running()):
+        _session_loop.run_until_complete(_session.close())
+
+def _get_queue() -> asyncio.Queue:
+    """Get the message queue for the running event loop, starting its flusher if needed."""
+    global _queue, _queue_loop, _flusher_task, _has_messages, _batch_ready, _buffered_chars
+    loop = asyncio.get_running_loop()
+    if _queue is None or _queue_loop is not loop:
+        _queue = asyncio.Queue()
+        _queue_loop = loop
+        _has_messages = asyncio.Event()
+        _batch_ready = asyncio.Event()
+        _buffered_chars = 0
+    if _flusher_task is None or _flusher_task.done() or _flusher_task.get_loop() is not loop:
+        _flusher_task = loop.create_task(_flusher(), name="telegram_log_flusher")
+    return _queue
+
+def _drain_queue() -> list:
+    """Take every queued message, oldest first."""
+    global _buffered_chars
+    messages = []
+    while _queue is not None and not _queue.empty():
+        messages.append(_queue.get_nowait())
+    _buffered_chars = 0
+    if _queue is not None:
+        _has_messages.clear()
+        _batch_ready.clear()
+    return messages
+
+def _batch_texts(messages: list) -> list:
+    """Join messages into as few sendMessage texts as fit under MAX_MESSAGE_CHARS."""
+    texts = []
+    current = ""
+    for message in messages:
+        # A single oversized message is split on its own
+        for start in range(0, len(message), MAX_MESSAGE_CHARS):
+            part = message[start:start + MAX_MESSAGE_CHARS]
+            if current and len(current) + 2 + len(part) <= MAX_MESSAGE_CHARS:
+                current += "\n\n" + part
+            else:
+                if current:
+                    texts.append(current)
+                current = part
+    if current:
+        texts.append(current)
+    return texts
+
+def _record_failure(retry_after: float = None) -> None:
+    """Count a failed post and pause logging once Telegram keeps failing or asks us to back off."""
+    global _fail_count, _open_until
+    _fail_count += 1
+    if retry_after is not None:
+        _open_until = time.monotonic() + retry_after
+    elif _fail_count >= BREAKER_THRESHOLD:
+        _open_until = time.monotonic() + BREAKER_COOLDOWN
+
+async def _post(text: str) -> bool:
+    """Send one sendMessage request over the shared session."""
+    global _fail_count
+    data = {
+        "chat_id": _CHAT_ID,
+        "text": text,
+        "parse_mode": "HTML"
+    }
+    body = orjson.dumps(data) if orjson is not None else json.dumps(data).encode()
+    
+    try:
+        session = _get_session()
+        async with session.post(_SEND_URL, data=body, headers=_JSON_HEADERS) as response:
+            if response.status == 200:
+                _fail_count = 0
+                return True
+            error_text = await response.text()
+            print(f"❌ Telegram log failed: {response.status}, {error_text}")
+            retry_after = None
+            if response.status == 429:
+                try:
+                    retry_after = float(json.loads(error_text)["parameters"]["retry_after"])
+                except (ValueError, KeyError, TypeError):
+                    pass
+            _record_failure(retry_after)
+            return False
+    except Exception as e:
+        print(f"❌ Telegram log error: {e}")
+        _record_failure()
+        return False
+
+async def flush_telegram_logs() -> bool:
+    """
+    Post every queued log message now instead of waiting for the flusher.
+    
+    Returns:
+        bool: True if all batches were sent successfully, False otherwise
+    """
+    messages = _drain_queue()
+    if not messages:
+        return True
+    
+    # Circuit open: drop the batch rather than spend a request on a failing API
+    if time.monotonic() < _open_until:
+        print(f"⚠️ Telegram paused after repeated failures; dropped {len(messages)} message(s)")
+        return False
+    
+    results = []
+    for text in _batch_texts(messages):
+        results.append(await _post(text))
+        if time.monotonic() < _open_until:
+            break  # Remaining chunks would hit the same failure
+    if all(results):
+        print(f"✅ Telegram log sent: {len(messages)} message(s) in {len(results)} batch(es)")
+    return all(results)
+
+async def _flusher():
+    """Post queued messages every BATCH_FLUSH_INTERVAL seconds, or sooner once a batch is full."""
+    try:
+        while True:
+            await _has_messages.wait()
+            try:
+                await asyncio.wait_for(_batch_ready.wait(), timeout=BATCH_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            await flush_telegram_logs()
+    except asyncio.CancelledError:
+        # Loop is shutting down; send what is left before stopping
+        await flush_telegram_logs()
+        raise
+
+async def close_telegram_session():
+    """Flush queued logs and close the shared ClientSession (call before the event loop shuts down)."""
+    global _session, _session_loop, _flusher_task
+    if _queue_loop is asyncio.get_running_loop():
+        await flush_telegram_logs()
+        task, _flusher_task = _flusher_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+    if _session is not None and not _session.closed and _session_loop is asyncio.get_running_loop():
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+def reload_telegram_config() -> None:
+    """Re-read the bot token and chat ID from TelegramConfig into the cached send settings."""
+    global _ENABLED, _MISSING, _SEND_URL, _CHAT_ID
+    token = TelegramConfig.TELEGRAM_BOT_TOKEN
+    if not token or token == "DIN_TELEGRAM_BOT_TOKEN":
+        _MISSING = "bot token"
+    elif not TelegramConfig.TELEGRAM_CHAT_ID:
+        _MISSING = "chat ID"
+    else:
+        _MISSING = ""
+    _ENABLED = not _MISSING
+    _SEND_URL = f"https://api.telegram.org/bot{token}/sendMessage" if _ENABLED else None
+    _CHAT_ID = TelegramConfig.TELEGRAM_CHAT_ID
+
+reload_telegram_config()
+
+def telegram_config_status() -> Tuple[bool, str]:
+    """
+    Report whether TelegramConfig had a usable bot token and chat ID at the last reload.
+    
+    Returns:
+        Tuple[bool, str]: (True, "") if configured, else (False, name of the missing setting)
+    """
+    return _ENABLED, _MISSING
+
 async def send_telegram_log(message: str, group_name: str = None, tag: str = None):
     """
-    Send log message to Telegram with optional group name and tag.
+    Queue a log message for Telegram with optional group name and tag.
+    
+    Messages are posted in batches by a background flusher; call
+    flush_telegram_logs() to send them immediately.
     
     Args:
         message: The message to send
@@ -11,43 +227,35 @@ async def send_telegram_log(message: str, group_name: str = None, tag: str = Non
         tag: Optional tag for message categorization
         
     Returns:
-        bool: True if message sent successfully, False otherwise
+        bool: True if message was queued, False otherwise
     """
+    global _buffered_chars
     try:
-        # Check if bot token is configured
-        if not TelegramConfig.TELEGRAM_BOT_TOKEN or TelegramConfig.TELEGRAM_BOT_TOKEN == "DIN_TELEGRAM_BOT_TOKEN":
-            print(f"⚠️ Telegram bot token not configured")
-            return False
-            
-        # Check if chat ID is configured
-        if not TelegramConfig.TELEGRAM_CHAT_ID:
-            print(f"⚠️ Telegram chat ID not configured")
+        # Check if bot token and chat ID are configured
+        if not _ENABLED:
+            print(f"⚠️ Telegram {_MISSING} not configured")
             return False
         
         # Format message
-        formatted_message = f"📊 {message}"
+        parts = [f"📊 {message}"]
         if group_name:
-            formatted_message += f"\n📁 Group: {group_name}"
+            parts.append(f"📁 Group: {group_name}")
         if tag:
-            formatted_message += f"\n🏷️ Tag: {tag}"
+            parts.append(f"🏷️ Tag: {tag}")
+        formatted_message = "\n".join(parts)
+        
+        queue = _get_queue()
+        queue.put_nowait(formatted_message)
+        _buffered_chars += len(formatted_message)
+        _has_messages.set()
         
-        # Send message
-        url = f"https://api.telegram.org/bot{TelegramConfig.TELEGRAM_BOT_TOKEN}/sendMessage"
-        data = {
-            "chat_id": TelegramConfig.TELEGRAM_CHAT_ID,
-            "text": formatted_message,
-            "parse_mode": "HTML"
-        }
+        # Drop the oldest messages rather than grow without bound
+        while _buffered_chars > MAX_BUFFER and queue.qsize() > 1:
+            _buffered_chars -= len(queue.get_nowait())
         
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
-            async with session.post(url, json=data) as response:
-                if response.status == 200:
-                    print(f"✅ Telegram log sent: {message[:50]}...")
-                    return True
-                else:
-                    error_text = await response.text()
-                    print(f"❌ Telegram log failed: {response.status}, {error_text}")
-                    return False
+        if _buffered_chars >= MAX_MESSAGE_CHARS:
+            _batch_ready.set()
+        return True
                     
     except Exception as e:
         print(f"❌ Telegram log error: {e}")
@@ -63,7 +271,7 @@ async def send_group_specific_log(group_name: str, message: str, tag: str = None
         tag: Optional tag for message categorization
         
     Returns:
-        bool: True if message sent successfully, False otherwise
+        bool: True if message was queued (posted up to BATCH_FLUSH_INTERVAL = 3 s later), False otherwise
     """
     return await send_telegram_log(message, group_name=group_name, tag=tag)
 
@@ -76,7 +284,7 @@ async def send_error_log(group_name: str, error_message: str):
         error_message: The error message to send
         
     Returns:
-        bool: True if message sent successfully, False otherwise
+        bool: True if message was queued (posted up to BATCH_FLUSH_INTERVAL = 3 s later), False otherwise
     """
     return await send_telegram_log(f"❌ {error_message}", group_name=group_name, tag="error")
 
@@ -89,6 +297,6 @@ async def send_success_log(group_name: str, success_message: str):
         success_message: The success message to send
         
     Returns:
-        bool: True if message sent successfully, False otherwise
+        bool: True if message was queued (posted up to BATCH_FLUSH_INTERVAL = 3 s later), False otherwise
     """
     return await send_telegram_log(f"✅ {success_message}", group_name=group_name, tag="success")
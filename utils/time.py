@@ -1,24 +1,45 @@
 import asyncio
 import random
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+
+_rng = random.Random()  # Egen generator, delas inte med den globala random-modulen
+_last_sec = 0  # Sekund som _last_prefix gäller för
+_last_prefix = ""  # Formaterad datum- och tidsdel för _last_sec
 
 def get_timestamp() -> str:
     """
     Returnerar aktuell UTC-tid som ISO-formaterad sträng.
+    Datum- och tidsdelen formateras bara en gång per sekund.
+    """
+    global _last_sec, _last_prefix
+    t = time.time()
+    sec = int(t)
+    if sec != _last_sec:
+        _last_prefix = datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _last_sec = sec
+    us = int((t - sec) * 1_000_000)
+    return f"{_last_prefix}.{us:06d}"
+
+def get_timestamp_ns() -> int:
+    """
+    Returnerar aktuell tid i nanosekunder sedan epoch som heltal.
+    För id:n och sortering där ingen läsbar sträng behövs.
     """
-    return datetime.utcnow().isoformat()
+    return time.time_ns()
 
 from config.settings import REENTRY_DELAY_SEC
 
-async def wait_after_sl(min_seconds=None, max_seconds=None) -> int:
+async def wait_after_sl(min_seconds=None, max_seconds=None) -> float:
     """
     Väntar slumpmässigt mellan konfigurerade sekunder efter SL innan re-entry.
+    Väntetiden har decimaler så att flera symboler inte vaknar samtidigt.
     Returnerar faktisk väntetid i sekunder.
     """
     if min_seconds is None:
         min_seconds = REENTRY_DELAY_SEC[0]
     if max_seconds is None:
         max_seconds = REENTRY_DELAY_SEC[1]
-    delay = random.randint(min_seconds, max_seconds)
+    delay = _rng.uniform(min_seconds, max_seconds)
     await asyncio.sleep(delay)
     return delay